@@ -0,0 +1,129 @@
+"""Benchmark event-loop lag caused by persisting review completions.
+
+Runs many concurrent fake reviews against a temporary database while a heartbeat
+coroutine measures how late the event loop wakes it up. Compares persisting on
+the event loop (the previous behavior) with offloading to a worker thread (what
+``review()``/``resume()`` do now).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import shared as _shared
+from specmaker_core.persistence import storage
+from specmaker_core.review import Completed, _persist_completion
+
+HEARTBEAT_INTERVAL = 0.001
+
+PersistFn = Callable[
+    [_shared.ProjectContext, _documents.Manuscript, Completed[_documents.ReviewReport]],
+    Awaitable[None],
+]
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments for the loop-lag benchmark."""
+    parser = argparse.ArgumentParser(description="Measure event-loop lag during persistence")
+    parser.add_argument("--reviews", type=int, default=200, help="Completions to persist.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent reviews.")
+    return parser.parse_args(argv)
+
+
+# Deliberately blocks the loop: this reproduces persisting without offloading.
+async def _persist_inline(  # noqa: RUF029
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    completion: Completed[_documents.ReviewReport],
+) -> None:
+    _persist_completion(context, manuscript, completion)
+
+
+async def _persist_offloaded(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    completion: Completed[_documents.ReviewReport],
+) -> None:
+    await asyncio.to_thread(_persist_completion, context, manuscript, completion)
+
+
+async def _measure(persist: PersistFn, *, reviews: int, concurrency: int) -> list[float]:
+    """Persist ``reviews`` completions and return heartbeat lag samples in seconds."""
+    context = _shared.ProjectContext(
+        project_name="bench",
+        repository_root=Path.cwd(),
+        description="Loop lag benchmark",
+        audience=["engineers"],
+        constraints=[],
+        created_by="bench",
+        created_at=datetime.now(tz=UTC),
+    )
+    manuscript = _documents.Manuscript(title="Bench", content_markdown="# Bench\n" + "x" * 4096)
+    report = _documents.ReviewReport(status="pass", summary="Looks good")
+    semaphore = asyncio.Semaphore(concurrency)
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lags.append(time.perf_counter() - started - HEARTBEAT_INTERVAL)
+
+    async def one_review(index: int) -> None:
+        async with semaphore:
+            await asyncio.sleep(0)
+            completion = Completed(
+                value=report,
+                run_id=f"run-{index}",
+                message_history=[],
+                timestamp=datetime.now(tz=UTC),
+                approvals_requested=0,
+                approvals_granted=0,
+            )
+            await persist(context, manuscript, completion)
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.gather(*(one_review(index) for index in range(reviews)))
+    done.set()
+    await ticker
+    return lags
+
+
+def _report(label: str, lags: list[float]) -> None:
+    ordered = sorted(lags)
+    p99 = ordered[int(len(ordered) * 0.99) - 1] if ordered else 0.0
+    print(
+        f"{label:<10} samples={len(lags):>5} mean={statistics.fmean(lags) * 1000:7.2f}ms "
+        f"p99={p99 * 1000:7.2f}ms max={max(lags, default=0.0) * 1000:7.2f}ms"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for the loop-lag benchmark."""
+    args = parse_args(argv)
+    original_cwd = Path.cwd()
+    for label, persist in (("inline", _persist_inline), ("offloaded", _persist_offloaded)):
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            try:
+                lags = asyncio.run(
+                    _measure(persist, reviews=args.reviews, concurrency=args.concurrency)
+                )
+            finally:
+                os.chdir(original_cwd)
+                storage.dispose_all()
+        _report(label, lags)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    main()
@@ -0,0 +1,94 @@
+"""Maintenance script that archives and prunes old review records."""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+from specmaker_core.persistence import retention, storage
+from specmaker_core.toolsets.persistence_tools import DEFAULT_BATCH_SIZE, prune_reviews
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments for the pruning script."""
+    parser = argparse.ArgumentParser(description="Archive and prune stored review records")
+    parser.add_argument(
+        "--db-path",
+        dest="db_path",
+        help="Path to the SpecMaker SQLite database.",
+        default=str(storage.DEFAULT_DB_PATH),
+    )
+    parser.add_argument(
+        "--archive-dir",
+        dest="archive_dir",
+        help="Directory receiving NDJSON segments of pruned records.",
+        default=".specmaker/archive",
+    )
+    parser.add_argument(
+        "--keep-last",
+        dest="keep_last",
+        type=int,
+        help="Keep this many of the newest records per project.",
+        default=None,
+    )
+    parser.add_argument(
+        "--older-than-days",
+        dest="older_than_days",
+        type=float,
+        help="Only prune records older than this many days.",
+        default=None,
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        help="Number of records archived and deleted per transaction.",
+        default=DEFAULT_BATCH_SIZE,
+    )
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        dest="enable_incremental_vacuum",
+        action="store_true",
+        help="Convert the database to auto_vacuum=INCREMENTAL first (runs a full VACUUM).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for the pruning script."""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    args = parse_args(argv)
+    older_than = (
+        datetime.timedelta(days=args.older_than_days) if args.older_than_days is not None else None
+    )
+    policy = retention.RetentionPolicy(keep_last=args.keep_last, older_than=older_than)
+
+    db_path = Path(args.db_path)
+    if args.enable_incremental_vacuum and retention.enable_incremental_vacuum(
+        storage.get_engine(db_path)
+    ):
+        LOGGER.info("Switched %s to incremental auto-vacuum", db_path)
+
+    session = storage.create_session(db_path)
+    try:
+        result = prune_reviews(
+            session, policy, archive_dir=Path(args.archive_dir), batch_size=args.batch_size
+        )
+    finally:
+        session.close()
+    LOGGER.info(
+        "Archived %d records to %d segments, deleted %d blobs, reclaimed %d pages",
+        result.records_archived,
+        len(result.segments),
+        result.blobs_deleted,
+        result.pages_reclaimed,
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    main()
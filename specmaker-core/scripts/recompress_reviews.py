@@ -0,0 +1,60 @@
+"""Migration script that re-encodes stored review payloads with a compression codec."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+from specmaker_core.persistence import storage
+from specmaker_core.toolsets.persistence_tools import DEFAULT_BATCH_SIZE, recompress_payloads
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments for the recompression script."""
+    parser = argparse.ArgumentParser(description="Recompress stored review payloads")
+    parser.add_argument(
+        "--db-path",
+        dest="db_path",
+        help="Path to the SpecMaker SQLite database.",
+        default=str(storage.DEFAULT_DB_PATH),
+    )
+    parser.add_argument(
+        "--codec",
+        dest="codec",
+        choices=["none", "zlib"],
+        help="Target codec. Use 'none' to decompress everything.",
+        default="zlib",
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        help="Number of rows rewritten per transaction.",
+        default=DEFAULT_BATCH_SIZE,
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for the recompression script."""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    args = parse_args(argv)
+
+    session = storage.create_session(Path(args.db_path))
+    try:
+        result = recompress_payloads(session, codec=args.codec, batch_size=args.batch_size)
+    finally:
+        session.close()
+    LOGGER.info(
+        "Migrated %d inline records and rewrote %d blobs",
+        result.records_migrated,
+        result.blobs_rewritten,
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    main()
@@ -0,0 +1,73 @@
+"""Export review history to NDJSON or import it into another database."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+from specmaker_core.persistence import storage
+from specmaker_core.toolsets.persistence_tools import (
+    DEFAULT_BATCH_SIZE,
+    export_reviews,
+    import_reviews,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments for the transfer script."""
+    parser = argparse.ArgumentParser(description="Export or import stored review records")
+    parser.add_argument("direction", choices=["export", "import"], help="Transfer direction.")
+    parser.add_argument(
+        "path",
+        help="NDJSON file to write or read. A .gz suffix enables gzip compression.",
+    )
+    parser.add_argument(
+        "--db-path",
+        dest="db_path",
+        help="Path to the SpecMaker SQLite database.",
+        default=str(storage.DEFAULT_DB_PATH),
+    )
+    parser.add_argument(
+        "--project-name",
+        dest="project_name",
+        help="Export only this project's records.",
+        default=None,
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        help="Number of records upserted per transaction when importing.",
+        default=DEFAULT_BATCH_SIZE,
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for the transfer script."""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    args = parse_args(argv)
+    path = Path(args.path)
+
+    db_path = Path(args.db_path)
+    # Exports only read, so they use the read pool and never take the write lock.
+    if args.direction == "export":
+        session = storage.create_read_session(db_path)
+    else:
+        session = storage.create_session(db_path)
+    try:
+        if args.direction == "export":
+            count = export_reviews(session, path, project_name=args.project_name)
+        else:
+            count = import_reviews(session, path, batch_size=args.batch_size)
+    finally:
+        session.close()
+    LOGGER.info("%sed %d records via %s", args.direction.capitalize(), count, path)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    main()
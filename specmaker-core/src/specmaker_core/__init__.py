@@ -1,16 +1,24 @@
 """Public package interface for SpecMaker Core."""
 
 from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import events as _events
 from specmaker_core._dependencies.schemas import shared as _shared
 from specmaker_core.init import init
 from specmaker_core.review import (
+    BatchResult,
     Completed,
     Deferred,
     RunOutcome,
     RunToken,
+    TimedOut,
     list_agents,
+    load_deferred,
     resume,
+    resume_by_id,
+    resume_many,
     review,
+    review_many,
+    review_stream,
 )
 
 # Re-export for public API convenience
@@ -19,3 +27,9 @@ Manuscript = _documents.Manuscript
 ReviewIssue = _documents.ReviewIssue
 ReviewReport = _documents.ReviewReport
 ProjectContext = _shared.ProjectContext
+ReviewEvent = _events.ReviewEvent
+ReviewStarted = _events.ReviewStarted
+ReviewProgress = _events.ReviewProgress
+IssueFound = _events.IssueFound
+ApprovalRequested = _events.ApprovalRequested
+EventsDropped = _events.EventsDropped
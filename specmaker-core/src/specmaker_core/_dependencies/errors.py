@@ -9,3 +9,16 @@ class SpecMakerError(Exception):
 
 class ValidationError(SpecMakerError):
     """Raised when incoming data fails validation rules."""
+
+
+class PersistenceError(SpecMakerError):
+    """Raised when persisted review data is missing or inconsistent."""
+
+
+class ReviewTimeoutError(SpecMakerError):
+    """Raised when a durable review run is cancelled for exceeding its deadline."""
+
+    def __init__(self, run_id: str, timeout_seconds: float) -> None:
+        super().__init__(f"Review run {run_id} exceeded its {timeout_seconds:g}s deadline")
+        self.run_id = run_id
+        self.timeout_seconds = timeout_seconds
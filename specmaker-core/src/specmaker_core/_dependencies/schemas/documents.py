@@ -9,6 +9,10 @@ from typing import Literal
 
 import pydantic
 
+IssueCategory = Literal["clarity", "accuracy", "structure", "grammar", "style", "other"]
+IssueSeverity = Literal["blocking", "major", "minor"]
+ReviewStatus = Literal["pass", "changes_required", "blocked"]
+
 
 class DocumentDraft(pydantic.BaseModel):
     """Outline produced by the architect agent before full manuscript drafting."""
@@ -43,8 +47,8 @@ class ReviewIssue(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(frozen=True, str_strip_whitespace=True)
 
     id: str = pydantic.Field(default_factory=lambda: str(uuid.uuid4()))
-    category: Literal["clarity", "accuracy", "structure", "grammar", "style", "other"]
-    severity: Literal["blocking", "major", "minor"]
+    category: IssueCategory
+    severity: IssueSeverity
     message: str = pydantic.Field(min_length=1)
     location: str | None = None
 
@@ -54,7 +58,7 @@ class ReviewReport(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(frozen=True, str_strip_whitespace=True)
 
-    status: Literal["pass", "changes_required", "blocked"]
+    status: ReviewStatus
     summary: str = pydantic.Field(min_length=1)
     issues: list[ReviewIssue] = pydantic.Field(default_factory=lambda: [])
     style_rules: str = pydantic.Field(default="google", min_length=1)
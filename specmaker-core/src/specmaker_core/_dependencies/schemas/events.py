@@ -1 +1,68 @@
 """Event payload schemas for progress updates, approvals, and review findings."""
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+import pydantic
+
+from specmaker_core._dependencies.schemas import documents as _documents
+
+ProgressStage = Literal["thinking", "drafting", "tool_call", "tool_result"]
+
+
+class ReviewStarted(pydantic.BaseModel):
+    """Emitted once when a streamed review begins."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    kind: Literal["started"] = "started"
+    title: str
+
+
+class ReviewProgress(pydantic.BaseModel):
+    """Coarse progress of the model run, such as a tool call or the report being drafted."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    kind: Literal["progress"] = "progress"
+    stage: ProgressStage
+    detail: str | None = None
+
+
+class IssueFound(pydantic.BaseModel):
+    """Issue validated from the partially streamed report, in order of arrival.
+
+    Streamed issues are provisional; the report in the final outcome is authoritative.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    kind: Literal["issue"] = "issue"
+    index: int = pydantic.Field(ge=0)
+    issue: _documents.ReviewIssue
+
+
+class ApprovalRequested(pydantic.BaseModel):
+    """Emitted when the reviewer calls a tool that needs an approval to proceed."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    kind: Literal["approval_requested"] = "approval_requested"
+    tool_name: str
+    tool_call_id: str
+
+
+class EventsDropped(pydantic.BaseModel):
+    """Marks events discarded because the subscriber fell behind a full buffer."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    kind: Literal["dropped"] = "dropped"
+    count: int = pydantic.Field(ge=1)
+
+
+ReviewEvent = Annotated[
+    ReviewStarted | ReviewProgress | IssueFound | ApprovalRequested | EventsDropped,
+    pydantic.Field(discriminator="kind"),
+]
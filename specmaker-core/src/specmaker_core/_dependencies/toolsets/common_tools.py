@@ -1 +1,69 @@
 """Common pure helper functions for agents (string ops, parsing, validation utilities)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Final
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.utils import serialization as _serialization
+
+_STATUS_RANK: Final[dict[_documents.ReviewStatus, int]] = {
+    "pass": 0,
+    "changes_required": 1,
+    "blocked": 2,
+}
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of whitespace into single spaces and trim the ends."""
+    return " ".join(text.split())
+
+
+def issue_fingerprint(issue: _documents.ReviewIssue) -> str:
+    """Return a stable identifier for a finding that ignores its random ``id``.
+
+    Two issues with the same category, severity, location, and message (compared
+    case- and whitespace-insensitively) share a fingerprint across reviews.
+    """
+    return _serialization.content_hash(
+        {
+            "category": issue.category,
+            "severity": issue.severity,
+            "location": normalize_whitespace(issue.location or "").lower(),
+            "message": normalize_whitespace(issue.message).lower(),
+        }
+    )
+
+
+def dedupe_issues(issues: Iterable[_documents.ReviewIssue]) -> list[_documents.ReviewIssue]:
+    """Drop issues whose fingerprint was already seen, keeping the first occurrence."""
+    seen: set[str] = set()
+    unique: list[_documents.ReviewIssue] = []
+    for issue in issues:
+        fingerprint = issue_fingerprint(issue)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            unique.append(issue)
+    return unique
+
+
+def worst_status(statuses: Iterable[_documents.ReviewStatus]) -> _documents.ReviewStatus:
+    """Return the most severe review status, or ``"pass"`` when there are none."""
+    worst: _documents.ReviewStatus = "pass"
+    for status in statuses:
+        if _STATUS_RANK[status] > _STATUS_RANK[worst]:
+            worst = status
+    return worst
+
+
+def status_for_issues(issues: Iterable[_documents.ReviewIssue]) -> _documents.ReviewStatus:
+    """Return the least severe status consistent with ``issues`` being outstanding.
+
+    Any blocking issue blocks the document; any other outstanding issue requires
+    changes.
+    """
+    severities = {issue.severity for issue in issues}
+    if "blocking" in severities:
+        return "blocked"
+    return "changes_required" if severities else "pass"
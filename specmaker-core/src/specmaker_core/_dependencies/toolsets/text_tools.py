@@ -1 +1,227 @@
 """Text formatting, chunking, and style-rule related helpers for writing agents."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from specmaker_core._dependencies.utils import serialization as _serialization
+
+PREAMBLE_ANCHOR: Final[str] = "preamble"
+
+# Rough characters-per-token ratio for English prose; avoids a tokenizer dependency.
+CHARS_PER_TOKEN: Final[int] = 4
+
+_HEADING: Final[re.Pattern[str]] = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+_FENCE: Final[re.Pattern[str]] = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_SLUG_SEPARATORS: Final[re.Pattern[str]] = re.compile(r"[^a-z0-9]+")
+_PARAGRAPH_BREAK: Final[re.Pattern[str]] = re.compile(r"\n[ \t]*\n")
+
+
+@dataclass(frozen=True)
+class MarkdownSection:
+    """Contiguous block of a Markdown document that starts at a heading.
+
+    Attributes:
+        anchor: Identifier derived from the heading path, unique within the document,
+            so it stays stable when other sections are edited, added, or removed.
+        title: Heading text, empty for the preamble before the first heading.
+        level: Heading level from 1 to 6, or 0 for the preamble.
+        text: Section source including its heading line.
+        content_hash: Hash of ``text`` that ignores trailing whitespace.
+    """
+
+    anchor: str
+    title: str
+    level: int
+    text: str
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class SectionDiff:
+    """Sections of a revised document compared with an earlier revision."""
+
+    changed: list[MarkdownSection]
+    unchanged: list[MarkdownSection]
+    removed: list[MarkdownSection]
+
+
+def split_sections(markdown: str) -> list[MarkdownSection]:
+    """Split Markdown into sections at ATX headings outside fenced code blocks.
+
+    Text before the first heading becomes a level-0 preamble section; blank
+    preambles are omitted.
+    """
+    blocks: list[tuple[str, int, list[str]]] = [("", 0, [])]
+    fence: str | None = None
+    for line in markdown.splitlines():
+        fence_match = _FENCE.match(line)
+        if fence_match is not None:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = None
+        heading = _HEADING.match(line) if fence is None else None
+        if heading is not None:
+            blocks.append((heading.group(2).strip(), len(heading.group(1)), [line]))
+        else:
+            blocks[-1][2].append(line)
+
+    sections: list[MarkdownSection] = []
+    parents: list[tuple[int, str]] = []
+    seen: dict[str, int] = {}
+    for title, level, lines in blocks:
+        text = "\n".join(lines).strip("\n")
+        if level == 0:
+            if not text.strip():
+                continue
+            anchor = PREAMBLE_ANCHOR
+        else:
+            while parents and parents[-1][0] >= level:
+                parents.pop()
+            parents.append((level, _slug(title)))
+            anchor = "/".join(slug for _, slug in parents)
+        seen[anchor] = seen.get(anchor, 0) + 1
+        if seen[anchor] > 1:
+            anchor = f"{anchor}-{seen[anchor]}"
+        sections.append(
+            MarkdownSection(
+                anchor=anchor,
+                title=title,
+                level=level,
+                text=text,
+                content_hash=section_hash(text),
+            )
+        )
+    return sections
+
+
+def section_hash(text: str) -> str:
+    """Return a content hash of ``text`` that ignores trailing whitespace on each line."""
+    normalized = "\n".join(line.rstrip() for line in text.strip("\n").splitlines())
+    return _serialization.content_hash(normalized)
+
+
+def diff_sections(
+    previous: Sequence[MarkdownSection], current: Sequence[MarkdownSection]
+) -> SectionDiff:
+    """Compare two revisions section by section, matching sections by anchor."""
+    previous_hashes = {section.anchor: section.content_hash for section in previous}
+    current_anchors = {section.anchor for section in current}
+    changed: list[MarkdownSection] = []
+    unchanged: list[MarkdownSection] = []
+    for section in current:
+        if previous_hashes.get(section.anchor) == section.content_hash:
+            unchanged.append(section)
+        else:
+            changed.append(section)
+    removed = [section for section in previous if section.anchor not in current_anchors]
+    return SectionDiff(changed=changed, unchanged=unchanged, removed=removed)
+
+
+def locate_section(
+    location: str | None, sections: Sequence[MarkdownSection]
+) -> MarkdownSection | None:
+    """Return the section an issue location refers to, if it can be determined.
+
+    A location matches a section when it names the anchor (optionally in square
+    brackets) or contains the heading text; the longest matching heading wins.
+    """
+    if not location:
+        return None
+    normalized = location.strip().lower()
+    for section in sections:
+        if normalized == section.anchor or f"[{section.anchor}]" in normalized:
+            return section
+    titled = [
+        section for section in sections if section.title and section.title.lower() in normalized
+    ]
+    return max(titled, key=lambda section: len(section.title)) if titled else None
+
+
+def render_changed_sections(
+    sections: Sequence[MarkdownSection], changed: Sequence[MarkdownSection]
+) -> str:
+    """Render the outline of ``sections`` followed by the full text of ``changed``.
+
+    The outline gives the reviewer the document structure without the unchanged
+    prose. Each changed section is preceded by its bracketed anchor so findings can
+    be attributed back to it.
+    """
+    outline = [
+        f"{'  ' * max(section.level - 1, 0)}- [{section.anchor}] {section.title or 'Preamble'}"
+        for section in sections
+    ]
+    body = [f"[{section.anchor}]\n{section.text}" for section in changed]
+    return "\n\n".join(
+        [
+            "Document outline:\n" + "\n".join(outline),
+            "Only the sections below changed since the last review. Review them and set "
+            "each issue's location to the bracketed anchor of its section.",
+            *body,
+        ]
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Return an approximate token count for ``text``."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chunk_markdown(markdown: str, max_tokens: int) -> list[str]:
+    """Pack Markdown into chunks of at most ``max_tokens`` estimated tokens.
+
+    Whole sections are kept together where they fit. Larger sections are split at
+    paragraph breaks, then at line breaks, and finally at the character budget.
+    """
+    if max_tokens < 1:
+        msg = f"max_tokens must be positive, got {max_tokens}"
+        raise ValueError(msg)
+    return _pack(_pieces(markdown, max_tokens * CHARS_PER_TOKEN), max_tokens * CHARS_PER_TOKEN)
+
+
+def _pieces(markdown: str, budget: int) -> Iterator[str]:
+    """Yield sections, or fragments of oversized sections, no longer than ``budget``."""
+    for section in split_sections(markdown):
+        if len(section.text) <= budget:
+            yield section.text
+            continue
+        for raw_paragraph in _PARAGRAPH_BREAK.split(section.text):
+            paragraph = raw_paragraph.strip("\n")
+            if not paragraph.strip():
+                continue
+            if len(paragraph) <= budget:
+                yield paragraph
+                continue
+            fragments = (
+                line[start : start + budget]
+                for line in paragraph.splitlines()
+                for start in range(0, max(len(line), 1), budget)
+            )
+            yield from _pack(fragments, budget, separator="\n")
+
+
+def _pack(pieces: Iterable[str], budget: int, *, separator: str = "\n\n") -> list[str]:
+    """Greedily join consecutive pieces while the result stays within ``budget``."""
+    packed: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in pieces:
+        added = len(piece) + (len(separator) if current else 0)
+        if current and size + added > budget:
+            packed.append(separator.join(current))
+            current, size, added = [], 0, len(piece)
+        current.append(piece)
+        size += added
+    if current:
+        packed.append(separator.join(current))
+    return packed
+
+
+def _slug(title: str) -> str:
+    return _SLUG_SEPARATORS.sub("-", title.lower()).strip("-") or "section"
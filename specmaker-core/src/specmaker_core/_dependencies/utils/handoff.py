@@ -1,3 +1,138 @@
-"""Helpers for constructing trimmed PydanticAI message_history for sequential agent handoffs
-and attaching stable identifiers across runs.
+"""Helpers for constructing trimmed PydanticAI message_history for sequential agent handoffs.
+
+A deferred run is resumed by resending its whole message history, which grows with
+every round of approvals. :func:`trim_history` compacts that history to a token
+budget while keeping it valid to resume: the opening request, the final response
+with its pending tool calls, and every exchange involving a deferred tool are kept
+intact, and each kept tool call stays paired with its result.
 """
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Collection, Sequence
+from typing import Final
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelRequest,
+    ModelResponse,
+    ThinkingPart,
+    ToolCallPart,
+    ToolReturnPart,
+)
+
+from specmaker_core._dependencies.toolsets import text_tools as _text_tools
+
+TRIMMED_RESULT: Final[str] = "[result trimmed from history]"
+
+# One model response and the requests answering it, such as its tool results.
+_Exchange = list[ModelMessage]
+
+
+def estimate_history_tokens(messages: Sequence[ModelMessage]) -> int:
+    """Return an approximate token count for ``messages`` as serialized for a model."""
+    return sum(_message_tokens(message) for message in messages)
+
+
+def trim_history(
+    messages: Sequence[ModelMessage],
+    max_tokens: int,
+    *,
+    keep_tools: Collection[str] = (),
+) -> list[ModelMessage]:
+    """Return ``messages`` compacted to roughly ``max_tokens`` estimated tokens.
+
+    Exchanges between the opening request and the final response are reduced oldest
+    first: tool results and thinking are elided, then whole exchanges are dropped.
+    Exchanges that call a tool in ``keep_tools`` are never altered. The budget is
+    best effort; a history made only of kept messages is returned unchanged.
+
+    Args:
+        messages: Complete message history of a run.
+        max_tokens: Target size in estimated tokens; 0 disables trimming.
+        keep_tools: Names of deferred tools whose calls and results must survive.
+    """
+    if max_tokens < 0:
+        msg = f"max_tokens must not be negative, got {max_tokens}"
+        raise ValueError(msg)
+    history = list(messages)
+    if max_tokens == 0 or estimate_history_tokens(history) <= max_tokens:
+        return history
+    responses = [
+        index for index, message in enumerate(history) if isinstance(message, ModelResponse)
+    ]
+    if not responses or not isinstance(history[0], ModelRequest):
+        return history
+    head, tail = history[:1], history[responses[-1] :]
+    exchanges = _exchanges(history[1 : responses[-1]])
+    trimmable = [
+        index for index, exchange in enumerate(exchanges) if not _calls_any(exchange, keep_tools)
+    ]
+    sizes = [estimate_history_tokens(exchange) for exchange in exchanges]
+    excess = estimate_history_tokens(head) + sum(sizes) + estimate_history_tokens(tail)
+    excess -= max_tokens
+
+    for index in trimmable:
+        if excess <= 0:
+            break
+        compacted = [_compact(message) for message in exchanges[index]]
+        compacted_size = estimate_history_tokens(compacted)
+        excess -= sizes[index] - compacted_size
+        exchanges[index], sizes[index] = compacted, compacted_size
+    dropped: set[int] = set()
+    for index in trimmable:
+        if excess <= 0:
+            break
+        dropped.add(index)
+        excess -= sizes[index]
+
+    kept = [
+        message
+        for index, exchange in enumerate(exchanges)
+        if index not in dropped
+        for message in exchange
+    ]
+    return [*head, *kept, *tail]
+
+
+def _exchanges(messages: Sequence[ModelMessage]) -> list[_Exchange]:
+    """Group messages so each exchange starts at a model response."""
+    exchanges: list[_Exchange] = []
+    for message in messages:
+        if isinstance(message, ModelResponse) or not exchanges:
+            exchanges.append([message])
+        else:
+            exchanges[-1].append(message)
+    return exchanges
+
+
+def _calls_any(exchange: _Exchange, tool_names: Collection[str]) -> bool:
+    return any(
+        isinstance(part, ToolCallPart) and part.tool_name in tool_names
+        for message in exchange
+        if isinstance(message, ModelResponse)
+        for part in message.parts
+    )
+
+
+def _compact(message: ModelMessage) -> ModelMessage:
+    """Return ``message`` without thinking parts and with tool results elided."""
+    if isinstance(message, ModelResponse):
+        parts = [part for part in message.parts if not isinstance(part, ThinkingPart)]
+        return dataclasses.replace(message, parts=parts or message.parts)
+    return dataclasses.replace(
+        message,
+        parts=[
+            dataclasses.replace(part, content=TRIMMED_RESULT)
+            if isinstance(part, ToolReturnPart)
+            else part
+            for part in message.parts
+        ],
+    )
+
+
+def _message_tokens(message: ModelMessage) -> int:
+    encoded = ModelMessagesTypeAdapter.dump_json([message])
+    return _text_tools.estimate_tokens(encoded.decode("utf-8"))
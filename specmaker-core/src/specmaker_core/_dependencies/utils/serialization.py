@@ -1,15 +1,19 @@
-"""Serialization helpers for JSON/MsgPack and canonical content hashing (no I/O)."""
+"""Serialization helpers for JSON/MsgPack, canonical hashing, and timestamps (no I/O)."""
 
 from __future__ import annotations
 
 import dataclasses
 import datetime
+import hashlib
 import json
 import pathlib
 import typing
 
 import pydantic
 
+_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+
 
 def _default_serializer(value: typing.Any) -> typing.Any:
     """Convert unsupported types into JSON-friendly representations."""
@@ -28,3 +32,34 @@ def _default_serializer(value: typing.Any) -> typing.Any:
 def to_json(data: typing.Any, *, indent: int = 2) -> str:
     """Serialize data to JSON with deterministic formatting."""
     return json.dumps(data, indent=indent, sort_keys=True, default=_default_serializer)
+
+
+def canonical_json(data: typing.Any) -> str:
+    """Serialize data to compact JSON with sorted keys for stable hashing."""
+    return json.dumps(
+        data,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_default_serializer,
+    )
+
+
+def content_hash(data: typing.Any) -> str:
+    """Return the SHA-256 hex digest of the canonical JSON form of ``data``."""
+    return hashlib.sha256(canonical_json(data).encode("utf-8")).hexdigest()
+
+
+def epoch_microseconds(moment: datetime.datetime) -> int:
+    """Return ``moment`` as exact integer microseconds since the Unix epoch.
+
+    Naive datetimes are interpreted as UTC.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.UTC)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_microseconds(value: int) -> datetime.datetime:
+    """Return the UTC datetime for integer microseconds since the Unix epoch."""
+    return _EPOCH + value * _MICROSECOND
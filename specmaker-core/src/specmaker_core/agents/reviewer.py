@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Final
 
 import jinja2
 from pydantic_ai import Agent, ApprovalRequired, DeferredToolRequests, RunContext
+from pydantic_ai.models import KnownModelName, Model
 
 from specmaker_core._dependencies.schemas import documents as _documents
 
 DEFAULT_REVIEWER_MODEL: Final[str] = "openai:gpt-5"
 REVIEWER_NAME: Final[str] = "reviewer"
+# Tools that defer the run for approval; their calls and results are kept when trimming history.
+DEFERRED_TOOL_NAMES: Final[frozenset[str]] = frozenset({"request_approvals"})
 
 
-def _load_reviewer_instructions() -> str:
-    """Load and render the reviewer agent instructions from the template."""
+@functools.cache
+def reviewer_instructions() -> str:
+    """Load and render the reviewer agent instructions from the template once."""
     template_dir = Path(__file__).parents[1] / "_dependencies" / "templates"
     template_path = template_dir / "reviewer.jinja2"
     template_content = template_path.read_text(encoding="utf-8")
@@ -30,16 +35,24 @@ def get_reviewer() -> Agent[None, _documents.ReviewReport | DeferredToolRequests
     """Lazily instantiate and return the reviewer agent to avoid side effects on import."""
     global _reviewer_instance
     if _reviewer_instance is None:
-        _reviewer_instance = Agent(
-            DEFAULT_REVIEWER_MODEL,
-            name=REVIEWER_NAME,
-            instructions=_load_reviewer_instructions(),
-            output_type=[_documents.ReviewReport, DeferredToolRequests],
-        )
-        _reviewer_instance.tool(request_approvals)
+        _reviewer_instance = build_reviewer(DEFAULT_REVIEWER_MODEL)
     return _reviewer_instance
 
 
+def build_reviewer(
+    model: Model | KnownModelName | str,
+) -> Agent[None, _documents.ReviewReport | DeferredToolRequests]:
+    """Return a new reviewer agent backed by ``model``."""
+    reviewer = Agent(
+        model,
+        name=REVIEWER_NAME,
+        instructions=reviewer_instructions(),
+        output_type=[_documents.ReviewReport, DeferredToolRequests],
+    )
+    reviewer.tool(request_approvals)
+    return reviewer
+
+
 def request_approvals(ctx: RunContext[None], items: list[str]) -> str:
     """Collect approval decisions in a single batch for deferred review flow."""
     if not ctx.tool_call_approved:
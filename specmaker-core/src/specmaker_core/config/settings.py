@@ -5,6 +5,7 @@ All environment variables should be accessed through this module only.
 """
 
 import functools
+from typing import Literal
 
 import pydantic
 import pydantic_settings
@@ -43,15 +44,106 @@ class Settings(pydantic_settings.BaseSettings):
     )
     model_timeout: float = pydantic.Field(
         default=120.0,
+        gt=0,
         description="Model API call timeout in seconds",
     )
     step_timeout: float = pydantic.Field(
         default=300.0,
-        description="DBOS step execution timeout in seconds",
+        gt=0,
+        description="Deadline in seconds for each review or resume, across all its durable runs",
     )
     durable_retries_enabled: bool = pydantic.Field(
         default=False,
-        description="Enable DBOS-managed automatic step retries",
+        description="Enable DBOS-managed automatic retries of failed model steps",
+    )
+    storage_compression: Literal["none", "zlib"] = pydantic.Field(
+        default="none",
+        description="Compression codec for stored review payloads",
+    )
+    storage_compression_min_bytes: int = pydantic.Field(
+        default=1024,
+        ge=0,
+        description="Payloads smaller than this many bytes are stored uncompressed",
+    )
+    persistence_mode: Literal["sync", "write_behind"] = pydantic.Field(
+        default="sync",
+        description="Persist completions inline or through the background write-behind queue",
+    )
+    write_behind_durability: Literal["commit", "enqueue"] = pydantic.Field(
+        default="commit",
+        description="Wait for the write-behind commit, or return once the record is queued",
+    )
+    write_behind_batch_size: int = pydantic.Field(
+        default=100,
+        ge=1,
+        description="Maximum records coalesced into one write-behind transaction",
+    )
+    write_behind_flush_ms: int = pydantic.Field(
+        default=50,
+        ge=0,
+        description="Maximum milliseconds a queued record waits before its batch commits",
+    )
+    write_behind_queue_size: int = pydantic.Field(
+        default=1000,
+        ge=1,
+        description="Queued records allowed before producers block (backpressure)",
+    )
+    review_cache_enabled: bool = pydantic.Field(
+        default=False,
+        description="Reuse cached reports for manuscripts reviewed before with identical inputs",
+    )
+    review_cache_max_entries: int = pydantic.Field(
+        default=10_000,
+        ge=1,
+        description="Cached reviews kept before the least recently used are evicted",
+    )
+    review_cache_max_age_hours: float = pydantic.Field(
+        default=168.0,
+        gt=0,
+        description="Cached reviews older than this many hours are evicted",
+    )
+    review_chunk_max_tokens: int = pydantic.Field(
+        default=0,
+        ge=0,
+        description="Chunk size in estimated tokens for large manuscripts; 0 (default) disables",
+    )
+    review_chunk_concurrency: int = pydantic.Field(
+        default=4,
+        ge=1,
+        description="Chunks of one manuscript reviewed concurrently",
+    )
+    resume_history_max_tokens: int = pydantic.Field(
+        default=32_000,
+        ge=0,
+        description="Estimated token budget for history resent on resume; 0 disables trimming",
+    )
+    deferred_run_store_enabled: bool = pydantic.Field(
+        default=True,
+        description="Store deferred reviews in SQLite so they can be resumed by run id",
+    )
+    deferred_run_ttl_hours: float = pydantic.Field(
+        default=72.0,
+        gt=0,
+        description="Stored deferred reviews older than this many hours can no longer be resumed",
+    )
+    rate_limit_requests_per_minute: int = pydantic.Field(
+        default=0,
+        ge=0,
+        description="Model requests started per minute across concurrent reviews; 0 disables",
+    )
+    rate_limit_tokens_per_minute: int = pydantic.Field(
+        default=0,
+        ge=0,
+        description="Estimated model tokens per minute across concurrent reviews; 0 disables",
+    )
+    rate_limit_burst_seconds: float = pydantic.Field(
+        default=10.0,
+        gt=0,
+        description="Seconds of rate-limit capacity that may be spent in one burst",
+    )
+    rate_limit_shared: bool = pydantic.Field(
+        default=False,
+        description="Coordinate rate limits through SQLite across processes sharing the database",
     )
 
 
@@ -4,30 +4,64 @@ This module centralizes the DBOS bootstrap logic so it can be reused by CLI
 entrypoints, scripts, and tests. By default the bootstrap resolves
 configuration via :class:`specmaker_core.config.settings.Settings` which keeps
 the DB URL aligned with the application defaults (.specmaker/specmaker.db).
+
+DBOS is launched at most once per process for a given configuration. Repeated
+calls to :func:`launch_dbos` with an equivalent configuration return the cached
+:class:`DBOSLaunch` immediately; a changed configuration tears down the running
+instance and boots a new one. :func:`shutdown_dbos` releases it explicitly.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
+import time
 from collections.abc import AsyncIterable
+from dataclasses import dataclass
 from typing import Any, Final
 
 from dbos import DBOS, DBOSConfig
 from pydantic_ai import AgentStreamEvent, RunContext
 from pydantic_ai.durable_exec.dbos import DBOSAgent, StepConfig
 
-from specmaker_core.agents.reviewer import REVIEWER_NAME, get_reviewer
+from specmaker_core.agents.reviewer import (
+    DEFAULT_REVIEWER_MODEL,
+    REVIEWER_NAME,
+    build_reviewer,
+    get_reviewer,
+)
 from specmaker_core.config.settings import Settings, get_settings
+from specmaker_core.durable import rate_limit as _rate_limit
+from specmaker_core.durable import streaming as _streaming
 
 LOGGER = logging.getLogger(__name__)
 
 DBOS_APP_NAME: Final[str] = "specmaker_core"
-MODEL_STEP_CONFIG: Final[StepConfig] = StepConfig(max_attempts=3)
+MODEL_STEP_MAX_ATTEMPTS: Final[int] = 3
 MCP_STEP_CONFIG: Final[StepConfig] = StepConfig(max_attempts=1)
 
 _dbos_reviewer_instance: DBOSAgent[None, Any] | None = None
 
 
+@dataclass(frozen=True)
+class DBOSLaunch:
+    """Describes the DBOS instance running in this process.
+
+    Attributes:
+        fingerprint: Digest of the DBOS configuration the instance was built from.
+        boot_seconds: Wall-clock time spent constructing and launching DBOS.
+    """
+
+    fingerprint: str
+    boot_seconds: float
+
+
+_launch_lock = threading.Lock()
+_active_launch: DBOSLaunch | None = None
+
+
 def build_dbos_config(settings: Settings) -> DBOSConfig:
     """Return the DBOS configuration derived from the provided settings."""
     return {
@@ -36,36 +70,103 @@ def build_dbos_config(settings: Settings) -> DBOSConfig:
     }
 
 
-def launch_dbos(settings: Settings | None = None) -> None:
-    """Initialise DBOS with the configured SQLite URL and launch it.
+def config_fingerprint(config: DBOSConfig) -> str:
+    """Return a stable digest identifying an equivalent DBOS configuration."""
+    encoded = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def launch_dbos(settings: Settings | None = None) -> DBOSLaunch:
+    """Initialise DBOS with the configured SQLite URL and launch it once.
+
+    Calls with a configuration equivalent to the running one are no-ops that
+    return the existing launch. A different configuration shuts the running
+    instance down before booting a new one.
 
     Args:
         settings: Optional settings instance. When not provided the cached
             application settings are used via :func:`get_settings`.
+
+    Returns:
+        The launch describing the running DBOS instance.
     """
+    global _active_launch
     effective_settings = settings or get_settings()
     config = build_dbos_config(effective_settings)
+    fingerprint = config_fingerprint(config)
+
+    with _launch_lock:
+        if _active_launch is not None:
+            if _active_launch.fingerprint == fingerprint:
+                return _active_launch
+            LOGGER.info("DBOS configuration changed; relaunching")
+            _destroy()
+
+        # Extract values for logging to avoid TypedDict optional key access issues
+        dbos_name = config.get("name", DBOS_APP_NAME)
+        database_url = config.get("system_database_url", effective_settings.system_database_url)
+
+        LOGGER.debug(
+            "Launching DBOS",
+            extra={"dbos_name": dbos_name, "database_url": database_url},
+        )
 
-    # Extract values for logging to avoid TypedDict optional key access issues
-    dbos_name = config.get("name", DBOS_APP_NAME)
-    database_url = config.get("system_database_url", effective_settings.system_database_url)
+        started = time.perf_counter()
+        DBOS(config=config)
+        DBOS.launch()
+        _active_launch = DBOSLaunch(
+            fingerprint=fingerprint, boot_seconds=time.perf_counter() - started
+        )
+        LOGGER.info("DBOS launched in %.1f ms", _active_launch.boot_seconds * 1000)
+        return _active_launch
+
+
+def shutdown_dbos() -> None:
+    """Destroy the running DBOS instance, if any, so the next launch boots afresh."""
+    with _launch_lock:
+        _destroy()
+
+
+def _destroy() -> None:
+    global _active_launch
+    if _active_launch is None:
+        return
+    # Keep registered workflows so the durable agents survive a relaunch.
+    DBOS.destroy(destroy_registry=False)
+    _active_launch = None
 
-    LOGGER.debug(
-        "Launching DBOS",
-        extra={"dbos_name": dbos_name, "database_url": database_url},
-    )
 
-    DBOS(config=config)
-    DBOS.launch()
+def model_step_config(settings: Settings) -> StepConfig:
+    """Return the DBOS step configuration for model requests.
+
+    Failed model steps are retried only when ``durable_retries_enabled`` is set; the
+    retries count against the review's ``step_timeout`` deadline.
+    """
+    return StepConfig(
+        retries_allowed=settings.durable_retries_enabled,
+        max_attempts=MODEL_STEP_MAX_ATTEMPTS,
+    )
 
 
 def get_dbos_reviewer() -> DBOSAgent[None, Any]:
-    """Lazily instantiate and return the durable reviewer agent."""
+    """Lazily instantiate and return the durable reviewer agent.
+
+    DBOS registers the agent's workflows once, so its step configuration reflects
+    the settings in effect at the first call. When rate limits are configured the
+    model is admitted through the process-wide limiter inside the model step, so
+    retried steps queue for capacity again rather than retrying immediately.
+    """
     global _dbos_reviewer_instance
     if _dbos_reviewer_instance is None:
+        limiter = _rate_limit.get_rate_limiter()
+        reviewer = (
+            build_reviewer(_rate_limit.RateLimitedModel(DEFAULT_REVIEWER_MODEL, limiter))
+            if limiter.enabled
+            else get_reviewer()
+        )
         _dbos_reviewer_instance = DBOSAgent(
-            get_reviewer(),
-            model_step_config=MODEL_STEP_CONFIG,
+            reviewer,
+            model_step_config=model_step_config(get_settings()),
             mcp_step_config=MCP_STEP_CONFIG,
         )
     return _dbos_reviewer_instance
@@ -75,7 +176,8 @@ async def event_stream_handler(
     ctx: RunContext[Any],
     stream: AsyncIterable[AgentStreamEvent],
 ) -> None:
-    """Log streaming events for visibility during durable runs."""
+    """Log streaming events and forward them to any active review stream subscribers."""
     agent_name = getattr(ctx, "agent_name", REVIEWER_NAME)
     async for event in stream:
         LOGGER.info("[%s] %s", agent_name, event)
+        _streaming.publish_agent_event(event)
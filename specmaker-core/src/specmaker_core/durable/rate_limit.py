@@ -0,0 +1,352 @@
+"""Token-bucket rate limiting for reviewer model calls.
+
+Concurrent reviews share one :class:`RateLimiter` that paces model requests
+against a requests-per-minute and a tokens-per-minute budget. Each request
+reserves capacity up front and sleeps until its reservation is covered, so
+callers queue in arrival order instead of bursting into provider 429s. Token
+costs are estimated from the outgoing messages and reconciled with the reported
+usage once the response arrives.
+
+Bucket state lives in memory by default. With a database path it is kept in the
+``rate_limit_buckets`` table instead, updated in short ``BEGIN IMMEDIATE``
+transactions, so every process sharing the database draws from the same budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import functools
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Protocol
+
+from pydantic_ai import RunContext
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import (
+    KnownModelName,
+    Model,
+    ModelRequestParameters,
+    StreamedResponse,
+    infer_model,
+)
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from specmaker_core._dependencies.utils import handoff as _handoff
+from specmaker_core.config.settings import Settings, get_settings
+from specmaker_core.persistence import models as _models
+from specmaker_core.persistence import storage as _storage
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BURST_SECONDS: Final[float] = 10.0
+REQUESTS_BUCKET: Final[str] = "requests"
+TOKENS_BUCKET: Final[str] = "tokens"
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Queue-wait metrics for the requests admitted by a :class:`RateLimiter`.
+
+    Attributes:
+        requests: Requests admitted.
+        waited_requests: Requests that queued before being admitted.
+        total_wait_seconds: Time spent queued across all requests.
+        max_wait_seconds: Longest time a single request queued.
+    """
+
+    requests: int = 0
+    waited_requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average queue wait per admitted request."""
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+@dataclass(frozen=True)
+class Reservation:
+    """Capacity granted to one model request.
+
+    Attributes:
+        tokens: Estimated tokens reserved for the request.
+        wait_seconds: Time the request queued before it was admitted.
+    """
+
+    tokens: int
+    wait_seconds: float
+
+
+@dataclass(frozen=True)
+class _Limit:
+    capacity: float
+    rate: float  # units refilled per second
+
+
+class _Buckets(Protocol):
+    def take(self, amounts: Mapping[str, float]) -> float:
+        """Refill, subtract ``amounts`` and return the wait until the debt is covered."""
+        ...
+
+
+def _drain(level: float, elapsed: float, limit: _Limit, amount: float) -> tuple[float, float]:
+    """Return the level after refilling for ``elapsed`` seconds and taking ``amount``."""
+    level = min(limit.capacity, level + max(elapsed, 0.0) * limit.rate) - amount
+    return level, max(0.0, -level / limit.rate)
+
+
+class _LocalBuckets:
+    """Bucket state for limiters confined to this process."""
+
+    def __init__(self, limits: Mapping[str, _Limit], clock: Callable[[], float]) -> None:
+        self._limits = dict(limits)
+        self._clock = clock
+        now = clock()
+        self._state = {name: (limit.capacity, now) for name, limit in limits.items()}
+        self._lock = threading.Lock()
+
+    def take(self, amounts: Mapping[str, float]) -> float:
+        wait = 0.0
+        with self._lock:
+            now = self._clock()
+            for name, amount in amounts.items():
+                level, updated = self._state[name]
+                level, needed = _drain(level, now - updated, self._limits[name], amount)
+                self._state[name] = (level, now)
+                wait = max(wait, needed)
+        return wait
+
+
+class _SharedBuckets:
+    """Bucket state stored in SQLite and shared by every process using the database."""
+
+    def __init__(
+        self, limits: Mapping[str, _Limit], clock: Callable[[], float], db_path: Path
+    ) -> None:
+        self._limits = dict(limits)
+        self._clock = clock
+        self._db_path = db_path
+
+    def take(self, amounts: Mapping[str, float]) -> float:
+        return _storage.retry_on_busy(functools.partial(self._take, amounts))
+
+    def _take(self, amounts: Mapping[str, float]) -> float:
+        wait = 0.0
+        session = _storage.create_session(self._db_path)
+        try:
+            now_us = round(self._clock() * 1_000_000)
+            for name, amount in amounts.items():
+                limit = self._limits[name]
+                record = session.get(_models.RateLimitBucketRecord, name)
+                if record is None:
+                    record = _models.RateLimitBucketRecord(
+                        name=name, level=limit.capacity, updated_at_us=now_us
+                    )
+                    session.add(record)
+                elapsed = (now_us - record.updated_at_us) / 1_000_000
+                record.level, needed = _drain(record.level, elapsed, limit, amount)
+                # Processes' clocks may disagree slightly; never move the timestamp back.
+                record.updated_at_us = max(record.updated_at_us, now_us)
+                wait = max(wait, needed)
+            session.commit()
+        finally:
+            session.close()
+        return wait
+
+
+class RateLimiter:
+    """Paces model requests against per-minute request and token budgets.
+
+    Each budget is a token bucket refilled continuously at its per-minute rate and
+    holding at most ``burst_seconds`` worth of capacity, which bounds how many
+    requests can start back to back after an idle period. A budget of zero is
+    unlimited.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        burst_seconds: float = DEFAULT_BURST_SECONDS,
+        db_path: Path | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if requests_per_minute < 0 or tokens_per_minute < 0:
+            msg = "rate limits must not be negative"
+            raise ValueError(msg)
+        if burst_seconds <= 0:
+            msg = f"burst_seconds must be positive, got {burst_seconds}"
+            raise ValueError(msg)
+        limits: dict[str, _Limit] = {}
+        for name, per_minute in (
+            (REQUESTS_BUCKET, requests_per_minute),
+            (TOKENS_BUCKET, tokens_per_minute),
+        ):
+            if per_minute:
+                rate = per_minute / 60
+                limits[name] = _Limit(capacity=max(rate * burst_seconds, 1.0), rate=rate)
+        self._limits = limits
+        self._shared = db_path is not None
+        self._buckets: _Buckets
+        if db_path is None:
+            self._buckets = _LocalBuckets(limits, clock or time.monotonic)
+        else:
+            # Processes share no monotonic clock, so shared buckets use wall-clock time.
+            self._buckets = _SharedBuckets(limits, clock or time.time, db_path)
+        self._stats = RateLimiterStats()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any budget is configured."""
+        return bool(self._limits)
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of the queue-wait metrics."""
+        with self._stats_lock:
+            return self._stats
+
+    async def acquire(self, tokens: int = 0) -> Reservation:
+        """Reserve one request and ``tokens`` estimated tokens, waiting until they are covered.
+
+        A cancelled waiter hands its reservation back so it does not delay later callers.
+        """
+        amounts = self._amounts(requests=1, tokens=tokens)
+        wait = 0.0
+        if amounts:
+            # Shielded so a reservation recorded by a cancelled caller is still known.
+            reserved = asyncio.ensure_future(self._take(amounts))
+            try:
+                wait = await asyncio.shield(reserved)
+                if wait > 0:
+                    LOGGER.debug("Rate limit queued model request for %.3fs", wait)
+                    await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                await asyncio.shield(self._release(reserved, amounts))
+                raise
+        self._record(wait)
+        return Reservation(tokens=tokens, wait_seconds=wait)
+
+    async def settle(self, reservation: Reservation, used_tokens: int) -> None:
+        """Correct the token budget once the actual usage of a request is known.
+
+        The correction is shielded from cancellation so a cancelled request still
+        leaves the budget accurate.
+        """
+        difference = used_tokens - reservation.tokens
+        if difference and TOKENS_BUCKET in self._limits:
+            await asyncio.shield(self._take({TOKENS_BUCKET: difference}))
+
+    async def _release(self, reserved: asyncio.Future[float], amounts: Mapping[str, float]) -> None:
+        try:
+            await reserved
+        except Exception:
+            # The reservation was never recorded, so there is nothing to hand back.
+            return
+        await self._take({name: -amount for name, amount in amounts.items()})
+
+    def _amounts(self, *, requests: int, tokens: int) -> dict[str, float]:
+        amounts = {REQUESTS_BUCKET: float(requests), TOKENS_BUCKET: float(tokens)}
+        return {name: amount for name, amount in amounts.items() if name in self._limits}
+
+    async def _take(self, amounts: Mapping[str, float]) -> float:
+        if self._shared:
+            return await asyncio.to_thread(self._buckets.take, amounts)
+        return self._buckets.take(amounts)
+
+    def _record(self, wait: float) -> None:
+        with self._stats_lock:
+            stats = self._stats
+            self._stats = dataclasses.replace(
+                stats,
+                requests=stats.requests + 1,
+                waited_requests=stats.waited_requests + (wait > 0),
+                total_wait_seconds=stats.total_wait_seconds + wait,
+                max_wait_seconds=max(stats.max_wait_seconds, wait),
+            )
+
+
+class RateLimitedModel(WrapperModel):
+    """Model that admits every request through a :class:`RateLimiter` before sending it."""
+
+    def __init__(self, wrapped: Model | KnownModelName | str, limiter: RateLimiter) -> None:
+        super().__init__(infer_model(wrapped))
+        self.limiter = limiter
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        reservation = await self.limiter.acquire(_handoff.estimate_history_tokens(messages))
+        # Without a response the estimate stands; the provider may have counted the input.
+        used_tokens = reservation.tokens
+        try:
+            response = await self.wrapped.request(
+                messages, model_settings, model_request_parameters
+            )
+            used_tokens = response.usage.total_tokens
+            return response
+        finally:
+            await self.limiter.settle(reservation, used_tokens)
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        reservation = await self.limiter.acquire(_handoff.estimate_history_tokens(messages))
+        stream: StreamedResponse | None = None
+        finished = False
+        try:
+            async with self.wrapped.request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as stream:
+                yield stream
+            finished = True
+        finally:
+            used_tokens = reservation.tokens
+            if stream is not None:
+                seen = stream.usage().total_tokens
+                # An interrupted stream may not have reported its input tokens yet.
+                used_tokens = seen if finished else max(seen, reservation.tokens)
+            await self.limiter.settle(reservation, used_tokens)
+
+
+_limiter_lock = threading.Lock()
+_limiter_instance: RateLimiter | None = None
+
+
+def get_rate_limiter(settings: Settings | None = None) -> RateLimiter:
+    """Return the process-wide limiter, configured from settings on first use."""
+    global _limiter_instance
+    with _limiter_lock:
+        if _limiter_instance is None:
+            effective_settings = settings or get_settings()
+            _limiter_instance = RateLimiter(
+                requests_per_minute=effective_settings.rate_limit_requests_per_minute,
+                tokens_per_minute=effective_settings.rate_limit_tokens_per_minute,
+                burst_seconds=effective_settings.rate_limit_burst_seconds,
+                db_path=_storage.DEFAULT_DB_PATH if effective_settings.rate_limit_shared else None,
+            )
+        return _limiter_instance
+
+
+def reset_rate_limiter() -> None:
+    """Discard the process-wide limiter so the next use rebuilds it from settings."""
+    global _limiter_instance
+    with _limiter_lock:
+        _limiter_instance = None
@@ -1,38 +1,152 @@
-"""Review flow orchestration helpers using the reviewer DBOS agent."""
+"""Review flow orchestration helpers using the reviewer DBOS agent.
+
+A review, including every durable run it starts for chunks or continuations, is
+bounded by one :func:`review_deadline` of ``Settings.step_timeout``. Each run gets
+the time remaining: it is recorded on the DBOS workflow, so a run recovered after a
+restart is cancelled once it passes, and is enforced in-process by cancelling the
+awaiting task, which aborts an in-flight model call. Each model request is
+additionally limited to ``Settings.model_timeout``.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+from collections.abc import Iterator
+from dataclasses import dataclass
+from uuid import uuid4
+
+from dbos import SetWorkflowID, SetWorkflowTimeout
+from dbos import error as _dbos_error
 from pydantic_ai import DeferredToolRequests, DeferredToolResults
 from pydantic_ai.messages import ModelMessage
 from pydantic_ai.run import AgentRunResult
+from pydantic_ai.settings import ModelSettings
 
+from specmaker_core._dependencies import errors as _errors
 from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import get_settings
 from specmaker_core.durable import dbos_boot as _dbos_boot
 
 
+@dataclass(frozen=True)
+class ReviewDeadline:
+    """Run id and absolute deadline shared by every durable run of one review.
+
+    Attributes:
+        run_id: Identifier reported for the review, including when it times out.
+        timeout_seconds: Total time the review was given.
+        expires_at: Event-loop time at which the review is cancelled.
+    """
+
+    run_id: str
+    timeout_seconds: float
+    expires_at: float
+
+    def remaining(self) -> float:
+        """Return the seconds left before the deadline."""
+        return self.expires_at - asyncio.get_running_loop().time()
+
+
+_current_deadline: contextvars.ContextVar[ReviewDeadline | None] = contextvars.ContextVar(
+    "specmaker_review_deadline", default=None
+)
+
+
+@contextlib.contextmanager
+def review_deadline(run_id: str, timeout_seconds: float) -> Iterator[ReviewDeadline]:
+    """Bound every durable run started in this block by one deadline from now.
+
+    Tasks created inside the block, such as concurrent chunk reviews, share it.
+    """
+    deadline = ReviewDeadline(
+        run_id=run_id,
+        timeout_seconds=timeout_seconds,
+        expires_at=asyncio.get_running_loop().time() + timeout_seconds,
+    )
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_run_id() -> str | None:
+    """Return the run id of the enclosing :func:`review_deadline`, if any."""
+    deadline = _current_deadline.get()
+    return deadline.run_id if deadline is not None else None
+
+
 async def start_review(
     manuscript: _documents.Manuscript,
 ) -> AgentRunResult[_documents.ReviewReport | DeferredToolRequests]:
-    """Start a durable review for the provided manuscript."""
-    return await _dbos_boot.get_dbos_reviewer().run(
-        _review_prompt(manuscript),
-        event_stream_handler=_dbos_boot.event_stream_handler,
-    )
+    """Start a durable review for the provided manuscript.
+
+    Raises:
+        ReviewTimeoutError: If the enclosing review's deadline passes first.
+    """
+    return await _run_reviewer(_review_prompt(manuscript))
 
 
 async def resume_review(
     message_history: list[ModelMessage],
     results: DeferredToolResults,
 ) -> AgentRunResult[_documents.ReviewReport | DeferredToolRequests]:
-    """Resume a deferred review run with collected approvals/results."""
-    return await _dbos_boot.get_dbos_reviewer().run(
+    """Resume a deferred review run with collected approvals/results.
+
+    Raises:
+        ReviewTimeoutError: If the enclosing review's deadline passes first.
+    """
+    return await _run_reviewer(
         "Resume manuscript review",
         message_history=message_history,
         deferred_tool_results=results,
-        event_stream_handler=_dbos_boot.event_stream_handler,
     )
 
 
+async def _run_reviewer(
+    prompt: str,
+    *,
+    message_history: list[ModelMessage] | None = None,
+    deferred_tool_results: DeferredToolResults | None = None,
+) -> AgentRunResult[_documents.ReviewReport | DeferredToolRequests]:
+    settings = get_settings()
+    current = _current_deadline.get()
+    # Runs started outside a review_deadline block get a deadline of their own.
+    with (
+        review_deadline(str(uuid4()), settings.step_timeout)
+        if current is None
+        else contextlib.nullcontext(current)
+    ) as deadline:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise _errors.ReviewTimeoutError(deadline.run_id, deadline.timeout_seconds)
+        # A single model request never outlives the review's deadline.
+        model_settings: ModelSettings = {"timeout": min(settings.model_timeout, remaining)}
+        scope = asyncio.timeout_at(deadline.expires_at)
+        try:
+            # Each durable run needs its own workflow id; the review's run id spans them.
+            with SetWorkflowID(str(uuid4())), SetWorkflowTimeout(remaining):
+                async with scope:
+                    return await _dbos_boot.get_dbos_reviewer().run(
+                        prompt,
+                        message_history=message_history,
+                        deferred_tool_results=deferred_tool_results,
+                        model_settings=model_settings,
+                        event_stream_handler=_dbos_boot.event_stream_handler,
+                    )
+        except TimeoutError as exc:
+            if not scope.expired():
+                raise
+            raise _errors.ReviewTimeoutError(deadline.run_id, deadline.timeout_seconds) from exc
+        except (
+            _dbos_error.DBOSAwaitedWorkflowCancelledError,
+            _dbos_error.DBOSWorkflowCancelledError,
+        ) as exc:
+            raise _errors.ReviewTimeoutError(deadline.run_id, deadline.timeout_seconds) from exc
+
+
 def _review_prompt(manuscript: _documents.Manuscript) -> str:
     header = f"Review manuscript: {manuscript.title}\n"
     return f"{header}\n{manuscript.content_markdown}".strip()
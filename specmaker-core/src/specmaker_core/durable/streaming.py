@@ -0,0 +1,222 @@
+"""Fan-out of review progress events from durable agent runs to subscribers.
+
+The reviewer's ``event_stream_handler`` hands every :class:`AgentStreamEvent` to
+:func:`publish_agent_event`. Inside a :func:`publishing_to` block those events are
+translated into :mod:`~specmaker_core._dependencies.schemas.events` payloads and
+published to an :class:`EventFanout`. Publishing never blocks: each subscriber has
+a bounded buffer that drops its oldest events when full, so a slow subscriber
+cannot stall the model run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Final, cast
+
+import pydantic
+import pydantic_core
+from pydantic_ai import AgentStreamEvent
+from pydantic_ai.messages import (
+    FunctionToolCallEvent,
+    FunctionToolResultEvent,
+    PartDeltaEvent,
+    PartEndEvent,
+    PartStartEvent,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+    ToolCallPartDelta,
+)
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import events as _events
+
+DEFAULT_BUFFER_SIZE: Final[int] = 256
+
+# Structured output is returned through tools named "final_result" or "final_result_<Type>".
+_OUTPUT_TOOL_PREFIX: Final[str] = "final_result"
+
+
+class Subscription:
+    """Bounded, drop-oldest queue of events for one subscriber.
+
+    Iterate it to receive events until the publisher closes the fan-out. When
+    events were dropped, an :class:`~specmaker_core._dependencies.schemas.events.EventsDropped`
+    marker is delivered before the next retained event.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        self._events: deque[_events.ReviewEvent] = deque(maxlen=maxsize)
+        self._dropped = 0
+        self._closed = False
+        self._ready = asyncio.Event()
+
+    def put(self, event: _events.ReviewEvent) -> None:
+        """Append ``event``, discarding the oldest buffered event when full."""
+        if len(self._events) == self._events.maxlen:
+            self._dropped += 1
+        self._events.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop iteration once the buffered events are consumed."""
+        self._closed = True
+        self._ready.set()
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> _events.ReviewEvent:
+        while not self._events and not self._closed:
+            self._ready.clear()
+            await self._ready.wait()
+        if self._dropped:
+            dropped, self._dropped = self._dropped, 0
+            return _events.EventsDropped(count=dropped)
+        if self._events:
+            return self._events.popleft()
+        raise StopAsyncIteration
+
+
+class EventFanout:
+    """Delivers each published event to every subscriber without blocking."""
+
+    def __init__(self) -> None:
+        self._subscriptions: list[Subscription] = []
+
+    def subscribe(self, maxsize: int = DEFAULT_BUFFER_SIZE) -> Subscription:
+        """Return a new subscription that receives events published from now on."""
+        subscription = Subscription(maxsize)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def publish(self, event: _events.ReviewEvent) -> None:
+        """Buffer ``event`` for every subscriber."""
+        for subscription in self._subscriptions:
+            subscription.put(event)
+
+    def close(self) -> None:
+        """Signal the end of the stream to every subscriber."""
+        for subscription in self._subscriptions:
+            subscription.close()
+
+
+@dataclass
+class _OutputCall:
+    """Arguments of an output tool call accumulated from streamed deltas."""
+
+    args: str | dict[str, Any]
+    emitted: int = 0
+
+
+@dataclass
+class _Publisher:
+    """Translates the agent stream events of one or more runs for a fan-out."""
+
+    fanout: EventFanout
+    issues_found: int = 0
+    # Keyed by the task running the model and the response part index, so the
+    # concurrent runs of a chunked review do not mix up their output calls.
+    calls: dict[tuple[int, int], _OutputCall] = field(default_factory=lambda: {})
+
+    def handle(self, event: AgentStreamEvent) -> None:
+        task_id = id(asyncio.current_task())
+        if isinstance(event, PartStartEvent):
+            part = event.part
+            if isinstance(part, ThinkingPart):
+                self.fanout.publish(_events.ReviewProgress(stage="thinking"))
+            elif isinstance(part, TextPart):
+                self.fanout.publish(_events.ReviewProgress(stage="drafting"))
+            elif isinstance(part, ToolCallPart) and part.tool_name.startswith(_OUTPUT_TOOL_PREFIX):
+                self.fanout.publish(_events.ReviewProgress(stage="drafting"))
+                self.calls[task_id, event.index] = _OutputCall(args=part.args or "")
+                self._emit_issues(self.calls[task_id, event.index], final=False)
+        elif isinstance(event, PartDeltaEvent) and isinstance(event.delta, ToolCallPartDelta):
+            call = self.calls.get((task_id, event.index))
+            delta = event.delta.args_delta
+            if call is None or delta is None:
+                return
+            if isinstance(delta, str) and isinstance(call.args, str):
+                call.args += delta
+                # An earlier issue can only have completed once a later object opens or
+                # an object or list closes, so other deltas skip the re-parse.
+                if any(char in delta for char in "{}]"):
+                    self._emit_issues(call, final=False)
+            elif isinstance(delta, dict) and isinstance(call.args, dict):
+                call.args.update(delta)
+        elif isinstance(event, PartEndEvent):
+            call = self.calls.pop((task_id, event.index), None)
+            if call is not None:
+                self._emit_issues(call, final=True)
+        elif isinstance(event, FunctionToolCallEvent):
+            detail = event.part.tool_name
+            self.fanout.publish(_events.ReviewProgress(stage="tool_call", detail=detail))
+        elif isinstance(event, FunctionToolResultEvent):
+            detail = event.result.tool_name
+            self.fanout.publish(_events.ReviewProgress(stage="tool_result", detail=detail))
+
+    def _emit_issues(self, call: _OutputCall, *, final: bool) -> None:
+        raw_issues, closed = _partial_issues(call.args)
+        # The last issue may still be streaming unless the list has been closed.
+        complete = raw_issues if final or closed else raw_issues[:-1]
+        for raw_issue in complete[call.emitted :]:
+            call.emitted += 1
+            try:
+                issue = _documents.ReviewIssue.model_validate(raw_issue)
+            except pydantic.ValidationError:
+                continue
+            self.fanout.publish(_events.IssueFound(index=self.issues_found, issue=issue))
+            self.issues_found += 1
+
+
+_active_publisher: contextvars.ContextVar[_Publisher | None] = contextvars.ContextVar(
+    "specmaker_review_publisher", default=None
+)
+
+
+@contextlib.contextmanager
+def publishing_to(fanout: EventFanout) -> Iterator[None]:
+    """Publish agent stream events raised in the current context to ``fanout``.
+
+    The context is inherited by tasks created inside the block, so the concurrent
+    runs of a chunked review publish to the same fan-out.
+    """
+    reset_token = _active_publisher.set(_Publisher(fanout))
+    try:
+        yield
+    finally:
+        _active_publisher.reset(reset_token)
+
+
+def publish_agent_event(event: AgentStreamEvent) -> None:
+    """Translate ``event`` for the active fan-out; a no-op outside :func:`publishing_to`."""
+    publisher = _active_publisher.get()
+    if publisher is not None:
+        publisher.handle(event)
+
+
+def _partial_issues(args: str | dict[str, Any]) -> tuple[list[Any], bool]:
+    """Return the issues parsed so far and whether the issue list is complete."""
+    if isinstance(args, str):
+        try:
+            parsed: object = pydantic_core.from_json(args, allow_partial=True)
+        except ValueError:
+            return [], False
+    else:
+        parsed = args
+    if not isinstance(parsed, dict):
+        return [], False
+    fields = cast(dict[str, Any], parsed)
+    raw_issues = fields.get("issues")
+    if not isinstance(raw_issues, list):
+        return [], False
+    # Keys are parsed in order, so a key after "issues" means the list was closed.
+    return cast(list[Any], raw_issues), list(fields)[-1] != "issues"
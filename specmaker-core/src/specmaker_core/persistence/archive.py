@@ -0,0 +1,63 @@
+"""Streaming NDJSON files for exported and archived review records.
+
+Each line of a segment is one :class:`ReviewMetadata` serialized as JSON. Paths
+ending in ``.gz`` are gzip-compressed. Segments are written to a temporary file
+and renamed into place, so a segment is either complete or absent.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Final, Literal
+
+from specmaker_core.persistence.metadata import ReviewMetadata
+
+SEGMENT_SUFFIX: Final[str] = ".ndjson.gz"
+
+
+@contextmanager
+def _open_text(path: Path, mode: Literal["r", "w"]) -> Iterator[IO[str]]:
+    """Open ``path`` as UTF-8 text, transparently gzip-compressed for ``.gz`` paths."""
+    if path.suffix == ".gz":
+        with gzip.open(path, "wt" if mode == "w" else "rt", encoding="utf-8") as text:
+            yield text
+    else:
+        with path.open(mode, encoding="utf-8") as text:
+            yield text
+
+
+def write_segment(path: Path, records: Iterable[ReviewMetadata]) -> int:
+    """Write ``records`` to ``path`` one JSON document per line and return the count.
+
+    Records are consumed lazily, so memory stays bounded by a single record. The
+    file is fsynced before it is renamed into place.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Keep the original suffix so the partial file gets the same compression.
+    partial = path.with_name(f".partial-{path.name}")
+    written = 0
+    try:
+        with _open_text(partial, "w") as handle:
+            for record in records:
+                handle.write(record.model_dump_json())
+                handle.write("\n")
+                written += 1
+        with partial.open("rb") as handle:
+            os.fsync(handle.fileno())
+        partial.replace(path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return written
+
+
+def read_segment(path: Path) -> Iterator[ReviewMetadata]:
+    """Yield the records stored in a segment file, skipping blank lines."""
+    with _open_text(path, "r") as handle:
+        for line in handle:
+            if line.strip():
+                yield ReviewMetadata.model_validate_json(line)
@@ -0,0 +1,147 @@
+"""Content-addressed blob storage for review payloads shared across records."""
+
+from __future__ import annotations
+
+import itertools
+import zlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Final, Literal
+
+import pydantic
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies import errors as _errors
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import models as _models
+
+Codec = Literal["none", "zlib"]
+
+ZLIB_CODEC: Final[str] = "zlib"
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lookups.
+_FETCH_CHUNK_SIZE: Final[int] = 500
+
+
+@dataclass(frozen=True)
+class BlobEncoding:
+    """Storage encoding applied to blob contents before they are written."""
+
+    codec: Codec = "none"
+    min_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class Blob:
+    """Encoded payload ready to be written to ``review_blobs``.
+
+    ``codec`` is ``None`` for raw UTF-8 JSON and names the compression codec otherwise.
+    """
+
+    blob_hash: str
+    kind: str
+    content: bytes
+    codec: str | None = None
+
+
+def blob_for_model(
+    kind: str,
+    model: pydantic.BaseModel,
+    encoding: BlobEncoding = BlobEncoding(),
+) -> Blob:
+    """Encode a model as a blob keyed by its canonical content hash."""
+    content, codec = encode_content(model.model_dump_json().encode("utf-8"), encoding)
+    return Blob(
+        blob_hash=_serialization.content_hash(model),
+        kind=kind,
+        content=content,
+        codec=codec,
+    )
+
+
+def encode_content(raw: bytes, encoding: BlobEncoding) -> tuple[bytes, str | None]:
+    """Compress ``raw`` when the encoding asks for it and it actually saves space."""
+    if encoding.codec == ZLIB_CODEC and len(raw) >= encoding.min_bytes:
+        compressed = zlib.compress(raw)
+        if len(compressed) < len(raw):
+            return compressed, ZLIB_CODEC
+    return raw, None
+
+
+def decode_content(content: bytes, codec: str | None) -> bytes:
+    """Return the raw UTF-8 JSON bytes for stored blob contents."""
+    if codec is None:
+        return content
+    if codec == ZLIB_CODEC:
+        return zlib.decompress(content)
+    msg = f"Unknown review blob codec: {codec!r}"
+    raise _errors.PersistenceError(msg)
+
+
+def store_blobs(session: Session, blobs: Iterable[Blob]) -> None:
+    """Insert blobs that are not stored yet; existing hashes are left untouched."""
+    created_at = datetime.now(tz=UTC).isoformat()
+    rows = {
+        blob.blob_hash: {
+            "blob_hash": blob.blob_hash,
+            "kind": blob.kind,
+            "content": blob.content,
+            "codec": blob.codec,
+            "size_bytes": len(blob.content),
+            "created_at": created_at,
+        }
+        for blob in blobs
+    }
+    if not rows:
+        return
+    stmt = sqlite_insert(_models.ReviewBlob).on_conflict_do_nothing(index_elements=["blob_hash"])
+    session.execute(stmt, list(rows.values()))
+
+
+def fetch_blobs(session: Session, hashes: Iterable[str]) -> Mapping[str, bytes]:
+    """Return decoded blob contents keyed by hash for every hash that exists."""
+    blob = _models.ReviewBlob
+    contents: dict[str, bytes] = {}
+    for chunk in itertools.batched(set(hashes), _FETCH_CHUNK_SIZE, strict=False):
+        stmt = select(blob.blob_hash, blob.content, blob.codec).where(blob.blob_hash.in_(chunk))
+        for blob_hash, content, codec in session.execute(stmt).tuples():
+            contents[blob_hash] = decode_content(content, codec)
+    return contents
+
+
+def recode_blobs(session: Session, encoding: BlobEncoding, *, batch_size: int) -> int:
+    """Re-encode stored blobs with ``encoding``, committing once per batch.
+
+    Hashes are computed over the decoded content, so re-encoding never changes the
+    keys referenced by review records.
+
+    Returns:
+        The number of blobs whose stored bytes changed.
+    """
+    blob = _models.ReviewBlob
+    rewritten = 0
+    last_hash = ""
+    while True:
+        stmt = (
+            select(blob.blob_hash, blob.content, blob.codec)
+            .where(blob.blob_hash > last_hash)
+            .order_by(blob.blob_hash)
+            .limit(batch_size)
+        )
+        rows = session.execute(stmt).tuples().all()
+        if not rows:
+            return rewritten
+        for blob_hash, content, codec in rows:
+            encoded, new_codec = encode_content(decode_content(content, codec), encoding)
+            if new_codec != codec or encoded != content:
+                session.execute(
+                    update(blob)
+                    .where(blob.blob_hash == blob_hash)
+                    .values(content=encoded, codec=new_codec, size_bytes=len(encoded))
+                )
+                rewritten += 1
+        session.commit()
+        last_hash = rows[-1][0]
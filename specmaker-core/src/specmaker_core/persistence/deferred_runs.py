@@ -0,0 +1,78 @@
+"""Persistent registry of deferred review runs keyed by run id.
+
+A deferred review pauses until approvals arrive, which may be hours later and in
+another process. Storing the serialized outcome lets callers keep only the run id
+and resume after a restart. Payloads are compressed with the same encoding as
+review blobs, and entries expire after a time-to-live.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Delete, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import blobs as _blobs
+from specmaker_core.persistence import models as _models
+
+
+def store(
+    session: Session,
+    run_id: str,
+    payload: bytes,
+    *,
+    project_name: str,
+    ttl: datetime.timedelta,
+    encoding: _blobs.BlobEncoding,
+    now: datetime.datetime,
+) -> None:
+    """Insert or replace the payload for ``run_id`` and evict expired entries."""
+    if ttl <= datetime.timedelta(0):
+        msg = f"ttl must be positive, got {ttl}"
+        raise ValueError(msg)
+    entry = _models.DeferredRunRecord
+    content, codec = _blobs.encode_content(payload, encoding)
+    now_us = _serialization.epoch_microseconds(now)
+    values = {
+        "project_name": project_name,
+        "payload": content,
+        "codec": codec,
+        "size_bytes": len(payload),
+        "created_at_us": now_us,
+        "expires_at_us": now_us + ttl // datetime.timedelta(microseconds=1),
+    }
+    stmt = sqlite_insert(entry).values(run_id=run_id, **values)
+    session.execute(stmt.on_conflict_do_update(index_elements=["run_id"], set_=values))
+    evict_expired(session, now=now)
+
+
+def load(session: Session, run_id: str, *, now: datetime.datetime) -> bytes | None:
+    """Return the decoded payload for ``run_id``, or ``None`` if unknown or expired."""
+    entry = _models.DeferredRunRecord
+    row = session.execute(
+        select(entry.payload, entry.codec, entry.expires_at_us).where(entry.run_id == run_id)
+    ).first()
+    if row is None or row.expires_at_us <= _serialization.epoch_microseconds(now):
+        return None
+    return _blobs.decode_content(row.payload, row.codec)
+
+
+def remove(session: Session, run_id: str) -> bool:
+    """Delete the entry for ``run_id`` and return whether one existed."""
+    entry = _models.DeferredRunRecord
+    return _delete(session, delete(entry).where(entry.run_id == run_id)) > 0
+
+
+def evict_expired(session: Session, *, now: datetime.datetime) -> int:
+    """Delete entries whose time-to-live has elapsed and return how many were removed."""
+    entry = _models.DeferredRunRecord
+    cutoff_us = _serialization.epoch_microseconds(now)
+    return _delete(session, delete(entry).where(entry.expires_at_us <= cutoff_us))
+
+
+def _delete(session: Session, stmt: Delete) -> int:
+    return cast(CursorResult[Any], session.execute(stmt)).rowcount
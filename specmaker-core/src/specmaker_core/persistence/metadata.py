@@ -34,6 +34,75 @@ class ReviewMetadata(pydantic.BaseModel):
         return value or str(uuid.uuid4())
 
 
+class ReviewRecordSummary(pydantic.BaseModel):
+    """Scalar projection of a review record that avoids decoding JSON payloads.
+
+    Status and issue counts are ``None`` for records persisted before those columns
+    were denormalized. Load the full :class:`ReviewMetadata` on demand with
+    ``persistence_tools.load_review_record``.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    record_id: str
+    project_name: str
+    version: str
+    run_id: str
+    agent_name: str
+    created_at: datetime.datetime
+    approvals_requested: int
+    approvals_granted: int
+    status: _documents.ReviewStatus | None = None
+    issue_count: int | None = None
+    blocking_issue_count: int | None = None
+
+
+class StoredReviewIssue(pydantic.BaseModel):
+    """Review issue read back from the normalized review_issues table."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    record_id: str
+    project_name: str
+    created_at: datetime.datetime
+    fingerprint: str
+    issue: _documents.ReviewIssue
+
+
+class ReviewSearchHit(pydantic.BaseModel):
+    """Full-text search match over stored reviews.
+
+    ``rank`` is the FTS5 BM25 score, where lower values are better matches.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    record_id: str
+    project_name: str
+    title: str
+    rank: float
+    snippet: str
+
+
+class ProjectReviewStats(pydantic.BaseModel):
+    """Aggregated review counts and the latest review pointer for one project.
+
+    ``average_confidence_percent`` is ``None`` until a review with a known
+    confidence has been stored.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    project_name: str
+    review_count: int
+    pass_count: int
+    changes_required_count: int
+    blocked_count: int
+    average_confidence_percent: float | None
+    latest_record_id: str | None
+    latest_created_at: datetime.datetime | None
+
+
 def build_review_metadata(
     *,
     project_context: _shared.ProjectContext,
@@ -0,0 +1,220 @@
+"""Ordered schema migrations for the review database.
+
+Engine bootstrap creates missing tables and adds missing nullable columns, but it
+cannot backfill data or index existing tables. Migrations cover that gap: each one
+has a strictly increasing version, runs at most once per database, and is recorded
+in the schema_version table once it succeeds.
+
+Migrations run while an engine is bootstrapped and must be idempotent, because two
+processes may open the same database at the same time. Backfills commit in small
+batches so other writers are never locked out for the length of the whole scan.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Final
+
+import pydantic
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies import errors as _errors
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import blobs as _blobs
+from specmaker_core.persistence import models as _models
+from specmaker_core.persistence import stats as _stats
+
+LOGGER = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE: Final[int] = 1000
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single schema migration.
+
+    Attributes:
+        version: Position in the migration sequence; must be strictly increasing.
+        name: Short identifier recorded in schema_version.
+        apply: Callable receiving the engine and the backfill batch size.
+    """
+
+    version: int
+    name: str
+    apply: Callable[[Engine, int], None]
+
+
+def _backfill_created_at_us(engine: Engine, batch_size: int) -> None:
+    """Populate review_records.created_at_us from the ISO created_at column."""
+    record = _models.ReviewRecord
+    pending = (
+        select(record.record_id, record.created_at)
+        .where(record.created_at_us.is_(None))
+        .limit(batch_size)
+    )
+    stmt = (
+        update(record)
+        .where(record.record_id == bindparam("b_record_id"))
+        .values(created_at_us=bindparam("b_created_at_us"))
+    )
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(pending).all()
+            if not rows:
+                break
+            connection.execute(
+                stmt,
+                [
+                    {
+                        "b_record_id": record_id,
+                        "b_created_at_us": _serialization.epoch_microseconds(
+                            datetime.fromisoformat(created_at)
+                        ),
+                    }
+                    for record_id, created_at in rows
+                ],
+            )
+    _create_indexes(record.__tablename__, "created_at_us", engine=engine)
+
+
+def _index_blob_references(engine: Engine, _batch_size: int) -> None:
+    """Index the blob hash columns so orphaned blobs can be found without table scans."""
+    for column in ("project_context_hash", "manuscript_hash", "review_report_hash"):
+        _create_indexes(_models.ReviewRecord.__tablename__, column, engine=engine)
+
+
+def _create_indexes(table_name: str, column_name: str, *, engine: Engine) -> None:
+    """Create the model indexes on ``table_name`` that cover ``column_name``."""
+    with engine.begin() as connection:
+        for index in _models.Base.metadata.tables[table_name].indexes:
+            if column_name in index.columns:
+                index.create(connection, checkfirst=True)
+
+
+def _backfill_report_summaries(engine: Engine, batch_size: int) -> None:
+    """Denormalize report status, counts, and confidence for older rows, then rebuild stats.
+
+    Rows whose report cannot be decoded keep NULL summary columns and are skipped.
+    """
+    record = _models.ReviewRecord
+    stmt = (
+        update(record)
+        .where(record.record_id == bindparam("b_record_id"))
+        .values(
+            status=bindparam("b_status"),
+            issue_count=bindparam("b_issue_count"),
+            blocking_issue_count=bindparam("b_blocking_issue_count"),
+            confidence_percent=bindparam("b_confidence_percent"),
+        )
+    )
+    last_record_id = ""
+    with Session(bind=engine) as session:
+        while True:
+            rows = session.execute(
+                select(record.record_id, record.review_report_json, record.review_report_hash)
+                .where(
+                    record.record_id > last_record_id,
+                    or_(record.status.is_(None), record.confidence_percent.is_(None)),
+                )
+                .order_by(record.record_id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            payloads = _blobs.fetch_blobs(
+                session, [row.review_report_hash for row in rows if row.review_report_hash]
+            )
+            params: list[dict[str, object]] = []
+            for record_id, inline, report_hash in rows:
+                raw = payloads.get(report_hash) if report_hash else inline.encode("utf-8")
+                try:
+                    report = _documents.ReviewReport.model_validate_json(raw or b"")
+                except pydantic.ValidationError:
+                    LOGGER.warning("Skipping summary backfill for undecodable record %s", record_id)
+                    continue
+                params.append(
+                    {
+                        "b_record_id": record_id,
+                        "b_status": report.status,
+                        "b_issue_count": len(report.issues),
+                        "b_blocking_issue_count": sum(
+                            1 for issue in report.issues if issue.severity == "blocking"
+                        ),
+                        "b_confidence_percent": report.confidence_percent,
+                    }
+                )
+            if params:
+                session.connection().execute(stmt, params)
+            session.commit()
+            last_record_id = rows[-1].record_id
+        _stats.rebuild(session)
+        session.commit()
+
+
+MIGRATIONS: Final[tuple[Migration, ...]] = (
+    Migration(version=1, name="review_records_created_at_us", apply=_backfill_created_at_us),
+    Migration(version=2, name="review_records_blob_hash_indexes", apply=_index_blob_references),
+    Migration(version=3, name="project_review_stats", apply=_backfill_report_summaries),
+)
+
+
+def current_version(engine: Engine) -> int:
+    """Return the highest applied migration version, or 0 for an unversioned database."""
+    with engine.connect() as connection:
+        version = connection.execute(select(func.max(_models.SchemaVersion.version))).scalar()
+    return version or 0
+
+
+def run_migrations(
+    engine: Engine,
+    migrations: Sequence[Migration] = MIGRATIONS,
+    *,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> list[int]:
+    """Apply pending migrations in order and return the versions applied.
+
+    Raises:
+        ValueError: If migration versions are not strictly increasing.
+        PersistenceError: If the database was migrated by a newer release.
+    """
+    versions = [migration.version for migration in migrations]
+    if any(later <= earlier for earlier, later in itertools.pairwise(versions)):
+        msg = f"Migration versions must be strictly increasing, got {versions}"
+        raise ValueError(msg)
+
+    applied_version = current_version(engine)
+    latest = versions[-1] if versions else 0
+    if applied_version > latest:
+        msg = (
+            f"Database schema version {applied_version} is newer than the latest "
+            f"supported version {latest}"
+        )
+        raise _errors.PersistenceError(msg)
+
+    applied: list[int] = []
+    for migration in migrations:
+        if migration.version <= applied_version:
+            continue
+        LOGGER.info("Applying schema migration %d (%s)", migration.version, migration.name)
+        migration.apply(engine, batch_size)
+        with engine.begin() as connection:
+            # Another process may have finished the same migration concurrently.
+            connection.execute(
+                sqlite_insert(_models.SchemaVersion)
+                .values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.now(tz=UTC).isoformat(),
+                )
+                .on_conflict_do_nothing(index_elements=["version"])
+            )
+        applied.append(migration.version)
+    return applied
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Index, String, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -20,6 +28,21 @@ class ReviewRecord(Base):
     The composite unique constraint on (project_name, version, run_id) prevents data
     loss when multiple review runs complete within the same second. The version field
     uses second-level timestamps, so run_id distinguishes concurrent completions.
+
+    The status, issue count, and confidence columns are denormalized from the review
+    report so listings and aggregates can be served without decoding JSON. They are
+    nullable because rows written before they existed have no values until the
+    schema migrations backfill them.
+
+    Project contexts, manuscripts, and review reports are stored in review_blobs and
+    referenced by content hash. When a hash column is set, the matching inline JSON
+    column holds an empty string; it keeps its NOT NULL constraint so older databases
+    stay writable.
+
+    created_at_us mirrors created_at as integer microseconds since the Unix epoch so
+    ordering and time-range scans compare integers instead of ISO strings. It is
+    backfilled for older rows by the schema migrations in
+    :mod:`specmaker_core.persistence.migrations`.
     """
 
     __tablename__ = "review_records"
@@ -35,8 +58,165 @@ class ReviewRecord(Base):
     project_context_json: Mapped[str] = mapped_column(String, nullable=False)
     manuscript_json: Mapped[str] = mapped_column(String, nullable=False)
     review_report_json: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str | None] = mapped_column(String, nullable=True)
+    issue_count: Mapped[int | None] = mapped_column(nullable=True)
+    blocking_issue_count: Mapped[int | None] = mapped_column(nullable=True)
+    project_context_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    manuscript_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    review_report_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at_us: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    confidence_percent: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     __table_args__ = (
         UniqueConstraint("project_name", "version", "run_id", name="uq_project_version_run"),
         Index("idx_review_records_project", "project_name", "created_at"),
+        Index("idx_review_records_project_time", "project_name", "created_at_us", "record_id"),
+        Index("idx_review_records_time", "created_at_us", "record_id"),
+        Index("idx_review_records_project_context_hash", "project_context_hash"),
+        Index("idx_review_records_manuscript_hash", "manuscript_hash"),
+        Index("idx_review_records_review_report_hash", "review_report_hash"),
+    )
+
+
+class ReviewBlob(Base):
+    """Content-addressed JSON payload shared by review records.
+
+    Blobs are keyed by the canonical SHA-256 hash of their content, so identical
+    project contexts and manuscripts are stored once no matter how many reviews
+    reference them. The content is immutable once written, but its storage encoding
+    may change: codec is NULL for raw UTF-8 JSON or names the compression codec.
+    """
+
+    __tablename__ = "review_blobs"
+
+    blob_hash: Mapped[str] = mapped_column(String, primary_key=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    codec: Mapped[str | None] = mapped_column(String, nullable=True)
+    size_bytes: Mapped[int] = mapped_column(nullable=False)
+    created_at: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class ReviewIssueRecord(Base):
+    """ORM model for review issues exploded out of review reports.
+
+    Rows are rewritten in the same transaction as their parent review record, and
+    project_name/created_at are copied from the parent so triage queries can be
+    answered from the indexes without joining or decoding review reports.
+    """
+
+    __tablename__ = "review_issues"
+
+    record_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("review_records.record_id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    position: Mapped[int] = mapped_column(primary_key=True)
+    issue_id: Mapped[str] = mapped_column(String, nullable=False)
+    project_name: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[str] = mapped_column(String, nullable=False)
+    category: Mapped[str] = mapped_column(String, nullable=False)
+    severity: Mapped[str] = mapped_column(String, nullable=False)
+    location: Mapped[str | None] = mapped_column(String, nullable=True)
+    message: Mapped[str] = mapped_column(String, nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String, nullable=False)
+
+    __table_args__ = (
+        Index("idx_review_issues_project_severity", "project_name", "severity", "created_at"),
+        Index("idx_review_issues_project_category", "project_name", "category", "created_at"),
+        Index("idx_review_issues_fingerprint", "fingerprint"),
+    )
+
+
+class SchemaVersion(Base):
+    """Applied schema migration, one row per migration version."""
+
+    __tablename__ = "schema_version"
+
+    version: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    applied_at: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class ProjectReviewStatsRecord(Base):
+    """Per-project review aggregates maintained alongside review_records.
+
+    Counters are adjusted by deltas in the same transaction as every save or delete,
+    so reads are a primary-key lookup. Records whose report could not be decoded
+    count toward review_count only. The latest pointer follows the
+    (created_at_us, record_id) ordering used by review listings.
+    """
+
+    __tablename__ = "project_review_stats"
+
+    project_name: Mapped[str] = mapped_column(String, primary_key=True)
+    review_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    pass_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    changes_required_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    blocked_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    confidence_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    latest_record_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    latest_created_at_us: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
+
+class ReviewCacheRecord(Base):
+    """Cached review report keyed by a hash of everything that determines the output.
+
+    The key covers the manuscript, the rendered reviewer instructions, the model, and
+    the settings that influence generation, so a changed input is simply a miss.
+    last_used_at_us drives least-recently-used eviction once the cache is full.
+    """
+
+    __tablename__ = "review_cache"
+
+    cache_key: Mapped[str] = mapped_column(String, primary_key=True)
+    review_report_json: Mapped[str] = mapped_column(String, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(nullable=False)
+    hit_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    created_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    last_used_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        Index("idx_review_cache_created", "created_at_us"),
+        Index("idx_review_cache_last_used", "last_used_at_us"),
     )
+
+
+class DeferredRunRecord(Base):
+    """Deferred review outcome stored so it can be resumed by run id after a restart.
+
+    The payload is the serialized outcome, encoded like review_blobs contents: codec
+    is NULL for raw UTF-8 JSON or names the compression codec. Rows past
+    expires_at_us are never resumed and are evicted.
+    """
+
+    __tablename__ = "deferred_runs"
+
+    run_id: Mapped[str] = mapped_column(String, primary_key=True)
+    project_name: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    codec: Mapped[str | None] = mapped_column(String, nullable=True)
+    size_bytes: Mapped[int] = mapped_column(nullable=False)
+    created_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    expires_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        Index("idx_deferred_runs_expires", "expires_at_us"),
+        Index("idx_deferred_runs_project", "project_name", "created_at_us"),
+    )
+
+
+class RateLimitBucketRecord(Base):
+    """Token-bucket state shared by processes rate limiting model calls.
+
+    level is the bucket's remaining capacity as of updated_at_us; it goes negative
+    while reservations are queued behind it.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    level: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,243 @@
+"""Retention policies and space reclamation for review databases.
+
+Pruning itself lives in ``persistence_tools.prune_reviews``; this module holds the
+policy, the per-project pruning boundaries, orphaned blob collection, and the
+incremental VACUUM loop. Every write runs in its own short transaction so live
+reviews only ever wait for one batch.
+"""
+
+from __future__ import annotations
+
+import datetime
+import itertools
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Final, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    CursorResult,
+    and_,
+    delete,
+    exists,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import models as _models
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_VACUUM_PAGES: Final[int] = 256
+
+# PRAGMA auto_vacuum value reported for INCREMENTAL mode.
+_AUTO_VACUUM_INCREMENTAL: Final[int] = 2
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which review records to keep for each project.
+
+    Attributes:
+        keep_last: Always keep this many of the newest records per project.
+        older_than: Only prune records created longer ago than this.
+
+    When both are set, a record is pruned only if it falls outside the newest
+    ``keep_last`` records of its project and is older than ``older_than``.
+    """
+
+    keep_last: int | None = None
+    older_than: datetime.timedelta | None = None
+
+    def __post_init__(self) -> None:
+        if self.keep_last is None and self.older_than is None:
+            msg = "RetentionPolicy requires keep_last, older_than, or both"
+            raise ValueError(msg)
+        if self.keep_last is not None and self.keep_last < 0:
+            msg = f"keep_last must not be negative, got {self.keep_last}"
+            raise ValueError(msg)
+        if self.older_than is not None and self.older_than < datetime.timedelta(0):
+            msg = f"older_than must not be negative, got {self.older_than}"
+            raise ValueError(msg)
+
+
+def pruning_boundaries(
+    session: Session,
+    policy: RetentionPolicy,
+    *,
+    now: datetime.datetime | None = None,
+) -> dict[str, tuple[int, str]]:
+    """Return, per project, the ``(created_at_us, record_id)`` key records must be below.
+
+    Records with a key strictly less than their project's boundary are pruned (see
+    :func:`prunable`). Projects with nothing to prune are omitted.
+    """
+    record = _models.ReviewRecord
+    cutoff: tuple[int, str] | None = None
+    if policy.older_than is not None:
+        moment = (now or datetime.datetime.now(tz=datetime.UTC)) - policy.older_than
+        # Every record_id sorts after "", so this bound compares on the timestamp alone.
+        cutoff = (_serialization.epoch_microseconds(moment), "")
+
+    boundaries: dict[str, tuple[int, str]] = {}
+    for project_name in session.execute(select(record.project_name).distinct()).scalars():
+        candidates: list[tuple[int, str]] = []
+        if cutoff is not None:
+            candidates.append(cutoff)
+        if policy.keep_last is not None:
+            oldest_kept = session.execute(
+                select(record.created_at_us, record.record_id)
+                .where(record.project_name == project_name, record.created_at_us.is_not(None))
+                .order_by(record.created_at_us.desc(), record.record_id.desc())
+                .offset(max(policy.keep_last - 1, 0))
+                .limit(1)
+            ).first()
+            if oldest_kept is None:
+                continue
+            if policy.keep_last == 0:
+                # Keep nothing: the boundary lies just past the newest record.
+                candidates.append((oldest_kept.created_at_us + 1, ""))
+            else:
+                candidates.append((oldest_kept.created_at_us, oldest_kept.record_id))
+        boundary = min(candidates)
+        if session.execute(select(exists().where(prunable(project_name, boundary)))).scalar():
+            boundaries[project_name] = boundary
+    return boundaries
+
+
+def prunable(project_name: str, boundary: tuple[int, str]) -> ColumnElement[bool]:
+    """Return the filter matching records of ``project_name`` below its ``boundary``."""
+    record = _models.ReviewRecord
+    boundary_us, boundary_id = boundary
+    return and_(
+        record.project_name == project_name,
+        record.created_at_us <= boundary_us,
+        or_(
+            record.created_at_us < boundary_us,
+            and_(record.created_at_us == boundary_us, record.record_id < boundary_id),
+        ),
+    )
+
+
+def delete_orphaned_blobs(session: Session, *, batch_size: int) -> int:
+    """Delete blobs no review record references, one transaction per batch.
+
+    The reference check runs inside each DELETE, so a record saved concurrently
+    with the scan keeps its blobs.
+    """
+    blob = _models.ReviewBlob
+    record = _models.ReviewRecord
+    referenced = exists().where(
+        or_(
+            record.project_context_hash == blob.blob_hash,
+            record.manuscript_hash == blob.blob_hash,
+            record.review_report_hash == blob.blob_hash,
+        )
+    )
+    deleted = 0
+    last_hash = ""
+    while True:
+        hashes = (
+            session.execute(
+                select(blob.blob_hash)
+                .where(blob.blob_hash > last_hash)
+                .order_by(blob.blob_hash)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not hashes:
+            return deleted
+        result = cast(
+            CursorResult[Any],
+            session.execute(delete(blob).where(blob.blob_hash.in_(hashes), ~referenced)),
+        )
+        session.commit()
+        deleted += result.rowcount
+        last_hash = hashes[-1]
+
+
+def enable_incremental_vacuum(engine: Engine) -> bool:
+    """Switch the database to ``auto_vacuum=INCREMENTAL`` and report whether it changed.
+
+    Databases created before incremental vacuum was enabled need a one-off full
+    ``VACUUM`` to switch modes. That rewrite holds an exclusive lock for its whole
+    duration, so run it during maintenance rather than while reviews are active.
+    """
+    with engine.connect() as connection:
+        if _auto_vacuum_mode(connection) == _AUTO_VACUUM_INCREMENTAL:
+            return False
+        connection.rollback()
+        driver = _driver_connection(connection)
+        previous = driver.isolation_level
+        # VACUUM cannot run inside a transaction, so drive it in autocommit mode.
+        driver.isolation_level = None
+        try:
+            driver.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            driver.execute("VACUUM")
+        finally:
+            driver.isolation_level = previous
+    # Pooled connections opened before the rewrite keep reporting the old mode.
+    engine.dispose()
+    return True
+
+
+def incremental_vacuum(
+    engine: Engine,
+    *,
+    pages_per_step: int = DEFAULT_VACUUM_PAGES,
+    max_steps: int | None = None,
+    pause: float = 0.0,
+) -> int:
+    """Return free pages to the filesystem in steps of ``pages_per_step``.
+
+    Each step is its own short write transaction, optionally followed by ``pause``
+    seconds so queued writers can run. Databases not in INCREMENTAL mode are left
+    untouched (see :func:`enable_incremental_vacuum`).
+
+    Returns:
+        The number of pages released.
+    """
+    if pages_per_step < 1:
+        msg = f"pages_per_step must be positive, got {pages_per_step}"
+        raise ValueError(msg)
+    released = 0
+    with engine.connect() as connection:
+        if _auto_vacuum_mode(connection) != _AUTO_VACUUM_INCREMENTAL:
+            LOGGER.info("Skipping incremental vacuum: auto_vacuum is not INCREMENTAL")
+            return 0
+        for step in itertools.count():
+            if max_steps is not None and step >= max_steps:
+                break
+            free_pages = _pragma_int(connection, "freelist_count")
+            if free_pages == 0:
+                break
+            # sqlite3 frees one page per step of the pragma, so step it to completion.
+            _driver_connection(connection).execute(
+                f"PRAGMA incremental_vacuum({pages_per_step})"
+            ).fetchall()
+            connection.commit()
+            released += free_pages - _pragma_int(connection, "freelist_count")
+            if pause:
+                time.sleep(pause)
+    return released
+
+
+def _driver_connection(connection: Connection) -> sqlite3.Connection:
+    return cast(sqlite3.Connection, connection.connection.driver_connection)
+
+
+def _auto_vacuum_mode(connection: Connection) -> int:
+    return _pragma_int(connection, "auto_vacuum")
+
+
+def _pragma_int(connection: Connection, name: str) -> int:
+    return int(connection.execute(text(f"PRAGMA {name}")).scalar_one())
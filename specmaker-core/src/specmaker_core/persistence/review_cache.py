@@ -0,0 +1,187 @@
+"""Persistent cache of review reports keyed by the inputs that produced them.
+
+A review depends only on the manuscript, the reviewer instructions, the model, and
+the generation settings, so an unchanged manuscript can reuse the report of an
+earlier run instead of paying for another model call. Entries expire after a
+maximum age and the least recently used ones are evicted once the cache holds more
+than a maximum number of entries.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Final, cast
+
+import pydantic
+from sqlalchemy import CursorResult, Delete, delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import models as _models
+
+# Bump when the key layout changes so stale entries are never matched.
+_KEY_VERSION: Final[int] = 1
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Eviction limits for the review cache.
+
+    Attributes:
+        max_entries: Entries kept before the least recently used are evicted.
+        max_age: Entries older than this are never served and are evicted.
+    """
+
+    max_entries: int
+    max_age: datetime.timedelta
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            msg = f"max_entries must be positive, got {self.max_entries}"
+            raise ValueError(msg)
+        if self.max_age <= datetime.timedelta(0):
+            msg = f"max_age must be positive, got {self.max_age}"
+            raise ValueError(msg)
+
+
+def cache_key(
+    manuscript: _documents.Manuscript,
+    *,
+    instructions: str,
+    model: str,
+    settings: Mapping[str, object],
+) -> str:
+    """Return the canonical hash identifying a review of ``manuscript``.
+
+    Only the manuscript fields the reviewer sees are hashed, so re-creating an
+    identical manuscript later still hits the cache.
+    """
+    return _serialization.content_hash(
+        {
+            "version": _KEY_VERSION,
+            "manuscript": {
+                "title": manuscript.title,
+                "content_markdown": manuscript.content_markdown,
+                "style_rules": manuscript.style_rules,
+            },
+            "instructions": instructions,
+            "model": model,
+            "settings": dict(settings),
+        }
+    )
+
+
+def lookup(
+    session: Session,
+    key: str,
+    *,
+    policy: CachePolicy,
+    now: datetime.datetime,
+) -> _documents.ReviewReport | None:
+    """Return the cached report for ``key`` and mark it used, or ``None`` on a miss.
+
+    Expired entries and entries that no longer decode are treated as misses.
+    """
+    report = find(session, key, policy=policy, now=now)
+    if report is not None:
+        touch(session, key, now=now)
+    return report
+
+
+def find(
+    session: Session,
+    key: str,
+    *,
+    policy: CachePolicy,
+    now: datetime.datetime,
+) -> _documents.ReviewReport | None:
+    """Return the cached report for ``key`` without writing, or ``None`` on a miss.
+
+    Use with a read-only session, then :func:`touch` the entry on a hit.
+    """
+    entry = _models.ReviewCacheRecord
+    now_us = _serialization.epoch_microseconds(now)
+    row = session.execute(
+        select(entry.review_report_json, entry.created_at_us).where(entry.cache_key == key)
+    ).first()
+    if row is None or row.created_at_us < now_us - _age_us(policy):
+        return None
+    try:
+        return _documents.ReviewReport.model_validate_json(row.review_report_json)
+    except pydantic.ValidationError:
+        return None
+
+
+def touch(session: Session, key: str, *, now: datetime.datetime) -> None:
+    """Count a hit on ``key`` and refresh its last use for LRU eviction."""
+    entry = _models.ReviewCacheRecord
+    session.execute(
+        update(entry)
+        .where(entry.cache_key == key)
+        .values(
+            hit_count=entry.hit_count + 1,
+            last_used_at_us=_serialization.epoch_microseconds(now),
+        )
+    )
+
+
+def store(
+    session: Session,
+    key: str,
+    report: _documents.ReviewReport,
+    *,
+    policy: CachePolicy,
+    now: datetime.datetime,
+) -> None:
+    """Insert or refresh the entry for ``key`` and evict entries beyond ``policy``."""
+    entry = _models.ReviewCacheRecord
+    now_us = _serialization.epoch_microseconds(now)
+    payload = report.model_dump_json()
+    values = {
+        "review_report_json": payload,
+        "size_bytes": len(payload.encode("utf-8")),
+        "created_at_us": now_us,
+        "last_used_at_us": now_us,
+    }
+    stmt = sqlite_insert(entry).values(cache_key=key, hit_count=0, **values)
+    session.execute(stmt.on_conflict_do_update(index_elements=["cache_key"], set_=values))
+    evict(session, policy=policy, now=now)
+
+
+def evict(session: Session, *, policy: CachePolicy, now: datetime.datetime) -> int:
+    """Delete expired entries, then the least recently used beyond ``max_entries``.
+
+    Returns:
+        The number of entries deleted.
+    """
+    entry = _models.ReviewCacheRecord
+    cutoff_us = _serialization.epoch_microseconds(now) - _age_us(policy)
+    deleted = _delete(session, delete(entry).where(entry.created_at_us < cutoff_us))
+    overflow = session.execute(select(func.count()).select_from(entry)).scalar_one()
+    overflow -= policy.max_entries
+    if overflow > 0:
+        oldest = (
+            select(entry.cache_key)
+            .order_by(entry.last_used_at_us, entry.cache_key)
+            .limit(overflow)
+            .scalar_subquery()
+        )
+        deleted += _delete(session, delete(entry).where(entry.cache_key.in_(oldest)))
+    return deleted
+
+
+def clear(session: Session) -> int:
+    """Delete every cache entry and return how many were removed."""
+    return _delete(session, delete(_models.ReviewCacheRecord))
+
+
+def _age_us(policy: CachePolicy) -> int:
+    return policy.max_age // datetime.timedelta(microseconds=1)
+
+
+def _delete(session: Session, stmt: Delete) -> int:
+    return cast(CursorResult[Any], session.execute(stmt)).rowcount
@@ -0,0 +1,141 @@
+"""SQLite FTS5 full-text index over review manuscripts, summaries, and issues.
+
+The review_search virtual table is maintained alongside review_records: every save
+replaces the indexed rows of the records it writes, and the index can be rebuilt
+from stored records at any time. SQLite builds without FTS5 simply skip the table;
+searching then raises :class:`~specmaker_core._dependencies.errors.PersistenceError`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import sqlite3
+from collections.abc import Iterable
+from typing import Final
+
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies import errors as _errors
+from specmaker_core.persistence.metadata import ReviewMetadata, ReviewSearchHit
+
+LOGGER = logging.getLogger(__name__)
+
+SEARCH_TABLE: Final[str] = "review_search"
+
+_CREATE_SEARCH_TABLE: Final[str] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    "record_id UNINDEXED, project_name UNINDEXED, title, content, summary, issues, "
+    "tokenize = 'porter unicode61')"
+)
+
+_SNIPPET_TOKENS: Final[int] = 16
+_KEY_CHUNK_SIZE: Final[int] = 300
+
+
+def create_search_table(connection: Connection) -> bool:
+    """Create the FTS5 table if SQLite supports it and report whether it exists."""
+    try:
+        connection.exec_driver_sql(_CREATE_SEARCH_TABLE)
+    except OperationalError as exc:
+        if not _is_missing_fts5(exc):
+            raise
+        LOGGER.warning("SQLite FTS5 is unavailable; review search is disabled")
+        return False
+    return True
+
+
+def has_search_table(session: Session) -> bool:
+    """Return whether the review_search table exists in the session's database."""
+    stmt = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+    return session.execute(stmt, {"name": SEARCH_TABLE}).first() is not None
+
+
+def require_search_table(session: Session) -> None:
+    """Raise when the database has no review_search table."""
+    if not has_search_table(session):
+        msg = "Review search is unavailable: SQLite was built without FTS5"
+        raise _errors.PersistenceError(msg)
+
+
+def delete_records(session: Session, record_ids: Iterable[str]) -> None:
+    """Remove indexed rows for the given records."""
+    for chunk in itertools.batched(record_ids, _KEY_CHUNK_SIZE, strict=False):
+        placeholders = ", ".join(f":id_{index}" for index in range(len(chunk)))
+        session.execute(
+            text(f"DELETE FROM {SEARCH_TABLE} WHERE record_id IN ({placeholders})"),
+            {f"id_{index}": record_id for index, record_id in enumerate(chunk)},
+        )
+
+
+def index_records(session: Session, records: Iterable[ReviewMetadata]) -> None:
+    """Index the searchable text of each record; callers delete stale rows first."""
+    rows = [
+        {
+            "record_id": metadata.record_id,
+            "project_name": metadata.project_context.project_name,
+            "title": metadata.manuscript.title,
+            "content": metadata.manuscript.content_markdown,
+            "summary": metadata.review_report.summary,
+            "issues": "\n".join(issue.message for issue in metadata.review_report.issues),
+        }
+        for metadata in records
+    ]
+    if not rows:
+        return
+    session.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} "
+            "(record_id, project_name, title, content, summary, issues) "
+            "VALUES (:record_id, :project_name, :title, :content, :summary, :issues)"
+        ),
+        rows,
+    )
+
+
+def clear(session: Session) -> None:
+    """Remove every indexed row."""
+    session.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+
+
+def search(
+    session: Session,
+    query: str,
+    *,
+    project_name: str | None,
+    limit: int,
+) -> list[ReviewSearchHit]:
+    """Run an FTS5 MATCH query and return hits ordered by BM25 relevance."""
+    require_search_table(session)
+    stmt = (
+        f"SELECT record_id, project_name, title, rank, "
+        f"snippet({SEARCH_TABLE}, -1, '[', ']', '…', {_SNIPPET_TOKENS}) AS snippet "
+        f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :query"
+    )
+    params: dict[str, object] = {"query": query, "limit": limit}
+    if project_name is not None:
+        stmt += " AND project_name = :project_name"
+        params["project_name"] = project_name
+    stmt += " ORDER BY rank LIMIT :limit"
+    try:
+        rows = session.execute(text(stmt), params).all()
+    except OperationalError as exc:
+        msg = f"Invalid review search query {query!r}: {exc.orig}"
+        raise _errors.ValidationError(msg) from exc
+    return [
+        ReviewSearchHit(
+            record_id=row.record_id,
+            project_name=row.project_name,
+            title=row.title,
+            rank=row.rank,
+            snippet=row.snippet,
+        )
+        for row in rows
+    ]
+
+
+def _is_missing_fts5(exc: OperationalError) -> bool:
+    """Return whether ``exc`` reports that the fts5 module is not compiled in."""
+    return isinstance(exc.orig, sqlite3.OperationalError) and "fts5" in str(exc.orig)
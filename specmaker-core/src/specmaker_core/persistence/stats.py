@@ -0,0 +1,213 @@
+"""Incremental maintenance of the project_review_stats aggregate table.
+
+Writers describe what they remove and add as :class:`StatsContribution` values;
+:func:`apply_changes` folds those into per-project deltas and applies them with a
+single upsert, then re-seeks each touched project's latest record through the
+``(project_name, created_at_us, record_id)`` index. Callers run it inside the
+transaction that changes review_records so the aggregates never drift.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Final
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import models as _models
+from specmaker_core.persistence.metadata import ProjectReviewStats, ReviewMetadata
+
+_KEY_CHUNK_SIZE: Final[int] = 300
+
+_STATUS_COLUMNS: Final[dict[str, str]] = {
+    "pass": "pass_count",
+    "changes_required": "changes_required_count",
+    "blocked": "blocked_count",
+}
+
+_COUNTER_COLUMNS: Final[tuple[str, ...]] = (
+    "review_count",
+    *_STATUS_COLUMNS.values(),
+    "confidence_sum",
+    "confidence_count",
+)
+
+
+@dataclass(frozen=True)
+class StatsContribution:
+    """What one stored review record adds to its project's aggregates."""
+
+    project_name: str
+    status: str | None
+    confidence_percent: float | None
+
+    @classmethod
+    def from_metadata(cls, metadata: ReviewMetadata) -> StatsContribution:
+        """Describe the contribution of a record about to be written."""
+        return cls(
+            project_name=metadata.project_context.project_name,
+            status=metadata.review_report.status,
+            confidence_percent=metadata.review_report.confidence_percent,
+        )
+
+
+@dataclass
+class _Delta:
+    counters: dict[str, float] = field(default_factory=lambda: dict.fromkeys(_COUNTER_COLUMNS, 0))
+
+    def add(self, contribution: StatsContribution, sign: int) -> None:
+        self.counters["review_count"] += sign
+        if contribution.status in _STATUS_COLUMNS:
+            self.counters[_STATUS_COLUMNS[contribution.status]] += sign
+        if contribution.confidence_percent is not None:
+            self.counters["confidence_sum"] += sign * contribution.confidence_percent
+            self.counters["confidence_count"] += sign
+
+
+def fetch_contributions(session: Session, record_ids: Iterable[str]) -> list[StatsContribution]:
+    """Return the contributions of the stored records among ``record_ids``."""
+    record = _models.ReviewRecord
+    contributions: list[StatsContribution] = []
+    for chunk in itertools.batched(record_ids, _KEY_CHUNK_SIZE, strict=False):
+        stmt = select(record.project_name, record.status, record.confidence_percent).where(
+            record.record_id.in_(chunk)
+        )
+        contributions.extend(
+            StatsContribution(project_name, status, confidence)
+            for project_name, status, confidence in session.execute(stmt).tuples()
+        )
+    return contributions
+
+
+def apply_changes(
+    session: Session,
+    *,
+    removed: Iterable[StatsContribution] = (),
+    added: Iterable[StatsContribution] = (),
+) -> None:
+    """Adjust project aggregates for records removed from and added to review_records.
+
+    Must run after review_records has been changed, within the same transaction.
+    """
+    deltas: dict[str, _Delta] = {}
+    for sign, contributions in ((-1, removed), (1, added)):
+        for contribution in contributions:
+            deltas.setdefault(contribution.project_name, _Delta()).add(contribution, sign)
+    if not deltas:
+        return
+
+    stats = _models.ProjectReviewStatsRecord
+    stmt = sqlite_insert(stats)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_name"],
+        set_={
+            column: getattr(stats, column) + stmt.excluded[column] for column in _COUNTER_COLUMNS
+        },
+    )
+    session.execute(
+        stmt,
+        [{"project_name": project, **delta.counters} for project, delta in deltas.items()],
+    )
+    refresh_latest(session, deltas)
+
+
+def refresh_latest(session: Session, project_names: Iterable[str]) -> None:
+    """Re-point each project's latest record and drop projects with no records left."""
+    record = _models.ReviewRecord
+    stats = _models.ProjectReviewStatsRecord
+    emptied: list[str] = []
+    for project_name in project_names:
+        latest = session.execute(
+            select(record.record_id, record.created_at_us)
+            .where(record.project_name == project_name, record.created_at_us.is_not(None))
+            .order_by(record.created_at_us.desc(), record.record_id.desc())
+            .limit(1)
+        ).first()
+        if latest is None and not _has_records(session, project_name):
+            emptied.append(project_name)
+            continue
+        session.execute(
+            update(stats)
+            .where(stats.project_name == project_name)
+            .values(
+                latest_record_id=latest.record_id if latest is not None else None,
+                latest_created_at_us=latest.created_at_us if latest is not None else None,
+            )
+        )
+    for chunk in itertools.batched(emptied, _KEY_CHUNK_SIZE, strict=False):
+        session.execute(delete(stats).where(stats.project_name.in_(chunk)))
+
+
+def rebuild(session: Session) -> int:
+    """Recompute every project's aggregates from review_records and return the count."""
+    record = _models.ReviewRecord
+    stats = _models.ProjectReviewStatsRecord
+    session.execute(delete(stats))
+    aggregates = select(
+        record.project_name,
+        func.count(),
+        *(
+            func.count().filter(record.status == status).label(column)
+            for status, column in _STATUS_COLUMNS.items()
+        ),
+        func.coalesce(func.sum(record.confidence_percent), 0.0),
+        func.count(record.confidence_percent),
+    ).group_by(record.project_name)
+    session.execute(
+        sqlite_insert(stats).from_select(["project_name", *_COUNTER_COLUMNS], aggregates)
+    )
+    projects = session.execute(select(stats.project_name)).scalars().all()
+    refresh_latest(session, projects)
+    return len(projects)
+
+
+def get(session: Session, project_name: str) -> ProjectReviewStats | None:
+    """Return the aggregates for ``project_name`` by primary key."""
+    stats = _models.ProjectReviewStatsRecord
+    # Pollers reuse sessions, so always refresh rows already in the identity map.
+    stmt = (
+        select(stats)
+        .where(stats.project_name == project_name)
+        .execution_options(populate_existing=True)
+    )
+    row = session.execute(stmt).scalar_one_or_none()
+    return _to_model(row) if row is not None else None
+
+
+def list_all(session: Session) -> list[ProjectReviewStats]:
+    """Return the aggregates of every project ordered by name."""
+    stats = _models.ProjectReviewStatsRecord
+    stmt = select(stats).order_by(stats.project_name).execution_options(populate_existing=True)
+    rows = session.execute(stmt).scalars()
+    return [_to_model(row) for row in rows]
+
+
+def _has_records(session: Session, project_name: str) -> bool:
+    record = _models.ReviewRecord
+    stmt = select(record.record_id).where(record.project_name == project_name).limit(1)
+    return session.execute(stmt).first() is not None
+
+
+def _to_model(row: _models.ProjectReviewStatsRecord) -> ProjectReviewStats:
+    latest_created_at = (
+        _serialization.from_epoch_microseconds(row.latest_created_at_us)
+        if row.latest_created_at_us is not None
+        else None
+    )
+    return ProjectReviewStats(
+        project_name=row.project_name,
+        review_count=row.review_count,
+        pass_count=row.pass_count,
+        changes_required_count=row.changes_required_count,
+        blocked_count=row.blocked_count,
+        average_confidence_percent=(
+            row.confidence_sum / row.confidence_count if row.confidence_count else None
+        ),
+        latest_record_id=row.latest_record_id,
+        latest_created_at=latest_created_at,
+    )
@@ -1,20 +1,55 @@
-"""SQLite storage helpers for durable review persistence."""
+"""SQLite storage helpers for durable review persistence.
+
+Each database gets two engines. The writer engine owns a single connection, so
+writes from one process are serialized in the pool instead of racing for SQLite's
+lock, and its transactions start with ``BEGIN IMMEDIATE`` so lock conflicts with
+other processes surface at BEGIN, where the busy timeout applies, rather than as
+an unretryable lock upgrade failure mid-transaction. The reader engine pools
+``query_only`` connections that read WAL snapshots concurrently with the writer.
+"""
 
 from __future__ import annotations
 
+import logging
+import os
+import random
 import sqlite3
+import threading
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Final
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import Connection, create_engine, event, inspect
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
 
+from specmaker_core.persistence import migrations as _migrations
 from specmaker_core.persistence import models as _models
+from specmaker_core.persistence import search as _search
+
+LOGGER = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH: Final[Path] = Path(".specmaker/specmaker.db")
 
+BUSY_TIMEOUT_MS: Final[int] = 5000
+READ_POOL_SIZE: Final[int] = min(os.cpu_count() or 4, 16)
+READ_MMAP_SIZE: Final[int] = 256 * 1024 * 1024
+READ_CACHE_SIZE_KIB: Final[int] = 16 * 1024
+WRITE_RETRY_ATTEMPTS: Final[int] = 5
+WRITE_RETRY_BASE_DELAY: Final[float] = 0.05
+
+# Callers wait this long for the single writer connection before giving up.
+_WRITER_POOL_TIMEOUT: Final[float] = 60.0
+
+_REGISTRY_LOCK: Final[threading.Lock] = threading.Lock()
+_ENGINES: dict[Path, Engine] = {}
+_SESSION_FACTORIES: dict[Path, sessionmaker[Session]] = {}
+_READ_ENGINES: dict[Path, Engine] = {}
+_READ_SESSION_FACTORIES: dict[Path, sessionmaker[Session]] = {}
+
 
 def ensure_parent(path: Path) -> Path:
     """Ensure parent directory exists and return the path."""
@@ -23,45 +58,225 @@ def ensure_parent(path: Path) -> Path:
 
 
 def open_db(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    """Open a SQLite connection with WAL enabled.
+    """Open a SQLite connection with WAL and incremental auto-vacuum enabled.
 
     Note: This is maintained for backward compatibility. New code should use
     get_engine() and create_session() for SQLAlchemy-based access.
     """
     path = ensure_parent(db_path)
-    connection = sqlite3.connect(path)
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000)
+    # As in _set_sqlite_pragma: only new databases pick this up, and only before WAL.
+    connection.execute("PRAGMA auto_vacuum=INCREMENTAL;")
     connection.execute("PRAGMA journal_mode=WAL;")
     connection.execute("PRAGMA foreign_keys=ON;")
     return connection
 
 
 def _set_sqlite_pragma(dbapi_conn: sqlite3.Connection, _connection_record: object) -> None:
-    """Enable WAL mode and foreign keys for SQLite connections."""
+    """Enable WAL mode, foreign keys, and incremental auto-vacuum for SQLite connections.
+
+    auto_vacuum only takes effect for databases that have no tables yet and must be
+    set before WAL mode; existing databases keep their mode until a full VACUUM.
+    """
     cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
     cursor.close()
+    # Let SQLAlchemy's begin hook issue BEGIN IMMEDIATE instead of pysqlite's deferred BEGIN.
+    dbapi_conn.isolation_level = None
 
 
-def get_engine(db_path: Path = DEFAULT_DB_PATH) -> Engine:
-    """Create and configure a SQLAlchemy engine for the database."""
-    path = ensure_parent(db_path)
-    engine = create_engine(f"sqlite:///{path}", echo=False)
+def _begin_immediate(connection: Connection) -> None:
+    """Take the write lock when a writer transaction starts."""
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _set_read_pragma(dbapi_conn: sqlite3.Connection, _connection_record: object) -> None:
+    """Configure pooled reader connections as read-only with a larger page cache."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.execute(f"PRAGMA mmap_size={READ_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size=-{READ_CACHE_SIZE_KIB}")
+    cursor.close()
 
-    # Enable WAL mode and foreign keys for SQLite
-    event.listens_for(Engine, "connect")(_set_sqlite_pragma)
 
-    # Create tables
+def _registry_key(db_path: Path) -> Path:
+    """Return the canonical key used to cache engines for a database path."""
+    return db_path.expanduser().resolve()
+
+
+def _build_engine(path: Path) -> Engine:
+    """Create the writer engine for ``path`` and bootstrap the review schema exactly once."""
+    engine = create_engine(
+        f"sqlite:///{ensure_parent(path)}",
+        echo=False,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=_WRITER_POOL_TIMEOUT,
+    )
+
+    # Pragmas are attached to this engine only so repeated lookups never stack listeners.
+    event.listen(engine, "connect", _set_sqlite_pragma)
+    event.listen(engine, "begin", _begin_immediate)
     _models.Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
+    _migrations.run_migrations(engine)
+    with engine.begin() as connection:
+        _search.create_search_table(connection)
+    return engine
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    """Add nullable columns introduced after a table was first created.
 
+    ``create_all`` never alters existing tables, so databases created by older
+    releases are brought up to date with ``ALTER TABLE ... ADD COLUMN``.
+    """
+    with engine.begin() as connection:
+        # Inspect through the open connection; the writer pool has only one.
+        inspector = inspect(connection)
+        for table in _models.Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable:
+                    msg = f"Cannot add non-nullable column {table.name}.{column.name}"
+                    raise RuntimeError(msg)
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.exec_driver_sql(
+                    f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                )
+
+
+def _build_read_engine(path: Path) -> Engine:
+    """Create the pooled read-only engine for an already bootstrapped database."""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        echo=False,
+        pool_size=READ_POOL_SIZE,
+        max_overflow=0,
+    )
+    event.listen(engine, "connect", _set_read_pragma)
     return engine
 
 
+def get_engine(db_path: Path = DEFAULT_DB_PATH) -> Engine:
+    """Return the process-wide writer engine for the database.
+
+    Engines are cached by resolved path, so schema creation and listener registration
+    happen once per database rather than on every call. The engine holds a single
+    connection; sessions that only read should use :func:`create_read_session`.
+    """
+    key = _registry_key(db_path)
+    with _REGISTRY_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = _build_engine(key)
+            _ENGINES[key] = engine
+            _SESSION_FACTORIES[key] = sessionmaker(bind=engine)
+        return engine
+
+
+def get_session_factory(db_path: Path = DEFAULT_DB_PATH) -> sessionmaker[Session]:
+    """Return the cached session factory bound to the database engine."""
+    key = _registry_key(db_path)
+    get_engine(key)
+    return _SESSION_FACTORIES[key]
+
+
 def create_session(db_path: Path = DEFAULT_DB_PATH) -> Session:
-    """Create a new SQLAlchemy session for database operations."""
-    engine = get_engine(db_path)
-    session_factory = sessionmaker(bind=engine)
-    return session_factory()
+    """Create a new SQLAlchemy session on the writer engine.
+
+    Close or commit the session promptly: it holds the database's only writer
+    connection from its first statement until the transaction ends.
+    """
+    return get_session_factory(db_path)()
+
+
+def get_read_engine(db_path: Path = DEFAULT_DB_PATH) -> Engine:
+    """Return the process-wide read-only engine for the database.
+
+    The schema is bootstrapped through :func:`get_engine` first, so readers never
+    observe a database that is missing tables.
+    """
+    key = _registry_key(db_path)
+    get_engine(key)
+    with _REGISTRY_LOCK:
+        engine = _READ_ENGINES.get(key)
+        if engine is None:
+            engine = _build_read_engine(key)
+            _READ_ENGINES[key] = engine
+            _READ_SESSION_FACTORIES[key] = sessionmaker(bind=engine)
+        return engine
+
+
+def create_read_session(db_path: Path = DEFAULT_DB_PATH) -> Session:
+    """Create a session on the read-only pool; writes through it raise an error."""
+    key = _registry_key(db_path)
+    get_read_engine(key)
+    return _READ_SESSION_FACTORIES[key]()
+
+
+def create_read_session_for(bind: Engine | Connection) -> Session:
+    """Create a read-only session for the database behind a writer engine or connection."""
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    database = engine.url.database
+    if database is None:
+        msg = f"Cannot derive a database path from {engine.url!r}"
+        raise ValueError(msg)
+    return create_read_session(Path(database))
+
+
+def retry_on_busy[T](
+    operation: Callable[[], T],
+    *,
+    attempts: int = WRITE_RETRY_ATTEMPTS,
+    base_delay: float = WRITE_RETRY_BASE_DELAY,
+) -> T:
+    """Run ``operation``, retrying with jittered exponential backoff while SQLite is busy.
+
+    Only ``database is locked``/``busy`` errors are retried; the operation must roll
+    back its own partial work before raising so it can be safely re-run.
+    """
+    attempt = 1
+    while True:
+        try:
+            return operation()
+        except OperationalError as exc:
+            if attempt >= attempts or not _is_busy_error(exc):
+                raise
+            delay = base_delay * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+            LOGGER.warning(
+                "SQLite is busy (attempt %d/%d); retrying in %.3fs", attempt, attempts, delay
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+def _is_busy_error(exc: OperationalError) -> bool:
+    """Return whether ``exc`` reports a transient lock conflict."""
+    message = str(exc.orig).lower()
+    return "database is locked" in message or "database is busy" in message
+
+
+def dispose_all() -> None:
+    """Dispose every cached engine and clear the registry.
+
+    Intended for test teardown and process shutdown; the next lookup for a path
+    builds a fresh engine and re-runs schema bootstrap.
+    """
+    with _REGISTRY_LOCK:
+        engines = [*_READ_ENGINES.values(), *_ENGINES.values()]
+        _ENGINES.clear()
+        _SESSION_FACTORIES.clear()
+        _READ_ENGINES.clear()
+        _READ_SESSION_FACTORIES.clear()
+    for engine in engines:
+        engine.dispose()
 
 
 def version_stamp(timestamp: datetime | None = None) -> str:
@@ -0,0 +1,196 @@
+"""Background writer that coalesces review saves into batched transactions.
+
+Completions are handed to a bounded queue and persisted by a single daemon
+thread, which commits every ``batch_size`` records or ``flush_interval`` seconds,
+whichever comes first. Each submission returns a future resolved once its batch
+commits, so callers choose between waiting for the commit (read-your-writes) and
+fire-and-forget.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+from specmaker_core.config.settings import Settings, get_settings
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.persistence.metadata import ReviewMetadata
+from specmaker_core.toolsets.persistence_tools import save_review_records
+
+LOGGER = logging.getLogger(__name__)
+
+_THREAD_NAME: Final[str] = "specmaker-write-behind"
+
+
+@dataclass(frozen=True)
+class _Pending:
+    metadata: ReviewMetadata
+    future: Future[None] = field(default_factory=lambda: Future[None]())
+
+
+@dataclass(frozen=True)
+class _Barrier:
+    """Marker forcing the writer to commit everything queued before it."""
+
+    stop: bool = False
+    future: Future[None] = field(default_factory=lambda: Future[None]())
+
+
+class WriteBehindWriter:
+    """Single-threaded writer that batches review saves for one database."""
+
+    def __init__(
+        self,
+        *,
+        db_path: Path = _storage.DEFAULT_DB_PATH,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        max_queue: int = 1000,
+    ) -> None:
+        if batch_size < 1:
+            msg = f"batch_size must be positive, got {batch_size}"
+            raise ValueError(msg)
+        self._db_path = db_path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue[_Pending | _Barrier] = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=_THREAD_NAME, daemon=True)
+        self._thread.start()
+
+    def submit(self, metadata: ReviewMetadata) -> Future[None]:
+        """Queue a record and return a future resolved when its batch commits.
+
+        Blocks while the queue is full, which applies backpressure to producers.
+        """
+        pending = _Pending(metadata)
+        self._put(pending)
+        return pending.future
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every record submitted before this call is committed.
+
+        Raises:
+            RuntimeError: If the writer is closed; :meth:`close` already flushed.
+            Exception: The error of a batch that failed since the previous flush.
+        """
+        barrier = _Barrier()
+        self._put(barrier)
+        barrier.future.result(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush outstanding records and stop the writer thread.
+
+        Raises:
+            Exception: The error of a batch that failed since the previous flush.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        barrier = _Barrier(stop=True)
+        self._queue.put(barrier)
+        try:
+            barrier.future.result(timeout)
+        finally:
+            self._thread.join(timeout)
+
+    def _put(self, item: _Pending | _Barrier) -> None:
+        # Held while queueing so nothing lands behind the stop barrier, where it would
+        # never be processed.
+        with self._close_lock:
+            if self._closed:
+                msg = "WriteBehindWriter is closed"
+                raise RuntimeError(msg)
+            self._queue.put(item)
+
+    def _run(self) -> None:
+        stop = False
+        # First batch failure since the last barrier, reported to the next flush.
+        failure: Exception | None = None
+        while not stop:
+            batch: list[_Pending] = []
+            barriers: list[_Barrier] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if isinstance(item, _Barrier):
+                    barriers.append(item)
+                    stop = item.stop
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self._batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            failure = failure or self._write(batch)
+            for barrier in barriers:
+                if failure is None:
+                    barrier.future.set_result(None)
+                else:
+                    barrier.future.set_exception(failure)
+            if barriers:
+                failure = None
+
+    def _write(self, batch: list[_Pending]) -> Exception | None:
+        """Commit ``batch`` and resolve its futures, returning the error if it failed."""
+        if not batch:
+            return None
+        session = _storage.create_session(self._db_path)
+        try:
+            save_review_records(
+                session,
+                [pending.metadata for pending in batch],
+                batch_size=len(batch),
+            )
+        except Exception as exc:
+            LOGGER.exception("Write-behind batch of %d review records failed", len(batch))
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return exc
+        else:
+            for pending in batch:
+                pending.future.set_result(None)
+            return None
+        finally:
+            session.close()
+
+
+_writer_lock = threading.Lock()
+_writer_instance: WriteBehindWriter | None = None
+
+
+def get_write_behind_writer(settings: Settings | None = None) -> WriteBehindWriter:
+    """Return the process-wide writer, starting it on first use."""
+    global _writer_instance
+    with _writer_lock:
+        if _writer_instance is None:
+            effective_settings = settings or get_settings()
+            _writer_instance = WriteBehindWriter(
+                batch_size=effective_settings.write_behind_batch_size,
+                flush_interval=effective_settings.write_behind_flush_ms / 1000,
+                max_queue=effective_settings.write_behind_queue_size,
+            )
+            atexit.register(shutdown_write_behind)
+        return _writer_instance
+
+
+def shutdown_write_behind(timeout: float | None = None) -> None:
+    """Flush and stop the process-wide writer if it was started."""
+    global _writer_instance
+    with _writer_lock:
+        writer = _writer_instance
+        _writer_instance = None
+    if writer is not None:
+        writer.close(timeout)
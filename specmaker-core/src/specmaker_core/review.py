@@ -2,35 +2,88 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import logging
-from collections.abc import Iterable
-from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import Generic, TypeVar
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from typing import Final, Generic, TypeVar
 from uuid import uuid4
 
+import pydantic
 from pydantic_ai import DeferredToolRequests, DeferredToolResults, ToolApproved
 from pydantic_ai.messages import ModelMessage
 from pydantic_ai.run import AgentRunResult
 
+from specmaker_core._dependencies import errors as _errors
 from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import events as _events
 from specmaker_core._dependencies.schemas import shared as _shared
-from specmaker_core.agents.reviewer import REVIEWER_NAME
+from specmaker_core._dependencies.toolsets import common_tools as _common_tools
+from specmaker_core._dependencies.toolsets import text_tools as _text_tools
+from specmaker_core._dependencies.utils import handoff as _handoff
+from specmaker_core.agents.reviewer import (
+    DEFAULT_REVIEWER_MODEL,
+    DEFERRED_TOOL_NAMES,
+    REVIEWER_NAME,
+    reviewer_instructions,
+)
+from specmaker_core.config.settings import Settings, get_settings
 from specmaker_core.durable.dbos_boot import launch_dbos
+from specmaker_core.durable.review_flow import current_run_id, review_deadline
 from specmaker_core.durable.review_flow import resume_review as _resume_review
 from specmaker_core.durable.review_flow import start_review as _start_review
-from specmaker_core.persistence.metadata import build_review_metadata
-from specmaker_core.persistence.storage import open_db, version_stamp
-from specmaker_core.toolsets.persistence_tools import save_review_record
+from specmaker_core.durable.streaming import DEFAULT_BUFFER_SIZE, EventFanout, publishing_to
+from specmaker_core.persistence import blobs as _blobs
+from specmaker_core.persistence import deferred_runs as _deferred_runs
+from specmaker_core.persistence import review_cache as _review_cache
+from specmaker_core.persistence.metadata import ReviewMetadata, build_review_metadata
+from specmaker_core.persistence.storage import (
+    create_read_session,
+    create_session,
+    version_stamp,
+)
+from specmaker_core.persistence.write_behind import WriteBehindWriter, get_write_behind_writer
+from specmaker_core.toolsets.persistence_tools import save_review_record, save_review_records
 
 LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+DEFAULT_MAX_CONCURRENCY: Final[int] = 4
+
+
+@dataclass(frozen=True)
+class SectionCarryover:
+    """Findings of unchanged sections carried into an incremental re-review.
+
+    Attributes:
+        issues: Earlier issues located in unchanged sections or in no section.
+        status: Earlier status, relaxed when the carried issues no longer justify it.
+        confidence_percent: Confidence of the earlier review.
+        carried_weight: Characters of unchanged text the carried findings cover.
+        fresh_weight: Characters of changed text sent to the reviewer.
+        pending: Chunks of a chunked review still to run once this run completes.
+    """
+
+    issues: list[_documents.ReviewIssue]
+    status: _documents.ReviewStatus
+    confidence_percent: float
+    carried_weight: int
+    fresh_weight: int
+    pending: list[str] = field(default_factory=lambda: [])
+
 
 @dataclass(frozen=True)
 class RunToken:
-    """Opaque token containing identifiers required to resume a deferred review."""
+    """Opaque token containing identifiers required to resume a deferred review.
+
+    ``message_history`` is trimmed to ``Settings.resume_history_max_tokens`` so each
+    round of approvals resends a bounded history.
+    """
 
     run_id: str
     project_context: _shared.ProjectContext
@@ -38,11 +91,17 @@ class RunToken:
     message_history: list[ModelMessage]
     approvals_requested: int = 0
     approvals_granted: int = 0
+    carryover: SectionCarryover | None = None
 
 
 @dataclass(frozen=True)
 class Completed(Generic[T]):  # noqa: UP046
-    """Represents a completed durable review outcome with associated metadata."""
+    """Represents a completed durable review outcome with associated metadata.
+
+    ``cache_hit`` is set when the value was served from the review cache instead of
+    a model run; such outcomes have an empty message history and are not persisted,
+    so review history and project stats only count reviews that actually ran.
+    """
 
     value: T
     run_id: str
@@ -50,6 +109,7 @@ class Completed(Generic[T]):  # noqa: UP046
     timestamp: datetime
     approvals_requested: int
     approvals_granted: int
+    cache_hit: bool = False
 
 
 @dataclass(frozen=True)
@@ -60,42 +120,644 @@ class Deferred(Generic[T]):  # noqa: UP046
     token: RunToken
 
 
-RunOutcome = Completed[T] | Deferred[T]
+@dataclass(frozen=True)
+class TimedOut(Generic[T]):  # noqa: UP046
+    """Represents a review cancelled for exceeding its ``Settings.step_timeout`` deadline.
+
+    ``run_id`` is the id the review would have completed or deferred under. ``token``
+    is set when a resumed run timed out; resume it again, or call
+    :func:`resume_by_id` with ``run_id``, to retry.
+    """
+
+    run_id: str
+    timeout_seconds: float
+    token: RunToken | None = None
+
+
+RunOutcome = Completed[T] | Deferred[T] | TimedOut[T]
+
+_DEFERRED_ADAPTER: Final = pydantic.TypeAdapter(Deferred[_documents.ReviewReport])
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):  # noqa: UP046
+    """Outcome of one item in a batch, identified by its position in the input.
+
+    Exactly one of ``outcome`` and ``error`` is set.
+    """
+
+    index: int
+    outcome: RunOutcome[T] | None
+    error: Exception | None = None
+
+
+_BatchJob = Callable[
+    [], Awaitable[tuple[RunOutcome[_documents.ReviewReport], ReviewMetadata | None]]
+]
 
 
 async def review(
-    context: _shared.ProjectContext, manuscript: _documents.Manuscript
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    *,
+    use_cache: bool = True,
+    previous: ReviewMetadata | None = None,
 ) -> RunOutcome[_documents.ReviewReport]:
-    """Launch the reviewer agent and return a structured outcome."""
+    """Launch the reviewer agent and return a structured outcome.
+
+    When ``Settings.review_cache_enabled`` is set, a manuscript reviewed before with
+    identical inputs is answered from the review cache without a model call. Pass
+    ``use_cache=False`` to force a fresh review; its report still refreshes the cache.
+
+    Pass the stored record of an earlier review of the same document as ``previous``
+    to re-review incrementally: only Markdown sections whose content changed are sent
+    to the reviewer, and earlier issues in unchanged sections are merged into the new
+    report. A changed title or style, or a rewrite touching every section, falls back
+    to a full review.
+
+    When ``Settings.review_chunk_max_tokens`` is set (it is off by default), full
+    reviews of manuscripts larger than it are split into chunks reviewed
+    concurrently as separate durable runs and reduced into one report. If a chunk
+    requests approvals, the outcome is deferred on that chunk; chunks that defer
+    behind it are reviewed when it is resumed.
+
+    The whole review, including every chunk, shares one ``Settings.step_timeout``
+    deadline. When it passes, the running model calls are cancelled and the review
+    is reported as :class:`TimedOut`.
+    """
+    launch_dbos()
+    outcome = await _review_outcome(context, manuscript, use_cache=use_cache, previous=previous)
+    if isinstance(outcome, Completed):
+        await _persist_completion_async(context, manuscript, outcome)
+    await _track_deferred(outcome)
+    return outcome
+
+
+async def resume(
+    token: RunToken, results: DeferredToolResults
+) -> RunOutcome[_documents.ReviewReport]:
+    """Resume a previously deferred review with collected results/approvals.
+
+    The resumed run, and any chunks still pending behind it, share one
+    ``Settings.step_timeout`` deadline. Every outcome keeps ``token.run_id``.
+    """
+    launch_dbos()
+    outcome = await _resumed_outcome(token, results)
+    if isinstance(outcome, Completed):
+        await _persist_completion_async(token.project_context, token.manuscript, outcome)
+    await _track_deferred(outcome, resumed=token)
+    return outcome
+
+
+async def resume_by_id(
+    run_id: str, results: DeferredToolResults
+) -> RunOutcome[_documents.ReviewReport]:
+    """Resume the deferred review stored under ``run_id``, as :func:`resume` would.
+
+    Deferred outcomes are stored while ``Settings.deferred_run_store_enabled`` is
+    set, so callers only need to keep the run id, even across restarts. The stored
+    entry is removed once the run completes or replaced when it defers again.
+
+    Raises:
+        PersistenceError: If no unexpired deferred review is stored for ``run_id``.
+    """
+    deferred = await load_deferred(run_id)
+    if deferred is None:
+        msg = f"No pending deferred review with run id {run_id!r}"
+        raise _errors.PersistenceError(msg)
+    return await resume(deferred.token, results)
+
+
+async def load_deferred(run_id: str) -> Deferred[_documents.ReviewReport] | None:
+    """Return the stored deferred review for ``run_id``, or ``None`` if unknown or expired.
+
+    The outcome includes the pending approval requests, so a run known only by its
+    id can be presented for approval.
+    """
+    payload = await asyncio.to_thread(_load_deferred_payload, run_id)
+    if payload is None:
+        return None
+    try:
+        return _DEFERRED_ADAPTER.validate_json(payload)
+    except pydantic.ValidationError:
+        LOGGER.warning("Stored deferred review %s could not be decoded", run_id)
+        return None
+
+
+async def review_stream(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    *,
+    use_cache: bool = True,
+    previous: ReviewMetadata | None = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> AsyncGenerator[_events.ReviewEvent | RunOutcome[_documents.ReviewReport]]:
+    """Review like :func:`review`, yielding progress events before the outcome.
+
+    Each issue of the report is yielded as an ``IssueFound`` event as soon as it has
+    streamed from the model, before the rest of the report is written. Up to
+    ``buffer_size`` events are buffered; if the consumer falls behind, the oldest are
+    dropped and reported with an ``EventsDropped`` marker rather than pausing the
+    review. The last item is always the outcome, whose report is authoritative.
+    Closing the iterator early cancels the review.
+    """
+    launch_dbos()
+    fanout = EventFanout()
+    events = fanout.subscribe(buffer_size)
+    task = asyncio.create_task(
+        _streamed_outcome(fanout, context, manuscript, use_cache=use_cache, previous=previous)
+    )
+    try:
+        async for event in events:
+            yield event
+        outcome = await task
+    finally:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    yield outcome
+
+
+async def review_many(
+    context: _shared.ProjectContext,
+    manuscripts: Iterable[_documents.Manuscript],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_cache: bool = True,
+) -> AsyncGenerator[BatchResult[_documents.ReviewReport]]:
+    """Review many manuscripts concurrently, yielding results as they complete.
+
+    At most ``max_concurrency`` reviews run at once. A failing review is reported
+    through :attr:`BatchResult.error` without affecting the others. Completed
+    reviews are persisted together in one batched write once the batch finishes or
+    the iterator is closed early. ``use_cache`` behaves as in :func:`review`.
+    """
+    launch_dbos()
+    jobs = [
+        functools.partial(_review_one, context, manuscript, use_cache=use_cache)
+        for manuscript in manuscripts
+    ]
+    async with contextlib.aclosing(_run_batch(jobs, max_concurrency=max_concurrency)) as batch:
+        async for item in batch:
+            yield item
+
+
+async def resume_many(
+    tokens_and_results: Iterable[tuple[RunToken, DeferredToolResults]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncGenerator[BatchResult[_documents.ReviewReport]]:
+    """Resume many deferred reviews concurrently, yielding results as they complete.
+
+    Behaves like :func:`review_many`; ``BatchResult.index`` refers to the position
+    of the token in ``tokens_and_results``.
+    """
     launch_dbos()
-    result = await _start_review(manuscript)
+    jobs = [functools.partial(_resume_one, token, results) for token, results in tokens_and_results]
+    async with contextlib.aclosing(_run_batch(jobs, max_concurrency=max_concurrency)) as batch:
+        async for item in batch:
+            yield item
+
+
+def list_agents() -> list[str]:
+    """Return the list of public agent identifiers exposed by SpecMaker Core."""
+    return [REVIEWER_NAME]
+
+
+async def _persist_completion_async(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    completion: Completed[_documents.ReviewReport],
+) -> None:
+    """Persist a completion according to ``Settings.persistence_mode``."""
+    if completion.cache_hit:
+        return
+    settings = get_settings()
+    if settings.persistence_mode == "write_behind":
+        await _submit_write_behind(
+            settings, [_completion_metadata(context, manuscript, completion)]
+        )
+        return
+    # SQLite I/O runs on a worker thread so concurrent reviews keep making progress.
+    await asyncio.to_thread(_persist_completion, context, manuscript, completion)
+
+
+async def _streamed_outcome(
+    fanout: EventFanout,
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    *,
+    use_cache: bool,
+    previous: ReviewMetadata | None,
+) -> RunOutcome[_documents.ReviewReport]:
+    """Run a review that publishes its progress to ``fanout``, closing it when done."""
+    fanout.publish(_events.ReviewStarted(title=manuscript.title))
+    try:
+        with publishing_to(fanout):
+            outcome = await _review_outcome(
+                context, manuscript, use_cache=use_cache, previous=previous
+            )
+        if isinstance(outcome, Completed):
+            await _persist_completion_async(context, manuscript, outcome)
+        elif isinstance(outcome, Deferred):
+            await _track_deferred(outcome)
+            for call in outcome.requests.approvals:
+                fanout.publish(
+                    _events.ApprovalRequested(
+                        tool_name=call.tool_name, tool_call_id=call.tool_call_id
+                    )
+                )
+        return outcome
+    finally:
+        fanout.close()
+
+
+async def _track_deferred(
+    outcome: RunOutcome[_documents.ReviewReport], *, resumed: RunToken | None = None
+) -> None:
+    """Store a deferred outcome for :func:`resume_by_id` and forget the run it resumed."""
+    settings = get_settings()
+    deferred = outcome if isinstance(outcome, Deferred) else None
+    # A timed-out resume leaves the run pending so it can be resumed again.
+    stale = resumed.run_id if resumed is not None and not isinstance(outcome, TimedOut) else None
+    if not settings.deferred_run_store_enabled or (deferred is None and stale is None):
+        return
+    await asyncio.to_thread(_sync_deferred_runs, deferred, stale, settings)
+
+
+async def _persist_records_async(records: list[ReviewMetadata]) -> None:
+    """Persist a batch of completions according to ``Settings.persistence_mode``."""
+    settings = get_settings()
+    if settings.persistence_mode == "write_behind":
+        await _submit_write_behind(settings, records)
+        return
+    await asyncio.to_thread(_persist_records, records)
+
+
+async def _submit_write_behind(settings: Settings, records: list[ReviewMetadata]) -> None:
+    writer = get_write_behind_writer(settings)
+    # submit() blocks while the queue is full; keep that backpressure off the loop.
+    futures = await asyncio.to_thread(_submit_all, writer, records)
+    if settings.write_behind_durability == "commit":
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+
+
+def _submit_all(writer: WriteBehindWriter, records: list[ReviewMetadata]) -> list[Future[None]]:
+    return [writer.submit(metadata) for metadata in records]
+
+
+async def _review_outcome(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    *,
+    use_cache: bool,
+    previous: ReviewMetadata | None = None,
+) -> RunOutcome[_documents.ReviewReport]:
+    """Return a cached completion when allowed, otherwise run the reviewer."""
+    settings = get_settings()
+    key = _review_cache_key(manuscript, settings) if settings.review_cache_enabled else None
+    if key is not None and use_cache:
+        cached = await asyncio.to_thread(_lookup_cached_report, key, settings)
+        if cached is not None:
+            return Completed(
+                value=cached,
+                run_id=str(uuid4()),
+                message_history=[],
+                timestamp=datetime.now(tz=UTC),
+                approvals_requested=0,
+                approvals_granted=0,
+                cache_hit=True,
+            )
+    run_id = str(uuid4())
+    try:
+        with review_deadline(run_id, settings.step_timeout):
+            outcome = await _run_review(context, manuscript, settings, previous=previous)
+    except _errors.ReviewTimeoutError as exc:
+        return TimedOut(run_id=run_id, timeout_seconds=exc.timeout_seconds)
+    # Resumed reviews depend on approvals, so only reviews completed without one are cached.
+    # Incremental reviews only cover edited sections and must not pass for full reviews.
+    if key is not None and previous is None and isinstance(outcome, Completed):
+        await asyncio.to_thread(_store_cached_report, key, outcome.value, settings)
+    return outcome
+
+
+async def _run_review(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    settings: Settings,
+    *,
+    previous: ReviewMetadata | None,
+) -> RunOutcome[_documents.ReviewReport]:
+    """Review the whole manuscript, its chunks, or only the sections edited since ``previous``."""
+    plan = _plan_incremental(manuscript, previous) if previous is not None else None
+    if plan is None:
+        chunks = _review_chunks(manuscript, settings)
+        if len(chunks) > 1:
+            return await _review_in_chunks(context, manuscript, chunks, prior_token=None, done=[])
+        return _result_to_outcome(
+            context=context,
+            manuscript=manuscript,
+            result=await _start_review(manuscript),
+            prior_token=None,
+            results=None,
+        )
+    if plan.excerpt is None:
+        return Completed(
+            value=plan.unchanged_report,
+            run_id=_fallback_run_id(None),
+            message_history=[],
+            timestamp=datetime.now(tz=UTC),
+            approvals_requested=0,
+            approvals_granted=0,
+        )
     return _result_to_outcome(
         context=context,
         manuscript=manuscript,
-        result=result,
+        result=await _start_review(plan.excerpt),
         prior_token=None,
         results=None,
+        carryover=plan.carryover,
     )
 
 
-async def resume(
+@dataclass(frozen=True)
+class _IncrementalPlan:
+    """Partial manuscript to review, or the report to reuse when nothing was edited."""
+
+    excerpt: _documents.Manuscript | None
+    carryover: SectionCarryover
+    unchanged_report: _documents.ReviewReport
+
+
+def _plan_incremental(
+    manuscript: _documents.Manuscript, previous: ReviewMetadata
+) -> _IncrementalPlan | None:
+    """Plan a section-level re-review, or return ``None`` when a full review is needed."""
+    earlier = previous.manuscript
+    if (manuscript.title, manuscript.style_rules) != (earlier.title, earlier.style_rules):
+        return None
+    old_sections = _text_tools.split_sections(earlier.content_markdown)
+    new_sections = _text_tools.split_sections(manuscript.content_markdown)
+    diff = _text_tools.diff_sections(old_sections, new_sections)
+    if not diff.unchanged:
+        return None
+
+    report = previous.review_report
+    unchanged = {section.anchor for section in diff.unchanged}
+    carried: list[_documents.ReviewIssue] = []
+    for issue in report.issues:
+        section = _text_tools.locate_section(issue.location, old_sections)
+        # Issues that cannot be attributed to a section are kept rather than lost.
+        if section is None or section.anchor in unchanged:
+            carried.append(issue)
+    implied = _common_tools.status_for_issues(carried)
+    # Dropping issues can relax the earlier status but never make it more severe.
+    relaxed = _common_tools.worst_status([implied, report.status]) == report.status
+    status = implied if relaxed else report.status
+    carryover = SectionCarryover(
+        issues=carried,
+        status=status,
+        confidence_percent=report.confidence_percent,
+        carried_weight=sum(len(section.text) for section in diff.unchanged),
+        fresh_weight=sum(len(section.text) for section in diff.changed),
+    )
+    excerpt = None
+    if diff.changed:
+        excerpt = manuscript.model_copy(
+            update={
+                "content_markdown": _text_tools.render_changed_sections(new_sections, diff.changed)
+            }
+        )
+    elif diff.removed:
+        report = report.model_copy(update={"issues": carried, "status": status})
+    return _IncrementalPlan(excerpt=excerpt, carryover=carryover, unchanged_report=report)
+
+
+async def _resumed_outcome(
     token: RunToken, results: DeferredToolResults
 ) -> RunOutcome[_documents.ReviewReport]:
-    """Resume a previously deferred review with collected results/approvals."""
-    launch_dbos()
+    """Resume the deferred run, reporting a timeout with the token to retry it."""
+    try:
+        with review_deadline(token.run_id, get_settings().step_timeout):
+            return await _continue_review(token, results)
+    except _errors.ReviewTimeoutError as exc:
+        return TimedOut(run_id=token.run_id, timeout_seconds=exc.timeout_seconds, token=token)
+
+
+async def _continue_review(
+    token: RunToken, results: DeferredToolResults
+) -> RunOutcome[_documents.ReviewReport]:
+    """Resume the deferred run, then review any chunks that deferred behind it."""
     result = await _resume_review(token.message_history, results)
-    return _result_to_outcome(
+    outcome = _result_to_outcome(
         context=token.project_context,
         manuscript=token.manuscript,
         result=result,
         prior_token=token,
         results=results,
     )
+    carryover = token.carryover
+    if not isinstance(outcome, Completed) or carryover is None or not carryover.pending:
+        return outcome
+    continuation = RunToken(
+        run_id=outcome.run_id,
+        project_context=token.project_context,
+        manuscript=token.manuscript,
+        message_history=[],
+        approvals_requested=outcome.approvals_requested,
+        approvals_granted=outcome.approvals_granted,
+    )
+    return await _review_in_chunks(
+        token.project_context,
+        token.manuscript,
+        carryover.pending,
+        prior_token=continuation,
+        done=[(outcome.value, carryover.carried_weight + carryover.fresh_weight)],
+    )
 
 
-def list_agents() -> list[str]:
-    """Return the list of public agent identifiers exposed by SpecMaker Core."""
-    return [REVIEWER_NAME]
+def _review_chunks(manuscript: _documents.Manuscript, settings: Settings) -> list[str]:
+    """Return the chunks to review separately, or a single chunk for small manuscripts."""
+    content = manuscript.content_markdown
+    limit = settings.review_chunk_max_tokens
+    if not limit or _text_tools.estimate_tokens(content) <= limit:
+        return [content]
+    return _text_tools.chunk_markdown(content, limit)
+
+
+async def _review_in_chunks(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    chunks: Sequence[str],
+    *,
+    prior_token: RunToken | None,
+    done: Sequence[tuple[_documents.ReviewReport, int]],
+) -> RunOutcome[_documents.ReviewReport]:
+    """Review ``chunks`` concurrently and reduce them with the already ``done`` reports.
+
+    ``done`` pairs earlier reports with the characters they cover.
+    """
+    semaphore = asyncio.Semaphore(get_settings().review_chunk_concurrency)
+
+    async def run(
+        position: int, chunk: str
+    ) -> AgentRunResult[_documents.ReviewReport | DeferredToolRequests]:
+        part = manuscript.model_copy(
+            update={
+                "title": f"{manuscript.title} (part {position} of {len(chunks)})",
+                "content_markdown": chunk,
+            }
+        )
+        async with semaphore:
+            return await _start_review(part)
+
+    tasks = [
+        asyncio.create_task(run(position, chunk)) for position, chunk in enumerate(chunks, start=1)
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # One failed or timed-out chunk fails the review; stop the others' model calls.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    reports = list(done)
+    deferred: list[tuple[AgentRunResult[_documents.ReviewReport | DeferredToolRequests], str]] = []
+    for chunk, result in zip(chunks, results, strict=True):
+        if isinstance(result.output, DeferredToolRequests):
+            deferred.append((result, chunk))
+        else:
+            reports.append((result.output, len(chunk)))
+    carried = _carry_reports(reports)
+
+    if deferred:
+        (first, first_chunk), *behind = deferred
+        return _result_to_outcome(
+            context=context,
+            manuscript=manuscript,
+            result=first,
+            prior_token=prior_token,
+            results=None,
+            carryover=replace(
+                carried, fresh_weight=len(first_chunk), pending=[chunk for _, chunk in behind]
+            ),
+        )
+    return Completed(
+        value=_documents.ReviewReport(
+            status=carried.status,
+            summary="\n".join(report.summary for report, _ in reports),
+            issues=carried.issues,
+            style_rules=manuscript.style_rules,
+            confidence_percent=carried.confidence_percent,
+        ),
+        run_id=_extract_run_id(results[0]) or _fallback_run_id(prior_token),
+        message_history=[message for result in results for message in result.all_messages()],
+        timestamp=datetime.now(tz=UTC),
+        approvals_requested=prior_token.approvals_requested if prior_token else 0,
+        approvals_granted=prior_token.approvals_granted if prior_token else 0,
+    )
+
+
+def _carry_reports(
+    reports: Sequence[tuple[_documents.ReviewReport, int]],
+) -> SectionCarryover:
+    """Reduce reports paired with the characters they cover into one carryover."""
+    weight = sum(size for _, size in reports)
+    confidence = sum(report.confidence_percent * size for report, size in reports)
+    return SectionCarryover(
+        issues=_common_tools.dedupe_issues(
+            issue for report, _ in reports for issue in report.issues
+        ),
+        status=_common_tools.worst_status(report.status for report, _ in reports),
+        confidence_percent=confidence / weight if weight else 0.0,
+        carried_weight=weight,
+        fresh_weight=0,
+    )
+
+
+def _merge_carryover(
+    fresh: _documents.ReviewReport, carryover: SectionCarryover
+) -> _documents.ReviewReport:
+    """Combine a review of changed sections with findings carried from unchanged ones."""
+    total = carryover.fresh_weight + carryover.carried_weight
+    confidence = fresh.confidence_percent
+    if total:
+        confidence = (
+            fresh.confidence_percent * carryover.fresh_weight
+            + carryover.confidence_percent * carryover.carried_weight
+        ) / total
+    return fresh.model_copy(
+        update={
+            "status": _common_tools.worst_status([fresh.status, carryover.status]),
+            "issues": _common_tools.dedupe_issues([*fresh.issues, *carryover.issues]),
+            "confidence_percent": confidence,
+        }
+    )
+
+
+async def _review_one(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    *,
+    use_cache: bool,
+) -> tuple[RunOutcome[_documents.ReviewReport], ReviewMetadata | None]:
+    outcome = await _review_outcome(context, manuscript, use_cache=use_cache)
+    await _track_deferred(outcome)
+    return outcome, _outcome_metadata(context, manuscript, outcome)
+
+
+async def _resume_one(
+    token: RunToken, results: DeferredToolResults
+) -> tuple[RunOutcome[_documents.ReviewReport], ReviewMetadata | None]:
+    outcome = await _resumed_outcome(token, results)
+    await _track_deferred(outcome, resumed=token)
+    return outcome, _outcome_metadata(token.project_context, token.manuscript, outcome)
+
+
+def _outcome_metadata(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    outcome: RunOutcome[_documents.ReviewReport],
+) -> ReviewMetadata | None:
+    if isinstance(outcome, Completed) and not outcome.cache_hit:
+        return _completion_metadata(context, manuscript, outcome)
+    return None
+
+
+async def _run_batch(
+    jobs: Sequence[_BatchJob], *, max_concurrency: int
+) -> AsyncGenerator[BatchResult[_documents.ReviewReport]]:
+    """Run ``jobs`` under a semaphore and persist their completions in one write."""
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be positive, got {max_concurrency}"
+        raise ValueError(msg)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed: list[ReviewMetadata] = []
+
+    async def run(index: int, job: _BatchJob) -> BatchResult[_documents.ReviewReport]:
+        async with semaphore:
+            try:
+                outcome, metadata = await job()
+            except Exception as exc:
+                LOGGER.warning("Batch review item %d failed", index, exc_info=True)
+                return BatchResult(index=index, outcome=None, error=exc)
+        if metadata is not None:
+            completed.append(metadata)
+        return BatchResult(index=index, outcome=outcome)
+
+    tasks = [asyncio.create_task(run(index, job)) for index, job in enumerate(jobs)]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        # Closing the iterator early abandons reviews that have not finished yet.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if completed:
+            await _persist_records_async(completed)
 
 
 def _result_to_outcome(
@@ -105,15 +767,18 @@ def _result_to_outcome(
     result: AgentRunResult[_documents.ReviewReport | DeferredToolRequests],
     prior_token: RunToken | None,
     results: DeferredToolResults | None,
+    carryover: SectionCarryover | None = None,
 ) -> RunOutcome[_documents.ReviewReport]:
     output = result.output
+    if carryover is None and prior_token is not None:
+        carryover = prior_token.carryover
     messages = result.all_messages()
     approvals_requested = prior_token.approvals_requested if prior_token else 0
     approvals_granted = prior_token.approvals_granted if prior_token else 0
     if results is not None:
         approvals_granted += _count_approvals_granted(results)
 
-    run_id = _extract_run_id(result) or (prior_token.run_id if prior_token else str(uuid4()))
+    run_id = _extract_run_id(result) or _fallback_run_id(prior_token)
     timestamp = _extract_timestamp(result)
 
     if isinstance(output, DeferredToolRequests):
@@ -122,23 +787,26 @@ def _result_to_outcome(
             run_id=run_id,
             project_context=context,
             manuscript=manuscript,
-            message_history=messages,
+            message_history=_handoff.trim_history(
+                messages,
+                get_settings().resume_history_max_tokens,
+                keep_tools=DEFERRED_TOOL_NAMES,
+            ),
             approvals_requested=approvals_requested + pending_approvals,
             approvals_granted=approvals_granted,
+            carryover=carryover,
         )
         return Deferred(requests=output, token=updated_token)
 
     # Type narrowing ensures output is ReviewReport at this point
-    completion = Completed(
-        value=output,
+    return Completed(
+        value=_merge_carryover(output, carryover) if carryover is not None else output,
         run_id=run_id,
         message_history=messages,
         timestamp=timestamp,
         approvals_requested=approvals_requested,
         approvals_granted=approvals_granted,
     )
-    _persist_completion(context, manuscript, completion)
-    return completion
 
 
 def _extract_run_id(result: AgentRunResult[object]) -> str | None:
@@ -160,6 +828,13 @@ def _extract_run_id(result: AgentRunResult[object]) -> str | None:
     return None
 
 
+def _fallback_run_id(prior_token: RunToken | None) -> str:
+    """Return the resumed run's id, else the enclosing review's, else a fresh one."""
+    if prior_token is not None:
+        return prior_token.run_id
+    return current_run_id() or str(uuid4())
+
+
 def _extract_timestamp(result: AgentRunResult[object]) -> datetime:
     timestamp_method = getattr(result, "timestamp", None)
     if callable(timestamp_method):
@@ -186,19 +861,114 @@ def _persist_completion(
     manuscript: _documents.Manuscript,
     completion: Completed[_documents.ReviewReport],
 ) -> None:
-    connection = open_db()
+    session = create_session()
     try:
-        metadata = build_review_metadata(
-            project_context=context,
-            manuscript=manuscript,
-            review_report=completion.value,
-            run_id=completion.run_id,
-            agent_name=REVIEWER_NAME,
-            version=version_stamp(completion.timestamp),
-            created_at=completion.timestamp,
-            approvals_requested=completion.approvals_requested,
-            approvals_granted=completion.approvals_granted,
+        save_review_record(session, _completion_metadata(context, manuscript, completion))
+    finally:
+        session.close()
+
+
+def _review_cache_key(manuscript: _documents.Manuscript, settings: Settings) -> str:
+    return _review_cache.cache_key(
+        manuscript,
+        instructions=reviewer_instructions(),
+        model=DEFAULT_REVIEWER_MODEL,
+        settings={
+            "model_provider": settings.model_provider,
+            "model_name_fallback": settings.model_name_fallback,
+            "reasoning_effort_fallback": settings.reasoning_effort_fallback,
+            # Chunked reviews are reduced from per-chunk reports and differ from one pass.
+            "review_chunk_max_tokens": settings.review_chunk_max_tokens,
+        },
+    )
+
+
+def _review_cache_policy(settings: Settings) -> _review_cache.CachePolicy:
+    return _review_cache.CachePolicy(
+        max_entries=settings.review_cache_max_entries,
+        max_age=timedelta(hours=settings.review_cache_max_age_hours),
+    )
+
+
+def _lookup_cached_report(key: str, settings: Settings) -> _documents.ReviewReport | None:
+    now = datetime.now(tz=UTC)
+    # Misses, the common case, never wait for the writer connection.
+    with create_read_session() as read_session:
+        report = _review_cache.find(
+            read_session, key, policy=_review_cache_policy(settings), now=now
         )
-        save_review_record(connection, metadata)
+    if report is not None:
+        session = create_session()
+        try:
+            _review_cache.touch(session, key, now=now)
+            session.commit()
+        finally:
+            session.close()
+    return report
+
+
+def _store_cached_report(key: str, report: _documents.ReviewReport, settings: Settings) -> None:
+    session = create_session()
+    try:
+        _review_cache.store(
+            session, key, report, policy=_review_cache_policy(settings), now=datetime.now(tz=UTC)
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def _sync_deferred_runs(
+    deferred: Deferred[_documents.ReviewReport] | None, stale: str | None, settings: Settings
+) -> None:
+    session = create_session()
+    try:
+        if stale is not None and (deferred is None or deferred.token.run_id != stale):
+            _deferred_runs.remove(session, stale)
+        if deferred is not None:
+            _deferred_runs.store(
+                session,
+                deferred.token.run_id,
+                _DEFERRED_ADAPTER.dump_json(deferred),
+                project_name=deferred.token.project_context.project_name,
+                ttl=timedelta(hours=settings.deferred_run_ttl_hours),
+                encoding=_blobs.BlobEncoding(
+                    codec=settings.storage_compression,
+                    min_bytes=settings.storage_compression_min_bytes,
+                ),
+                now=datetime.now(tz=UTC),
+            )
+        session.commit()
     finally:
-        connection.close()
+        session.close()
+
+
+def _load_deferred_payload(run_id: str) -> bytes | None:
+    with create_read_session() as session:
+        return _deferred_runs.load(session, run_id, now=datetime.now(tz=UTC))
+
+
+def _persist_records(records: list[ReviewMetadata]) -> None:
+    session = create_session()
+    try:
+        save_review_records(session, records, batch_size=len(records))
+    finally:
+        session.close()
+
+
+def _completion_metadata(
+    context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    completion: Completed[_documents.ReviewReport],
+) -> ReviewMetadata:
+    return build_review_metadata(
+        project_context=context,
+        manuscript=manuscript,
+        review_report=completion.value,
+        run_id=completion.run_id,
+        agent_name=REVIEWER_NAME,
+        version=version_stamp(completion.timestamp),
+        created_at=completion.timestamp,
+        approvals_requested=completion.approvals_requested,
+        approvals_granted=completion.approvals_granted,
+    )
@@ -8,24 +8,111 @@ field uses second-level timestamps, so run_id distinguishes concurrent completio
 
 Insert Semantics
 ----------------
-Uses SQLAlchemy's merge() to provide idempotent saves: re-saving the same
-(project_name, version, run_id) tuple updates the existing row rather than failing or
-creating duplicates. This supports retry scenarios and workflow resumption without data loss.
+Uses SQLite's native ``INSERT ... ON CONFLICT(project_name, version, run_id) DO UPDATE``
+to provide idempotent saves: re-saving the same (project_name, version, run_id) tuple
+updates the existing row rather than failing or creating duplicates. This supports retry
+scenarios and workflow resumption without data loss. Bulk saves apply the same statement
+to batches of records, committing once per batch instead of once per record.
+
+Payload Storage
+---------------
+Project contexts, manuscripts, and review reports are written to the content-addressed
+review_blobs table and referenced by hash, so repeated payloads are stored once and never
+rewritten. Rows saved before blobs existed keep their inline JSON and are still readable
+until recompress_payloads() moves them into blobs.
+
+Blob contents are optionally compressed according to ``Settings.storage_compression``;
+each blob row records its codec, so databases with mixed encodings remain readable.
+
+Derived Tables
+--------------
+Every save rewrites the record's rows in derived tables within the same transaction:
+
+- review_issues: one row per ReviewIssue, indexed for triage queries.
+- review_search: FTS5 index over manuscript text, report summaries, and issue messages.
+- project_review_stats: per-project status counts, confidence sums, and the latest record,
+  adjusted by deltas so status pages read one row per project.
+
+Export and Import
+-----------------
+export_reviews() and import_reviews() stream records through NDJSON files (gzip when the
+path ends in ``.gz``) using keyset iteration and the bulk upsert, so memory stays bounded
+by one page or batch regardless of history size. Importing is idempotent.
+
+Retention
+---------
+prune_reviews() archives records outside a RetentionPolicy to gzip NDJSON segments, then
+deletes them together with their derived rows and any blobs left unreferenced. Each batch
+is its own transaction, and freed pages are returned with incremental VACUUM steps.
 """
 
 from __future__ import annotations
 
 import datetime
+import functools
+import itertools
 import sqlite3
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
 
-from sqlalchemy import select
+import pydantic
+from sqlalchemy import ColumnElement, and_, delete, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from specmaker_core._dependencies import errors as _errors
 from specmaker_core._dependencies.schemas import documents as _documents
 from specmaker_core._dependencies.schemas import shared as _shared
+from specmaker_core._dependencies.toolsets import common_tools as _common_tools
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.config.settings import get_settings
+from specmaker_core.persistence import archive as _archive
+from specmaker_core.persistence import blobs as _blobs
 from specmaker_core.persistence import models as _models
+from specmaker_core.persistence import retention as _retention
+from specmaker_core.persistence import search as _search
+from specmaker_core.persistence import stats as _stats
 from specmaker_core.persistence import storage as _storage
-from specmaker_core.persistence.metadata import ReviewMetadata, metadata_to_json
+from specmaker_core.persistence.metadata import (
+    ProjectReviewStats,
+    ReviewMetadata,
+    ReviewRecordSummary,
+    ReviewSearchHit,
+    StoredReviewIssue,
+)
+
+DEFAULT_BATCH_SIZE: Final[int] = 500
+DEFAULT_PAGE_SIZE: Final[int] = 200
+STREAM_CHUNK_SIZE: Final[int] = 50
+DEFAULT_SEARCH_LIMIT: Final[int] = 20
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lookups.
+_KEY_CHUNK_SIZE: Final[int] = 300
+
+_CONFLICT_COLUMNS: Final[tuple[str, ...]] = ("project_name", "version", "run_id")
+
+
+@dataclass(frozen=True)
+class ReviewCursor:
+    """Keyset position in the reverse chronological review listing.
+
+    Ordering is ``(created_at_us DESC, record_id DESC)``; iteration resumes strictly
+    after the cursor position.
+    """
+
+    created_at_us: int
+    record_id: str
+
+    @classmethod
+    def from_metadata(cls, metadata: ReviewMetadata) -> ReviewCursor:
+        """Build a cursor positioned at a previously yielded record."""
+        return cls(
+            created_at_us=_serialization.epoch_microseconds(metadata.created_at),
+            record_id=metadata.record_id,
+        )
 
 
 def ensure_schema(connection: sqlite3.Connection | Session) -> None:
@@ -56,6 +143,29 @@ def save_review_record(connection: sqlite3.Connection | Session, metadata: Revie
         _save_with_sqlite3(connection, metadata)
 
 
+def save_review_records(
+    connection: sqlite3.Connection | Session,
+    records: Iterable[ReviewMetadata],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Persist many review records with the same idempotent upsert semantics.
+
+    Records are written in batches of ``batch_size`` rows, each batch in a single
+    transaction, so backfills pay one commit per batch rather than one per record.
+
+    Returns:
+        The number of records written.
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+    if isinstance(connection, Session):
+        return _save_many_with_sqlalchemy(connection, records, batch_size=batch_size)
+    else:
+        return _save_many_with_sqlite3(connection, records, batch_size=batch_size)
+
+
 def load_review_records(
     connection: sqlite3.Connection | Session,
     *,
@@ -68,47 +178,533 @@ def load_review_records(
         return _load_with_sqlite3(connection, project_name=project_name)
 
 
+def iter_review_records(
+    connection: sqlite3.Connection | Session,
+    *,
+    project_name: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    after: ReviewCursor | None = None,
+) -> Iterator[ReviewMetadata]:
+    """Stream review records in reverse chronological order with constant memory.
+
+    Rows are fetched a page at a time using keyset pagination on
+    ``(created_at_us, record_id)``, which lets SQLite seek through the
+    ``idx_review_records_project_time`` index instead of re-scanning with OFFSET. Pass
+    ``after`` (see :meth:`ReviewCursor.from_metadata`) to resume a previous listing.
+    """
+    if page_size < 1:
+        msg = f"page_size must be positive, got {page_size}"
+        raise ValueError(msg)
+    if isinstance(connection, Session):
+        return _iter_with_sqlalchemy(
+            connection, project_name=project_name, page_size=page_size, after=after
+        )
+    else:
+        return _iter_with_sqlite3(
+            connection, project_name=project_name, page_size=page_size, after=after
+        )
+
+
+def list_review_summaries(
+    connection: sqlite3.Connection | Session,
+    *,
+    project_name: str | None = None,
+    limit: int | None = None,
+    after: ReviewCursor | None = None,
+) -> list[ReviewRecordSummary]:
+    """List review summaries in reverse chronological order without decoding JSON.
+
+    Only scalar and denormalized columns are selected, so the manuscript, project
+    context, and report payloads are never read. Use :func:`load_review_record` to
+    fetch the full metadata for a single summary.
+    """
+    if isinstance(connection, Session):
+        return _list_summaries_with_sqlalchemy(
+            connection, project_name=project_name, limit=limit, after=after
+        )
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _list_summaries_with_sqlalchemy(
+                session, project_name=project_name, limit=limit, after=after
+            )
+        finally:
+            session.close()
+
+
+def load_review_record(
+    connection: sqlite3.Connection | Session,
+    record_id: str,
+) -> ReviewMetadata | None:
+    """Load the full review metadata for ``record_id``, or ``None`` when absent."""
+    if isinstance(connection, Session):
+        return _load_one_with_sqlalchemy(connection, record_id)
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _load_one_with_sqlalchemy(session, record_id)
+        finally:
+            session.close()
+
+
+def export_reviews(
+    connection: sqlite3.Connection | Session,
+    path: Path,
+    *,
+    project_name: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Stream review records to an NDJSON file and return how many were written.
+
+    Records are written newest first, one JSON document per line; a ``.gz`` suffix
+    enables gzip. The file only appears once the export has completed. Records are
+    read through the read pool, so commit pending writes on ``connection`` first.
+    """
+    if isinstance(connection, Session):
+        # A long export must not hold the writer connection away from live saves.
+        with _storage.create_read_session_for(connection.get_bind()) as read_session:
+            records = iter_review_records(
+                read_session, project_name=project_name, page_size=page_size
+            )
+            return _archive.write_segment(path, records)
+    records = iter_review_records(connection, project_name=project_name, page_size=page_size)
+    return _archive.write_segment(path, records)
+
+
+def import_reviews(
+    connection: sqlite3.Connection | Session,
+    path: Path,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Stream review records from an NDJSON file into the database and return the count.
+
+    Records are upserted in batches of ``batch_size``, so re-importing a file
+    updates existing rows instead of duplicating them. Lines repeating a record
+    (same project, version and run id) are counted, and the last one wins.
+    """
+    return save_review_records(connection, _archive.read_segment(path), batch_size=batch_size)
+
+
+def get_project_stats(
+    connection: sqlite3.Connection | Session,
+    project_name: str,
+) -> ProjectReviewStats | None:
+    """Return the maintained aggregates for ``project_name``, or ``None`` when unknown.
+
+    This is a primary-key lookup on project_review_stats; no review records are read.
+    """
+    if isinstance(connection, Session):
+        return _stats.get(connection, project_name)
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _stats.get(session, project_name)
+        finally:
+            session.close()
+
+
+def list_project_stats(connection: sqlite3.Connection | Session) -> list[ProjectReviewStats]:
+    """Return the maintained aggregates of every project, ordered by project name."""
+    if isinstance(connection, Session):
+        return _stats.list_all(connection)
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _stats.list_all(session)
+        finally:
+            session.close()
+
+
+def get_latest_review(
+    connection: sqlite3.Connection | Session,
+    project_name: str,
+) -> ReviewMetadata | None:
+    """Load the newest review of ``project_name`` through the maintained latest pointer."""
+    if isinstance(connection, Session):
+        return _latest_with_sqlalchemy(connection, project_name)
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _latest_with_sqlalchemy(session, project_name)
+        finally:
+            session.close()
+
+
+def rebuild_project_stats(connection: sqlite3.Connection | Session) -> int:
+    """Recompute project_review_stats from review_records and return the project count.
+
+    Saves keep the table current on their own; this repairs it after manual edits.
+    """
+    if isinstance(connection, Session):
+        return _rebuild_stats_with_sqlalchemy(connection)
+    else:
+        session = _storage.create_session()
+        try:
+            return _rebuild_stats_with_sqlalchemy(session)
+        finally:
+            session.close()
+
+
+def query_review_issues(
+    connection: sqlite3.Connection | Session,
+    *,
+    project_name: str | None = None,
+    severity: _documents.IssueSeverity | None = None,
+    category: _documents.IssueCategory | None = None,
+    since: datetime.datetime | None = None,
+    until: datetime.datetime | None = None,
+    limit: int | None = None,
+) -> list[StoredReviewIssue]:
+    """Query normalized review issues, newest first.
+
+    Filters map onto the (project_name, severity, created_at) and
+    (project_name, category, created_at) indexes, so triage questions such as
+    "blocking issues in project X since last week" never decode review reports.
+    ``since`` is inclusive and ``until`` is exclusive.
+    """
+    if isinstance(connection, Session):
+        return _query_issues_with_sqlalchemy(
+            connection,
+            project_name=project_name,
+            severity=severity,
+            category=category,
+            since=since,
+            until=until,
+            limit=limit,
+        )
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _query_issues_with_sqlalchemy(
+                session,
+                project_name=project_name,
+                severity=severity,
+                category=category,
+                since=since,
+                until=until,
+                limit=limit,
+            )
+        finally:
+            session.close()
+
+
+def search_reviews(
+    connection: sqlite3.Connection | Session,
+    query: str,
+    *,
+    project_name: str | None = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> list[ReviewSearchHit]:
+    """Full-text search stored reviews, best matches first.
+
+    ``query`` uses SQLite FTS5 syntax, e.g. ``rate limit`` matches both terms and
+    ``"rate limit"`` matches the phrase. Manuscript titles and content, report
+    summaries, and issue messages are searched; each hit carries a snippet.
+
+    Raises:
+        ValidationError: If the query is not valid FTS5 syntax.
+        PersistenceError: If SQLite was built without FTS5.
+    """
+    if isinstance(connection, Session):
+        return _search.search(connection, query, project_name=project_name, limit=limit)
+    else:
+        session = _storage.create_read_session()
+        try:
+            return _search.search(session, query, project_name=project_name, limit=limit)
+        finally:
+            session.close()
+
+
+def rebuild_search_index(
+    connection: sqlite3.Connection | Session,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Rebuild the full-text index from stored review records.
+
+    Records are streamed through a separate read session and indexed in batches
+    of ``batch_size``, one transaction per batch. Searches return partial results
+    while a rebuild is in progress.
+
+    Returns:
+        The number of records indexed.
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+    if isinstance(connection, Session):
+        return _rebuild_search_with_sqlalchemy(connection, batch_size=batch_size)
+    else:
+        session = _storage.create_session()
+        try:
+            return _rebuild_search_with_sqlalchemy(session, batch_size=batch_size)
+        finally:
+            session.close()
+
+
+@dataclass(frozen=True)
+class RecompressResult:
+    """Counts reported by :func:`recompress_payloads`."""
+
+    records_migrated: int
+    blobs_rewritten: int
+
+
+def recompress_payloads(
+    connection: sqlite3.Connection | Session,
+    *,
+    codec: _blobs.Codec | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> RecompressResult:
+    """Rewrite stored payloads with the given codec (defaults to the configured one).
+
+    Legacy rows that still carry inline JSON are first moved into blobs, then every
+    blob is re-encoded. Work is committed in batches of ``batch_size`` so the
+    migration never holds the write lock for long.
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+    encoding = _storage_encoding(codec)
+    if isinstance(connection, Session):
+        return _recompress_with_sqlalchemy(connection, encoding, batch_size=batch_size)
+    else:
+        session = _storage.create_session()
+        try:
+            return _recompress_with_sqlalchemy(session, encoding, batch_size=batch_size)
+        finally:
+            session.close()
+
+
+@dataclass(frozen=True)
+class PruneResult:
+    """Outcome of :func:`prune_reviews`."""
+
+    records_archived: int
+    blobs_deleted: int
+    pages_reclaimed: int
+    segments: tuple[Path, ...]
+
+
+def prune_reviews(
+    connection: sqlite3.Connection | Session,
+    policy: _retention.RetentionPolicy,
+    *,
+    archive_dir: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    vacuum_pages_per_step: int = _retention.DEFAULT_VACUUM_PAGES,
+    now: datetime.datetime | None = None,
+) -> PruneResult:
+    """Archive and delete review records outside ``policy``, then reclaim space.
+
+    Records are processed oldest first, ``batch_size`` at a time. Each batch is
+    written to its own segment file in ``archive_dir`` before it is deleted, so
+    an interrupted run never loses records and memory stays bounded by one batch.
+    A record re-saved past the boundary while its batch was being archived is kept
+    in the database, though its older copy stays in the segment; only deleted
+    records count towards ``records_archived``. Free pages are released with
+    incremental VACUUM when the database uses ``auto_vacuum=INCREMENTAL``.
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+    if isinstance(connection, Session):
+        return _prune_with_sqlalchemy(
+            connection,
+            policy,
+            archive_dir=archive_dir,
+            batch_size=batch_size,
+            vacuum_pages_per_step=vacuum_pages_per_step,
+            now=now,
+        )
+    else:
+        session = _storage.create_session()
+        try:
+            return _prune_with_sqlalchemy(
+                session,
+                policy,
+                archive_dir=archive_dir,
+                batch_size=batch_size,
+                vacuum_pages_per_step=vacuum_pages_per_step,
+                now=now,
+            )
+        finally:
+            session.close()
+
+
 def _save_with_sqlalchemy(session: Session, metadata: ReviewMetadata) -> None:
-    """Save review record using SQLAlchemy ORM with merge for upsert semantics."""
-    json_payload = metadata_to_json(metadata)
-    created_at = metadata.created_at.astimezone(datetime.UTC).isoformat()
-
-    # Check if record exists with same (project_name, version, run_id)
-    stmt = select(_models.ReviewRecord).where(
-        _models.ReviewRecord.project_name == metadata.project_context.project_name,
-        _models.ReviewRecord.version == metadata.version,
-        _models.ReviewRecord.run_id == metadata.run_id,
+    """Save review record using a native SQLite upsert."""
+    _storage.retry_on_busy(functools.partial(_commit_batch, session, [metadata]))
+
+
+def _save_many_with_sqlalchemy(
+    session: Session,
+    records: Iterable[ReviewMetadata],
+    *,
+    batch_size: int,
+) -> int:
+    """Save review records in batched upsert transactions."""
+    written = 0
+    for batch in itertools.batched(records, batch_size, strict=False):
+        _storage.retry_on_busy(functools.partial(_commit_batch, session, batch))
+        written += len(batch)
+    return written
+
+
+def _commit_batch(session: Session, batch: Sequence[ReviewMetadata]) -> None:
+    """Upsert and commit one batch, rolling back on failure so it can be retried."""
+    try:
+        _upsert_batch(session, batch)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+def _upsert_batch(session: Session, batch: Sequence[ReviewMetadata]) -> None:
+    """Execute one ``INSERT ... ON CONFLICT DO UPDATE`` for a batch of records."""
+    encoding = _storage_encoding()
+    blobs: dict[int, _blobs.Blob] = {}
+    rows: list[dict[str, Any]] = []
+    for metadata in batch:
+        # Batches usually share one ProjectContext instance; hash it only once.
+        for kind, model in (
+            ("project_context", metadata.project_context),
+            ("manuscript", metadata.manuscript),
+            ("review_report", metadata.review_report),
+        ):
+            if id(model) not in blobs:
+                blobs[id(model)] = _blobs.blob_for_model(kind, model, encoding)
+        rows.append(
+            _metadata_to_row(
+                metadata,
+                project_context_hash=blobs[id(metadata.project_context)].blob_hash,
+                manuscript_hash=blobs[id(metadata.manuscript)].blob_hash,
+                review_report_hash=blobs[id(metadata.review_report)].blob_hash,
+            )
+        )
+    if not rows:
+        return
+    _blobs.store_blobs(session, blobs.values())
+    replaced_ids = _replaced_record_ids(session, batch)
+    replaced_stats = _stats.fetch_contributions(session, replaced_ids)
+    _delete_issues(session, replaced_ids)
+    search_enabled = _search.has_search_table(session)
+    if search_enabled:
+        _search.delete_records(session, replaced_ids)
+    stmt = sqlite_insert(_models.ReviewRecord)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(_CONFLICT_COLUMNS),
+        set_={
+            column.name: stmt.excluded[column.name]
+            for column in _models.ReviewRecord.__table__.columns
+            if column.name not in _CONFLICT_COLUMNS
+        },
     )
-    existing = session.execute(stmt).scalar_one_or_none()
-
-    if existing:
-        # Update existing record
-        existing.record_id = metadata.record_id
-        existing.agent_name = metadata.agent_name
-        existing.created_at = created_at
-        existing.approvals_requested = metadata.approvals_requested
-        existing.approvals_granted = metadata.approvals_granted
-        existing.project_context_json = json_payload["project_context"]
-        existing.manuscript_json = json_payload["manuscript"]
-        existing.review_report_json = json_payload["review_report"]
-    else:
-        # Create new record
-        record = _models.ReviewRecord(
-            record_id=metadata.record_id,
-            project_name=metadata.project_context.project_name,
-            version=metadata.version,
-            run_id=metadata.run_id,
-            agent_name=metadata.agent_name,
-            created_at=created_at,
-            approvals_requested=metadata.approvals_requested,
-            approvals_granted=metadata.approvals_granted,
-            project_context_json=json_payload["project_context"],
-            manuscript_json=json_payload["manuscript"],
-            review_report_json=json_payload["review_report"],
-        )
-        session.add(record)
+    session.execute(stmt, rows)
+    # Later duplicates of a conflict key overwrite earlier ones within the same statement.
+    written = list({_conflict_key(metadata): metadata for metadata in batch}.values())
+    _stats.apply_changes(
+        session,
+        removed=replaced_stats,
+        added=[_stats.StatsContribution.from_metadata(item) for item in written],
+    )
+    _insert_issues(session, written)
+    if search_enabled:
+        _search.index_records(session, written)
+
+
+def _conflict_key(metadata: ReviewMetadata) -> tuple[str, str, str]:
+    """Return the (project_name, version, run_id) upsert key of a record."""
+    return (metadata.project_context.project_name, metadata.version, metadata.run_id)
 
-    session.commit()
+
+def _replaced_record_ids(session: Session, batch: Sequence[ReviewMetadata]) -> set[str]:
+    """Return record ids of the batch plus any stored rows it will overwrite."""
+    record = _models.ReviewRecord
+    record_ids = {metadata.record_id for metadata in batch}
+    keys = {
+        (metadata.project_context.project_name, metadata.version, metadata.run_id)
+        for metadata in batch
+    }
+    for chunk in itertools.batched(keys, _KEY_CHUNK_SIZE, strict=False):
+        stmt = select(record.record_id).where(
+            tuple_(record.project_name, record.version, record.run_id).in_(chunk)
+        )
+        record_ids.update(session.execute(stmt).scalars())
+    return record_ids
+
+
+def _delete_issues(session: Session, record_ids: Iterable[str]) -> None:
+    """Remove normalized issues belonging to the given records."""
+    issue = _models.ReviewIssueRecord
+    for chunk in itertools.batched(record_ids, _KEY_CHUNK_SIZE, strict=False):
+        session.execute(delete(issue).where(issue.record_id.in_(chunk)))
+
+
+def _insert_issues(session: Session, batch: Sequence[ReviewMetadata]) -> None:
+    """Explode each report's issues into review_issues rows."""
+    rows = [
+        {
+            "record_id": metadata.record_id,
+            "position": position,
+            "issue_id": issue.id,
+            "project_name": metadata.project_context.project_name,
+            "created_at": _created_at_key(metadata.created_at),
+            "category": issue.category,
+            "severity": issue.severity,
+            "location": issue.location,
+            "message": issue.message,
+            "fingerprint": _common_tools.issue_fingerprint(issue),
+        }
+        for metadata in batch
+        for position, issue in enumerate(metadata.review_report.issues)
+    ]
+    if rows:
+        session.execute(insert(_models.ReviewIssueRecord), rows)
+
+
+def _storage_encoding(codec: _blobs.Codec | None = None) -> _blobs.BlobEncoding:
+    """Return the blob encoding configured in settings, optionally overriding the codec."""
+    settings = get_settings()
+    return _blobs.BlobEncoding(
+        codec=codec or settings.storage_compression,
+        min_bytes=settings.storage_compression_min_bytes,
+    )
+
+
+def _metadata_to_row(
+    metadata: ReviewMetadata,
+    *,
+    project_context_hash: str,
+    manuscript_hash: str,
+    review_report_hash: str,
+) -> dict[str, Any]:
+    """Flatten review metadata into a ``review_records`` column mapping."""
+    return {
+        "record_id": metadata.record_id,
+        "project_name": metadata.project_context.project_name,
+        "version": metadata.version,
+        "run_id": metadata.run_id,
+        "agent_name": metadata.agent_name,
+        "created_at": _created_at_key(metadata.created_at),
+        "created_at_us": _serialization.epoch_microseconds(metadata.created_at),
+        "approvals_requested": metadata.approvals_requested,
+        "approvals_granted": metadata.approvals_granted,
+        "project_context_json": "",
+        "manuscript_json": "",
+        "review_report_json": "",
+        "status": metadata.review_report.status,
+        "issue_count": len(metadata.review_report.issues),
+        "blocking_issue_count": sum(
+            1 for issue in metadata.review_report.issues if issue.severity == "blocking"
+        ),
+        "confidence_percent": metadata.review_report.confidence_percent,
+        "project_context_hash": project_context_hash,
+        "manuscript_hash": manuscript_hash,
+        "review_report_hash": review_report_hash,
+    }
 
 
 def _load_with_sqlalchemy(
@@ -117,21 +713,432 @@ def _load_with_sqlalchemy(
     project_name: str | None = None,
 ) -> list[ReviewMetadata]:
     """Load review records using SQLAlchemy ORM."""
-    stmt = select(_models.ReviewRecord).order_by(_models.ReviewRecord.created_at.desc())
+    stmt = select(_models.ReviewRecord).order_by(
+        _models.ReviewRecord.created_at_us.desc(), _models.ReviewRecord.record_id.desc()
+    )
 
     if project_name is not None:
         stmt = stmt.where(_models.ReviewRecord.project_name == project_name)
 
     records = session.execute(stmt).scalars().all()
-    return [_record_to_metadata(record) for record in records]
+    return _records_to_metadata(session, records)
+
+
+def _iter_with_sqlalchemy(
+    session: Session,
+    *,
+    project_name: str | None,
+    page_size: int,
+    after: ReviewCursor | None,
+) -> Iterator[ReviewMetadata]:
+    """Yield review records page by page using keyset pagination."""
+    record = _models.ReviewRecord
+    cursor = after
+    while True:
+        stmt = (
+            select(record)
+            .order_by(record.created_at_us.desc(), record.record_id.desc())
+            .limit(page_size)
+            .execution_options(yield_per=min(page_size, STREAM_CHUNK_SIZE))
+        )
+        if project_name is not None:
+            stmt = stmt.where(record.project_name == project_name)
+        if cursor is not None:
+            stmt = stmt.where(*_after_cursor(cursor))
+
+        fetched = 0
+        for partition in session.execute(stmt).scalars().partitions():
+            fetched += len(partition)
+            last = partition[-1]
+            cursor = ReviewCursor(created_at_us=last.created_at_us or 0, record_id=last.record_id)
+            yield from _records_to_metadata(session, partition)
+        if fetched < page_size:
+            return
+
+
+def _rebuild_search_with_sqlalchemy(session: Session, *, batch_size: int) -> int:
+    """Clear the search index and repopulate it from review_records."""
+    _search.require_search_table(session)
+    _search.clear(session)
+    session.commit()
+
+    indexed = 0
+    with _storage.create_read_session_for(session.get_bind()) as read_session:
+        records = _iter_with_sqlalchemy(
+            read_session, project_name=None, page_size=batch_size, after=None
+        )
+        for batch in itertools.batched(records, batch_size, strict=False):
+            _search.index_records(session, batch)
+            session.commit()
+            indexed += len(batch)
+    return indexed
+
+
+def _recompress_with_sqlalchemy(
+    session: Session,
+    encoding: _blobs.BlobEncoding,
+    *,
+    batch_size: int,
+) -> RecompressResult:
+    """Move inline payloads into blobs, then re-encode all blobs."""
+    migrated = _externalize_inline_payloads(session, encoding, batch_size=batch_size)
+    rewritten = _blobs.recode_blobs(session, encoding, batch_size=batch_size)
+    return RecompressResult(records_migrated=migrated, blobs_rewritten=rewritten)
+
+
+def _externalize_inline_payloads(
+    session: Session,
+    encoding: _blobs.BlobEncoding,
+    *,
+    batch_size: int,
+) -> int:
+    """Replace inline JSON columns of legacy rows with blob references."""
+    record = _models.ReviewRecord
+    migrated = 0
+    last_record_id = ""
+    while True:
+        stmt = (
+            select(record)
+            .where(
+                record.record_id > last_record_id,
+                or_(
+                    record.project_context_hash.is_(None),
+                    record.manuscript_hash.is_(None),
+                    record.review_report_hash.is_(None),
+                ),
+            )
+            .order_by(record.record_id)
+            .limit(batch_size)
+        )
+        rows = session.execute(stmt).scalars().all()
+        if not rows:
+            return migrated
+        for row in _records_to_metadata(session, rows):
+            blobs = [
+                _blobs.blob_for_model("project_context", row.project_context, encoding),
+                _blobs.blob_for_model("manuscript", row.manuscript, encoding),
+                _blobs.blob_for_model("review_report", row.review_report, encoding),
+            ]
+            _blobs.store_blobs(session, blobs)
+            session.execute(
+                update(record)
+                .where(record.record_id == row.record_id)
+                .values(
+                    project_context_hash=blobs[0].blob_hash,
+                    manuscript_hash=blobs[1].blob_hash,
+                    review_report_hash=blobs[2].blob_hash,
+                    project_context_json="",
+                    manuscript_json="",
+                    review_report_json="",
+                )
+            )
+        session.commit()
+        migrated += len(rows)
+        last_record_id = rows[-1].record_id
+
+
+def _prune_with_sqlalchemy(
+    session: Session,
+    policy: _retention.RetentionPolicy,
+    *,
+    archive_dir: Path,
+    batch_size: int,
+    vacuum_pages_per_step: int,
+    now: datetime.datetime | None,
+) -> PruneResult:
+    """Archive and delete pruned records batch by batch, then collect blobs and vacuum.
+
+    Batches are read and archived through the read pool; the writer only holds the
+    write lock for each batch's delete, so concurrent saves never wait on archive I/O.
+    """
+    record = _models.ReviewRecord
+    stamp = datetime.datetime.now(tz=datetime.UTC).strftime("%Y%m%dT%H%M%S%fZ")
+    segments: list[Path] = []
+    archived = 0
+    with _storage.create_read_session_for(session.get_bind()) as read_session:
+        boundaries = _retention.pruning_boundaries(read_session, policy, now=now)
+        for project_name, boundary in boundaries.items():
+            after: tuple[int, str] | None = None
+            while True:
+                stmt = select(record).where(_retention.prunable(project_name, boundary))
+                if after is not None:
+                    stmt = stmt.where(tuple_(record.created_at_us, record.record_id) > after)
+                rows = (
+                    read_session.execute(
+                        stmt.order_by(record.created_at_us, record.record_id).limit(batch_size)
+                    )
+                    .scalars()
+                    .all()
+                )
+                if not rows:
+                    break
+                after = (rows[-1].created_at_us or 0, rows[-1].record_id)
+                record_ids = [row.record_id for row in rows]
+                segment = (
+                    archive_dir / f"reviews-{stamp}-{len(segments):05d}{_archive.SEGMENT_SUFFIX}"
+                )
+                _archive.write_segment(segment, _records_to_metadata(read_session, rows))
+                # End the read snapshot so it does not hold back WAL checkpoints.
+                read_session.rollback()
+                segments.append(segment)
+                archived += _delete_pruned(session, project_name, boundary, record_ids)
+                session.commit()
+
+    blobs_deleted = _retention.delete_orphaned_blobs(session, batch_size=batch_size)
+    # Release the writer connection; the vacuum steps check it out on their own.
+    session.commit()
+    pages = _retention.incremental_vacuum(
+        _session_engine(session), pages_per_step=vacuum_pages_per_step
+    )
+    return PruneResult(
+        records_archived=archived,
+        blobs_deleted=blobs_deleted,
+        pages_reclaimed=pages,
+        segments=tuple(segments),
+    )
+
+
+def _delete_pruned(
+    session: Session, project_name: str, boundary: tuple[int, str], record_ids: Sequence[str]
+) -> int:
+    """Delete archived records that are still below the boundary in the writer transaction.
+
+    A record re-saved since it was archived may have moved past the boundary and is kept.
+    Returns the number of records deleted.
+    """
+    record = _models.ReviewRecord
+    still_prunable: list[str] = []
+    for chunk in itertools.batched(record_ids, _KEY_CHUNK_SIZE, strict=False):
+        still_prunable.extend(
+            session.execute(
+                select(record.record_id).where(
+                    record.record_id.in_(chunk), _retention.prunable(project_name, boundary)
+                )
+            ).scalars()
+        )
+    _delete_records(session, still_prunable)
+    return len(still_prunable)
+
+
+def _delete_records(session: Session, record_ids: Sequence[str]) -> None:
+    """Delete review records together with their derived rows."""
+    record = _models.ReviewRecord
+    removed_stats = _stats.fetch_contributions(session, record_ids)
+    _delete_issues(session, record_ids)
+    if _search.has_search_table(session):
+        _search.delete_records(session, record_ids)
+    for chunk in itertools.batched(record_ids, _KEY_CHUNK_SIZE, strict=False):
+        session.execute(delete(record).where(record.record_id.in_(chunk)))
+    _stats.apply_changes(session, removed=removed_stats)
+
+
+def _session_engine(session: Session) -> Engine:
+    """Return the engine a session is bound to."""
+    bind = session.get_bind()
+    return bind if isinstance(bind, Engine) else bind.engine
+
+
+def _query_issues_with_sqlalchemy(
+    session: Session,
+    *,
+    project_name: str | None,
+    severity: str | None,
+    category: str | None,
+    since: datetime.datetime | None,
+    until: datetime.datetime | None,
+    limit: int | None,
+) -> list[StoredReviewIssue]:
+    """Select review issues matching the filters in reverse chronological order."""
+    issue = _models.ReviewIssueRecord
+    stmt = select(issue).order_by(issue.created_at.desc(), issue.record_id.desc(), issue.position)
+    if project_name is not None:
+        stmt = stmt.where(issue.project_name == project_name)
+    if severity is not None:
+        stmt = stmt.where(issue.severity == severity)
+    if category is not None:
+        stmt = stmt.where(issue.category == category)
+    if since is not None:
+        stmt = stmt.where(issue.created_at >= _created_at_key(since))
+    if until is not None:
+        stmt = stmt.where(issue.created_at < _created_at_key(until))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return [
+        StoredReviewIssue(
+            record_id=row.record_id,
+            project_name=row.project_name,
+            created_at=datetime.datetime.fromisoformat(row.created_at),
+            fingerprint=row.fingerprint,
+            issue=_documents.ReviewIssue.model_validate(
+                {
+                    "id": row.issue_id,
+                    "category": row.category,
+                    "severity": row.severity,
+                    "message": row.message,
+                    "location": row.location,
+                }
+            ),
+        )
+        for row in session.execute(stmt).scalars()
+    ]
+
+
+def _after_cursor(cursor: ReviewCursor) -> tuple[ColumnElement[bool], ...]:
+    """Return keyset predicates selecting rows strictly after ``cursor``."""
+    record = _models.ReviewRecord
+    # The leading range predicate keeps the created_at_us index seekable.
+    return (
+        record.created_at_us <= cursor.created_at_us,
+        or_(
+            record.created_at_us < cursor.created_at_us,
+            and_(
+                record.created_at_us == cursor.created_at_us,
+                record.record_id < cursor.record_id,
+            ),
+        ),
+    )
+
+
+def _list_summaries_with_sqlalchemy(
+    session: Session,
+    *,
+    project_name: str | None,
+    limit: int | None,
+    after: ReviewCursor | None,
+) -> list[ReviewRecordSummary]:
+    """Select summary columns only, using the same ordering as the record iterator."""
+    record = _models.ReviewRecord
+    stmt = select(
+        record.record_id,
+        record.project_name,
+        record.version,
+        record.run_id,
+        record.agent_name,
+        record.created_at,
+        record.approvals_requested,
+        record.approvals_granted,
+        record.status,
+        record.issue_count,
+        record.blocking_issue_count,
+    ).order_by(record.created_at_us.desc(), record.record_id.desc())
+    if project_name is not None:
+        stmt = stmt.where(record.project_name == project_name)
+    if after is not None:
+        stmt = stmt.where(*_after_cursor(after))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return [ReviewRecordSummary.model_validate(row._asdict()) for row in session.execute(stmt)]
+
+
+def _latest_with_sqlalchemy(session: Session, project_name: str) -> ReviewMetadata | None:
+    """Follow the latest pointer in project_review_stats to the full record."""
+    stats = _models.ProjectReviewStatsRecord
+    latest_record_id = session.execute(
+        select(stats.latest_record_id).where(stats.project_name == project_name)
+    ).scalar_one_or_none()
+    if latest_record_id is None:
+        return None
+    return _load_one_with_sqlalchemy(session, latest_record_id)
+
+
+def _rebuild_stats_with_sqlalchemy(session: Session) -> int:
+    """Rebuild project_review_stats in one transaction."""
+    try:
+        projects = _stats.rebuild(session)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return projects
+
+
+def _load_one_with_sqlalchemy(session: Session, record_id: str) -> ReviewMetadata | None:
+    """Load and decode a single review record by primary key."""
+    record = session.get(_models.ReviewRecord, record_id)
+    return _records_to_metadata(session, [record])[0] if record is not None else None
 
 
-def _record_to_metadata(record: _models.ReviewRecord) -> ReviewMetadata:
+def _created_at_key(created_at: datetime.datetime) -> str:
+    """Return the normalized UTC string stored in ``review_records.created_at``."""
+    return created_at.astimezone(datetime.UTC).isoformat()
+
+
+def _records_to_metadata(
+    session: Session,
+    records: Sequence[_models.ReviewRecord],
+) -> list[ReviewMetadata]:
+    """Convert ReviewRecords to ReviewMetadata, resolving shared blobs once per call."""
+    hashes = {
+        blob_hash
+        for record in records
+        for blob_hash in (
+            record.project_context_hash,
+            record.manuscript_hash,
+            record.review_report_hash,
+        )
+        if blob_hash is not None
+    }
+    contents = _blobs.fetch_blobs(session, hashes)
+    contexts: dict[str, _shared.ProjectContext] = {}
+    manuscripts: dict[str, _documents.Manuscript] = {}
+    reports: dict[str, _documents.ReviewReport] = {}
+
+    converted: list[ReviewMetadata] = []
+    for record in records:
+        project_context = _resolve_payload(
+            _shared.ProjectContext,
+            inline=record.project_context_json,
+            blob_hash=record.project_context_hash,
+            contents=contents,
+            decoded=contexts,
+        )
+        manuscript = _resolve_payload(
+            _documents.Manuscript,
+            inline=record.manuscript_json,
+            blob_hash=record.manuscript_hash,
+            contents=contents,
+            decoded=manuscripts,
+        )
+        review_report = _resolve_payload(
+            _documents.ReviewReport,
+            inline=record.review_report_json,
+            blob_hash=record.review_report_hash,
+            contents=contents,
+            decoded=reports,
+        )
+        converted.append(_record_to_metadata(record, project_context, manuscript, review_report))
+    return converted
+
+
+def _resolve_payload[ModelT: pydantic.BaseModel](
+    model_type: type[ModelT],
+    *,
+    inline: str,
+    blob_hash: str | None,
+    contents: Mapping[str, bytes],
+    decoded: dict[str, ModelT],
+) -> ModelT:
+    """Decode a payload from its blob, or from the inline column for legacy rows."""
+    if blob_hash is None:
+        return model_type.model_validate_json(inline)
+    if blob_hash not in decoded:
+        try:
+            content = contents[blob_hash]
+        except KeyError as exc:
+            msg = f"Review blob {blob_hash} referenced by review_records is missing"
+            raise _errors.PersistenceError(msg) from exc
+        decoded[blob_hash] = model_type.model_validate_json(content)
+    return decoded[blob_hash]
+
+
+def _record_to_metadata(
+    record: _models.ReviewRecord,
+    project_context: _shared.ProjectContext,
+    manuscript: _documents.Manuscript,
+    review_report: _documents.ReviewReport,
+) -> ReviewMetadata:
     """Convert SQLAlchemy ReviewRecord to ReviewMetadata."""
     created_at_dt = datetime.datetime.fromisoformat(record.created_at)
-    project_context = _shared.ProjectContext.model_validate_json(record.project_context_json)
-    manuscript = _documents.Manuscript.model_validate_json(record.manuscript_json)
-    review_report = _documents.ReviewReport.model_validate_json(record.review_report_json)
 
     return ReviewMetadata(
         record_id=record.record_id,
@@ -152,8 +1159,6 @@ def _record_to_metadata(record: _models.ReviewRecord) -> ReviewMetadata:
 
 def _save_with_sqlite3(connection: sqlite3.Connection, metadata: ReviewMetadata) -> None:
     """Save review record using raw sqlite3 (legacy implementation)."""
-    from specmaker_core.persistence import storage as _storage
-
     # Ensure we have a session instead
     session = _storage.create_session()
     try:
@@ -162,13 +1167,44 @@ def _save_with_sqlite3(connection: sqlite3.Connection, metadata: ReviewMetadata)
         session.close()
 
 
+def _save_many_with_sqlite3(
+    connection: sqlite3.Connection,
+    records: Iterable[ReviewMetadata],
+    *,
+    batch_size: int,
+) -> int:
+    """Save review records in batches using raw sqlite3 (legacy implementation)."""
+    session = _storage.create_session()
+    try:
+        return _save_many_with_sqlalchemy(session, records, batch_size=batch_size)
+    finally:
+        session.close()
+
+
+def _iter_with_sqlite3(
+    connection: sqlite3.Connection,
+    *,
+    project_name: str | None,
+    page_size: int,
+    after: ReviewCursor | None,
+) -> Iterator[ReviewMetadata]:
+    """Stream review records using raw sqlite3 (legacy implementation)."""
+    session = _storage.create_read_session()
+    try:
+        yield from _iter_with_sqlalchemy(
+            session, project_name=project_name, page_size=page_size, after=after
+        )
+    finally:
+        session.close()
+
+
 def _load_with_sqlite3(
     connection: sqlite3.Connection,
     *,
     project_name: str | None = None,
 ) -> list[ReviewMetadata]:
     """Load review records using raw sqlite3 (legacy implementation)."""
-    session = _storage.create_session()
+    session = _storage.create_read_session()
     try:
         return _load_with_sqlalchemy(session, project_name=project_name)
     finally:
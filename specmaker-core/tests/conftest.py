@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import shared as _shared
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.persistence import write_behind as _write_behind
+
+BASE_TIME = datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
+
+
+@dataclass
+class StubRunResult:
+    """Agent run result returned by a faked ``_start_review``."""
+
+    output: Any
+    workflow_run_id: str
+    messages: list[Any] = field(default_factory=list[Any])
+
+    def all_messages(self) -> list[Any]:
+        return self.messages
+
+    def timestamp(self) -> datetime.datetime:
+        return datetime.datetime.now(datetime.UTC)
+
+
+def project_context(tmp_path: Path, project_name: str = "spec") -> _shared.ProjectContext:
+    return _shared.ProjectContext(
+        project_name=project_name,
+        repository_root=tmp_path,
+        description="Test context",
+        audience=["engineers"],
+        constraints=[],
+        created_by="pytest",
+        created_at=BASE_TIME,
+    )
+
+
+def review_record(
+    context: _shared.ProjectContext,
+    *,
+    run_id: str,
+    created_at: datetime.datetime,
+    title: str = "Doc",
+    content: str = "# Heading",
+    report: _documents.ReviewReport | None = None,
+    approvals_requested: int = 0,
+    approvals_granted: int = 0,
+) -> _metadata.ReviewMetadata:
+    """Build the stored metadata of a reviewer run, passing by default."""
+    return _metadata.build_review_metadata(
+        project_context=context,
+        manuscript=_documents.Manuscript(title=title, content_markdown=content),
+        review_report=report or _documents.ReviewReport(status="pass", summary="Looks good"),
+        run_id=run_id,
+        agent_name="reviewer",
+        version=_storage.version_stamp(created_at),
+        created_at=created_at,
+        approvals_requested=approvals_requested,
+        approvals_granted=approvals_granted,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _dispose_engines() -> Iterator[None]:
+    """Stop background writers and release cached SQLite engines after each test."""
+    yield
+    _write_behind.shutdown_write_behind()
+    _storage.dispose_all()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import StubRunResult, project_context
+from pydantic_ai import DeferredToolRequests, DeferredToolResults
+from pydantic_ai.messages import ToolCallPart
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import Settings
+from specmaker_core.review import Completed, Deferred, resume, review
+
+review_module = importlib.import_module("specmaker_core.review")
+
+# Three sections of 40 characters each; a 10-token budget puts each in its own chunk.
+SECTIONS = [f"# Part {name}\n\n{name * 30}" for name in "ABC"]
+
+
+def _manuscript() -> _documents.Manuscript:
+    return _documents.Manuscript(title="Large", content_markdown="\n\n".join(SECTIONS))
+
+
+def _report(part: str, severity: str, status: str, confidence: float) -> _documents.ReviewReport:
+    issues = [
+        {"category": "clarity", "severity": "minor", "message": "Define terms"},
+        {"category": "accuracy", "severity": severity, "message": f"Check part {part}"},
+    ]
+    return _documents.ReviewReport.model_validate(
+        {
+            "status": status,
+            "summary": f"Part {part} reviewed",
+            "issues": issues,
+            "confidence_percent": confidence,
+        }
+    )
+
+
+REPORTS = {
+    "A": _report("A", "major", "changes_required", 90.0),
+    "B": _report("B", "blocking", "blocked", 60.0),
+    "C": _report("C", "minor", "pass", 30.0),
+}
+
+
+@pytest.fixture
+def chunk_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(
+        review_module,
+        "get_settings",
+        lambda: Settings(review_chunk_max_tokens=10, review_chunk_concurrency=2),
+    )
+
+
+@pytest.mark.asyncio
+async def test_chunking_is_off_by_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    titles: list[str] = []
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        titles.append(manuscript.title)
+        return StubRunResult(REPORTS["A"], "run-whole")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "get_settings", Settings)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+
+    sections = [f"# Part {name}\n\n{name * 40_000}" for name in "ABC"]
+    manuscript = _documents.Manuscript(title="Large", content_markdown="\n\n".join(sections))
+    outcome = await review(project_context(tmp_path), manuscript)
+
+    assert isinstance(outcome, Completed)
+    assert titles == ["Large"]
+    assert outcome.value == REPORTS["A"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("chunk_settings")
+async def test_large_manuscript_is_reviewed_in_concurrent_chunks_and_reduced(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    titles: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        titles.append(manuscript.title)
+        part = manuscript.content_markdown.split()[2]
+        return StubRunResult(REPORTS[part], f"run-{part}")
+
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+
+    outcome = await review(project_context(tmp_path), _manuscript())
+
+    assert isinstance(outcome, Completed)
+    assert sorted(titles) == [f"Large (part {index} of 3)" for index in (1, 2, 3)]
+    assert peak == 2
+    report = outcome.value
+    assert report.status == "blocked"
+    assert [issue.message for issue in report.issues] == [
+        "Define terms",
+        "Check part A",
+        "Check part B",
+        "Check part C",
+    ]
+    assert report.confidence_percent == pytest.approx(60.0)
+    assert report.summary == "Part A reviewed\nPart B reviewed\nPart C reviewed"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("chunk_settings")
+async def test_deferred_chunks_are_resumed_then_pending_chunks_reviewed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    approval = ToolCallPart(tool_name="request_approvals", args={}, tool_call_id="call-1")
+    deferred_once: set[str] = set()
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        part = manuscript.content_markdown.split()[2]
+        if part in {"A", "C"} and part not in deferred_once:
+            deferred_once.add(part)
+            return StubRunResult(DeferredToolRequests(approvals=[approval]), f"run-{part}")
+        return StubRunResult(REPORTS[part], f"run-{part}")
+
+    async def fake_resume_review(
+        message_history: list[Any], results: DeferredToolResults
+    ) -> StubRunResult:
+        await asyncio.sleep(0)
+        return StubRunResult(REPORTS["A"], "run-A")
+
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(review_module, "_resume_review", fake_resume_review)
+
+    outcome = await review(project_context(tmp_path), _manuscript())
+    assert isinstance(outcome, Deferred)
+    assert outcome.token.carryover is not None
+    assert len(outcome.token.carryover.pending) == 1
+
+    completed = await resume(outcome.token, DeferredToolResults(approvals={"call-1": True}))
+
+    assert isinstance(completed, Completed)
+    assert completed.approvals_requested == 1
+    assert completed.approvals_granted == 1
+    assert completed.value.status == "blocked"
+    assert {issue.message for issue in completed.value.issues} == {
+        "Define terms",
+        "Check part A",
+        "Check part B",
+        "Check part C",
+    }
+    assert completed.value.confidence_percent == pytest.approx(60.0)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.toolsets import common_tools
+
+
+def test_issue_fingerprint_ignores_id_case_and_whitespace() -> None:
+    first = _documents.ReviewIssue(
+        category="clarity", severity="major", message="Define  the   term", location="Intro"
+    )
+    second = _documents.ReviewIssue(
+        category="clarity", severity="major", message="define the term", location=" intro "
+    )
+    different = first.model_copy(update={"severity": "minor"})
+
+    assert first.id != second.id
+    assert common_tools.issue_fingerprint(first) == common_tools.issue_fingerprint(second)
+    assert common_tools.issue_fingerprint(first) != common_tools.issue_fingerprint(different)
+
+
+def test_dedupe_issues_keeps_first_of_each_fingerprint() -> None:
+    first = _documents.ReviewIssue(category="clarity", severity="major", message="Define it")
+    repeat = first.model_copy(update={"id": "other"})
+    other = _documents.ReviewIssue(category="style", severity="minor", message="Use active voice")
+
+    assert common_tools.dedupe_issues([first, repeat, other]) == [first, other]
+
+
+def test_status_helpers_rank_severity() -> None:
+    minor = _documents.ReviewIssue(category="style", severity="minor", message="Tone")
+    blocking = minor.model_copy(update={"severity": "blocking"})
+
+    assert common_tools.worst_status([]) == "pass"
+    assert common_tools.worst_status(["pass", "blocked", "changes_required"]) == "blocked"
+    assert common_tools.status_for_issues([]) == "pass"
+    assert common_tools.status_for_issues([minor]) == "changes_required"
+    assert common_tools.status_for_issues([minor, blocking]) == "blocked"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, ClassVar
+
+import pytest
+
+from specmaker_core.config.settings import Settings
+from specmaker_core.durable import dbos_boot as _dbos_boot
+
+
+class _FakeDBOS:
+    """Records DBOS lifecycle calls instead of starting a real runtime."""
+
+    calls: ClassVar[list[str]] = []
+
+    def __init__(self, *, config: dict[str, Any]) -> None:
+        self.calls.append(f"init:{config['system_database_url']}")
+
+    @classmethod
+    def launch(cls) -> None:
+        cls.calls.append("launch")
+
+    @classmethod
+    def destroy(cls, *, destroy_registry: bool = False) -> None:
+        cls.calls.append(f"destroy:{destroy_registry}")
+
+
+@pytest.fixture
+def fake_dbos(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    calls: list[str] = []
+    monkeypatch.setattr(_FakeDBOS, "calls", calls)
+    monkeypatch.setattr(_dbos_boot, "DBOS", _FakeDBOS)
+    yield calls
+    _dbos_boot.shutdown_dbos()
+
+
+def test_launch_dbos_boots_once_per_configuration(fake_dbos: list[str]) -> None:
+    settings = Settings(system_database_url="sqlite:///first.db")
+
+    first = _dbos_boot.launch_dbos(settings)
+    second = _dbos_boot.launch_dbos(Settings(system_database_url="sqlite:///first.db"))
+
+    assert second is first
+    assert first.boot_seconds >= 0
+    assert fake_dbos == ["init:sqlite:///first.db", "launch"]
+
+
+def test_launch_dbos_relaunches_when_configuration_changes(fake_dbos: list[str]) -> None:
+    first = _dbos_boot.launch_dbos(Settings(system_database_url="sqlite:///first.db"))
+    second = _dbos_boot.launch_dbos(Settings(system_database_url="sqlite:///second.db"))
+
+    assert second.fingerprint != first.fingerprint
+    assert fake_dbos == [
+        "init:sqlite:///first.db",
+        "launch",
+        "destroy:False",
+        "init:sqlite:///second.db",
+        "launch",
+    ]
+
+
+def test_shutdown_dbos_allows_a_fresh_launch(fake_dbos: list[str]) -> None:
+    settings = Settings(system_database_url="sqlite:///first.db")
+    _dbos_boot.launch_dbos(settings)
+
+    _dbos_boot.shutdown_dbos()
+    _dbos_boot.shutdown_dbos()
+    _dbos_boot.launch_dbos(settings)
+
+    assert fake_dbos == [
+        "init:sqlite:///first.db",
+        "launch",
+        "destroy:False",
+        "init:sqlite:///first.db",
+        "launch",
+    ]
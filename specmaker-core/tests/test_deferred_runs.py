@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import importlib
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import BASE_TIME, StubRunResult, project_context
+from pydantic_ai import DeferredToolRequests, DeferredToolResults
+from pydantic_ai.messages import ModelRequest, ModelResponse, ToolCallPart, UserPromptPart
+
+from specmaker_core._dependencies import errors as _errors
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import Settings
+from specmaker_core.persistence import blobs as _blobs
+from specmaker_core.persistence import deferred_runs as _deferred_runs
+from specmaker_core.persistence import models as _models
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.review import Completed, Deferred, load_deferred, resume_by_id, review
+
+review_module = importlib.import_module("specmaker_core.review")
+
+APPROVAL = ToolCallPart(tool_name="request_approvals", args={"items": []}, tool_call_id="c-1")
+HISTORY = [
+    ModelRequest(parts=[UserPromptPart(content="Review manuscript: Spec")]),
+    ModelResponse(parts=[APPROVAL]),
+]
+
+
+def test_deferred_run_store_compresses_and_expires_entries(tmp_path: Path) -> None:
+    session = _storage.create_session(tmp_path / "runs.db")
+    encoding = _blobs.BlobEncoding(codec="zlib")
+    payload = b'{"token": "' + b"x" * 4096 + b'"}'
+    try:
+        for run_id, ttl_hours in (("run-a", 1), ("run-b", 3)):
+            _deferred_runs.store(
+                session,
+                run_id,
+                payload,
+                project_name="spec",
+                ttl=datetime.timedelta(hours=ttl_hours),
+                encoding=encoding,
+                now=BASE_TIME,
+            )
+        stored = session.get(_models.DeferredRunRecord, "run-a")
+        assert stored is not None
+        assert stored.codec == _blobs.ZLIB_CODEC
+        assert len(stored.payload) < len(payload)
+        assert _deferred_runs.load(session, "run-a", now=BASE_TIME) == payload
+
+        later = BASE_TIME + datetime.timedelta(hours=2)
+        assert _deferred_runs.load(session, "run-a", now=later) is None
+        assert _deferred_runs.evict_expired(session, now=later) == 1
+        assert _deferred_runs.remove(session, "run-b")
+        assert not _deferred_runs.remove(session, "run-b")
+        session.commit()
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def deferring_reviewer(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        return StubRunResult(DeferredToolRequests(approvals=[APPROVAL]), "run-deferred", HISTORY)
+
+    async def fake_resume_review(
+        message_history: list[Any], results: DeferredToolResults
+    ) -> StubRunResult:
+        await asyncio.sleep(0)
+        report = _documents.ReviewReport(status="pass", summary="Approved", confidence_percent=80)
+        return StubRunResult(report, "run-deferred", HISTORY)
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(review_module, "_resume_review", fake_resume_review)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("deferring_reviewer")
+async def test_deferred_review_is_resumed_by_run_id(tmp_path: Path) -> None:
+    manuscript = _documents.Manuscript(title="Spec", content_markdown="# Body")
+    deferred = await review(project_context(tmp_path), manuscript)
+    assert isinstance(deferred, Deferred)
+
+    restored = await load_deferred("run-deferred")
+    assert restored == deferred
+
+    outcome = await resume_by_id("run-deferred", DeferredToolResults(approvals={"c-1": True}))
+
+    assert isinstance(outcome, Completed)
+    assert outcome.approvals_granted == 1
+    assert await load_deferred("run-deferred") is None
+    with pytest.raises(_errors.PersistenceError, match="run-deferred"):
+        await resume_by_id("run-deferred", DeferredToolResults())
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("deferring_reviewer")
+async def test_deferred_reviews_are_not_stored_when_disabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        review_module, "get_settings", lambda: Settings(deferred_run_store_enabled=False)
+    )
+    manuscript = _documents.Manuscript(title="Spec", content_markdown="# Body")
+
+    outcome = await review(project_context(tmp_path), manuscript)
+
+    assert isinstance(outcome, Deferred)
+    assert await load_deferred("run-deferred") is None
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import datetime
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import BASE_TIME, project_context, review_record
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.persistence import archive as _archive
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.toolsets import persistence_tools as _persistence_tools
+
+
+def _record(tmp_path: Path, project_name: str, index: int) -> _metadata.ReviewMetadata:
+    return review_record(
+        project_context(tmp_path, project_name),
+        run_id=f"run-{index}",
+        created_at=BASE_TIME + datetime.timedelta(minutes=index),
+        title=f"Doc {index}",
+    )
+
+
+@pytest.mark.parametrize("name", ["reviews.ndjson", "reviews.ndjson.gz"])
+def test_export_then_import_round_trips_records(tmp_path: Path, name: str) -> None:
+    records = [_record(tmp_path, "spec", index) for index in range(5)]
+    records.append(_record(tmp_path, "other", 0))
+    export_path = tmp_path / "exports" / name
+
+    source = _storage.create_session(tmp_path / "source.db")
+    try:
+        _persistence_tools.save_review_records(source, records)
+        exported = _persistence_tools.export_reviews(source, export_path, page_size=2)
+    finally:
+        source.close()
+
+    target = _storage.create_session(tmp_path / "target.db")
+    try:
+        imported = _persistence_tools.import_reviews(target, export_path, batch_size=4)
+        _persistence_tools.import_reviews(target, export_path)
+        loaded = _persistence_tools.load_review_records(target)
+        stats = _persistence_tools.get_project_stats(target, "spec")
+    finally:
+        target.close()
+
+    assert exported == imported == 6
+    assert sorted(loaded, key=lambda item: item.record_id) == sorted(
+        records, key=lambda item: item.record_id
+    )
+    assert stats is not None
+    assert stats.review_count == 5
+
+
+def test_export_filters_by_project(tmp_path: Path) -> None:
+    records = [_record(tmp_path, "spec", 0), _record(tmp_path, "other", 1)]
+    export_path = tmp_path / "spec.ndjson.gz"
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, records)
+        exported = _persistence_tools.export_reviews(session, export_path, project_name="spec")
+    finally:
+        session.close()
+
+    target = _storage.create_session(tmp_path / "target.db")
+    try:
+        _persistence_tools.import_reviews(target, export_path)
+        loaded = _persistence_tools.load_review_records(target)
+    finally:
+        target.close()
+
+    assert exported == 1
+    assert loaded == records[:1]
+
+
+def test_export_reads_while_another_connection_holds_the_write_lock(tmp_path: Path) -> None:
+    db_path = tmp_path / "reviews.db"
+    records = [_record(tmp_path, "spec", index) for index in range(3)]
+    export_path = tmp_path / "spec.ndjson"
+
+    session = _storage.create_session(db_path)
+    writer = sqlite3.connect(db_path, timeout=0)
+    try:
+        _persistence_tools.save_review_records(session, records)
+        writer.execute("BEGIN IMMEDIATE")
+        exported = _persistence_tools.export_reviews(session, export_path, page_size=2)
+    finally:
+        writer.rollback()
+        writer.close()
+        session.close()
+
+    assert exported == 3
+    assert sorted(_archive.read_segment(export_path), key=lambda item: item.run_id) == records
+
+
+@pytest.mark.parametrize("batch_size", [2, 100])
+def test_import_keeps_the_last_copy_of_a_repeated_record(tmp_path: Path, batch_size: int) -> None:
+    first, second = _record(tmp_path, "spec", 0), _record(tmp_path, "spec", 1)
+    report = _documents.ReviewReport(
+        status="blocked",
+        summary="Re-exported",
+        issues=[_documents.ReviewIssue(category="other", severity="major", message="One")],
+    )
+    revised = first.model_copy(update={"review_report": report})
+    export_path = tmp_path / "concatenated.ndjson"
+    _archive.write_segment(export_path, [first, second, revised, second])
+
+    target = _storage.create_session(tmp_path / "target.db")
+    try:
+        imported = _persistence_tools.import_reviews(target, export_path, batch_size=batch_size)
+        loaded = _persistence_tools.load_review_records(target)
+        issues = _persistence_tools.query_review_issues(target)
+        stats = _persistence_tools.get_project_stats(target, "spec")
+    finally:
+        target.close()
+
+    assert imported == 4
+    assert sorted(loaded, key=lambda item: item.run_id) == [revised, second]
+    assert [item.record_id for item in issues] == [revised.record_id]
+    assert stats is not None
+    assert stats.review_count == 2
+    assert stats.blocked_count == 1
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import StubRunResult, project_context
+from pydantic_ai import DeferredToolRequests
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    ThinkingPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+import specmaker_core._dependencies.utils.handoff as handoff
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import Settings
+from specmaker_core.review import Deferred, review
+
+review_module = importlib.import_module("specmaker_core.review")
+
+APPROVAL_TOOL = "request_approvals"
+
+
+def _exchange(call_id: str, tool_name: str = "lookup", result: str = "x" * 800) -> list[Any]:
+    call = ToolCallPart(tool_name=tool_name, args={"query": call_id}, tool_call_id=call_id)
+    response = ModelResponse(parts=[ThinkingPart(content="t" * 400), call])
+    returned = ToolReturnPart(tool_name=tool_name, content=result, tool_call_id=call_id)
+    return [response, ModelRequest(parts=[returned])]
+
+
+def _history() -> list[ModelMessage]:
+    pending = ToolCallPart(tool_name=APPROVAL_TOOL, args={"items": []}, tool_call_id="pending")
+    return [
+        ModelRequest(parts=[UserPromptPart(content="Review manuscript: Spec")]),
+        *_exchange("old-1"),
+        *_exchange("approved", tool_name=APPROVAL_TOOL, result="Approved: intro"),
+        *_exchange("old-2"),
+        *_exchange("old-3"),
+        ModelResponse(parts=[pending]),
+    ]
+
+
+def _tool_call_ids(messages: list[ModelMessage]) -> list[str]:
+    return [
+        part.tool_call_id
+        for message in messages
+        if isinstance(message, ModelResponse)
+        for part in message.parts
+        if isinstance(part, ToolCallPart)
+    ]
+
+
+def _returned_ids(messages: list[ModelMessage]) -> set[str]:
+    return {
+        part.tool_call_id
+        for message in messages
+        if isinstance(message, ModelRequest)
+        for part in message.parts
+        if isinstance(part, ToolReturnPart)
+    }
+
+
+def test_trim_history_elides_tool_results_before_dropping_exchanges() -> None:
+    history = _history()
+    full = handoff.estimate_history_tokens(history)
+
+    compacted = handoff.trim_history(history, full - 300, keep_tools={APPROVAL_TOOL})
+    assert _tool_call_ids(compacted) == ["old-1", "approved", "old-2", "old-3", "pending"]
+    elided = compacted[2]
+    assert isinstance(elided, ModelRequest)
+    assert isinstance(elided.parts[0], ToolReturnPart)
+    assert elided.parts[0].content == handoff.TRIMMED_RESULT
+    assert handoff.estimate_history_tokens(compacted) <= full - 300
+
+    trimmed = handoff.trim_history(history, 1, keep_tools={APPROVAL_TOOL})
+    assert trimmed[0] == history[0]
+    assert trimmed[-1] == history[-1]
+    assert trimmed[1:3] == history[3:5]
+    # Every call except the pending one keeps its result, so the run can be resumed.
+    assert _tool_call_ids(trimmed) == ["approved", "pending"]
+    assert _returned_ids(trimmed) == {"approved"}
+
+
+def test_trim_history_leaves_small_or_unbudgeted_histories_alone() -> None:
+    history = _history()
+
+    assert handoff.trim_history(history, 0) == history
+    assert handoff.trim_history(history, handoff.estimate_history_tokens(history)) == history
+    with pytest.raises(ValueError, match="max_tokens"):
+        handoff.trim_history(history, -1)
+
+
+@pytest.mark.asyncio
+async def test_deferred_review_token_carries_trimmed_history(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def deferring_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        call = ToolCallPart(tool_name=APPROVAL_TOOL, args={}, tool_call_id="pending")
+        return StubRunResult(DeferredToolRequests(approvals=[call]), "run-deferred", _history())
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", deferring_start_review)
+    monkeypatch.setattr(
+        review_module, "get_settings", lambda: Settings(resume_history_max_tokens=1)
+    )
+    outcome = await review(
+        project_context(tmp_path), _documents.Manuscript(title="Spec", content_markdown="# A")
+    )
+
+    assert isinstance(outcome, Deferred)
+    assert _tool_call_ids(outcome.token.message_history) == ["approved", "pending"]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import BASE_TIME, StubRunResult, project_context, review_record
+from pydantic_ai import DeferredToolRequests, DeferredToolResults
+from pydantic_ai.messages import ToolCallPart
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import Settings
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.review import Completed, Deferred, resume, review
+
+review_module = importlib.import_module("specmaker_core.review")
+
+
+ORIGINAL = (
+    "# Intro\n\nWhy this exists.\n\n# Design\n\nHow it works.\n\n# Rollout\n\nWhen it ships.\n"
+)
+
+
+def _issue(location: str, severity: str = "major") -> _documents.ReviewIssue:
+    return _documents.ReviewIssue.model_validate(
+        {
+            "category": "clarity",
+            "severity": severity,
+            "message": f"Clarify {location}",
+            "location": location,
+        }
+    )
+
+
+def _previous(tmp_path: Path) -> _metadata.ReviewMetadata:
+    report = _documents.ReviewReport(
+        status="blocked",
+        summary="Initial review",
+        issues=[_issue("Intro"), _issue("[design]", "blocking"), _issue("overall tone")],
+        confidence_percent=60.0,
+    )
+    return review_record(
+        project_context(tmp_path),
+        run_id="run-previous",
+        created_at=BASE_TIME,
+        title="Spec",
+        content=ORIGINAL,
+        report=report,
+    )
+
+
+@pytest.fixture
+def sent(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[str]:
+    """Record what is sent to the reviewer, which reports one minor design issue."""
+    monkeypatch.chdir(tmp_path)
+    prompts: list[str] = []
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        prompts.append(manuscript.content_markdown)
+        report = _documents.ReviewReport(
+            status="changes_required",
+            summary="Design revised",
+            issues=[_issue("[design]", "minor")],
+            confidence_percent=90.0,
+        )
+        return StubRunResult(report, "run-incremental")
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    return prompts
+
+
+@pytest.mark.asyncio
+async def test_review_sends_only_changed_sections_and_merges_carried_issues(
+    tmp_path: Path, sent: list[str]
+) -> None:
+    previous = _previous(tmp_path)
+    edited = _documents.Manuscript(
+        title="Spec", content_markdown=ORIGINAL.replace("How it works.", "How it works now.")
+    )
+
+    outcome = await review(project_context(tmp_path), edited, previous=previous)
+
+    assert isinstance(outcome, Completed)
+    (prompt,) = sent
+    assert "How it works now." in prompt
+    assert "Why this exists." not in prompt
+    assert "When it ships." not in prompt
+    # The blocking design issue was in the edited section and is not carried over.
+    assert [issue.location for issue in outcome.value.issues] == [
+        "[design]",
+        "Intro",
+        "overall tone",
+    ]
+    assert outcome.value.status == "changes_required"
+    design_weight = len("# Design\n\nHow it works now.")
+    carried_weight = len("# Intro\n\nWhy this exists.") + len("# Rollout\n\nWhen it ships.")
+    expected = (90.0 * design_weight + 60.0 * carried_weight) / (design_weight + carried_weight)
+    assert outcome.value.confidence_percent == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_review_falls_back_to_full_review_or_reuses_unchanged_report(
+    tmp_path: Path, sent: list[str]
+) -> None:
+    previous = _previous(tmp_path)
+    context = project_context(tmp_path)
+
+    unchanged = await review(context, previous.manuscript, previous=previous)
+    retitled = await review(
+        context,
+        previous.manuscript.model_copy(update={"title": "Renamed spec"}),
+        previous=previous,
+    )
+
+    assert isinstance(unchanged, Completed)
+    assert unchanged.value == previous.review_report
+    assert sent == [ORIGINAL.strip()]
+    assert isinstance(retitled, Completed)
+    assert [issue.location for issue in retitled.value.issues] == ["[design]"]
+
+
+@pytest.mark.asyncio
+async def test_resume_merges_carryover_of_deferred_incremental_review(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sent: list[str]
+) -> None:
+    approval = ToolCallPart(tool_name="request_approvals", args={}, tool_call_id="call-1")
+
+    async def deferring_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        return StubRunResult(DeferredToolRequests(approvals=[approval]), "run-deferred")
+
+    async def fake_resume_review(
+        message_history: list[Any], results: DeferredToolResults
+    ) -> StubRunResult:
+        await asyncio.sleep(0)
+        return StubRunResult(
+            _documents.ReviewReport(status="pass", summary="Approved", confidence_percent=90.0),
+            "run-deferred",
+        )
+
+    monkeypatch.setattr(review_module, "_start_review", deferring_start_review)
+    monkeypatch.setattr(review_module, "_resume_review", fake_resume_review)
+    edited = _documents.Manuscript(
+        title="Spec", content_markdown=ORIGINAL.replace("When it ships.", "Next quarter.")
+    )
+
+    deferred = await review(project_context(tmp_path), edited, previous=_previous(tmp_path))
+    assert isinstance(deferred, Deferred)
+    completed = await resume(deferred.token, DeferredToolResults(approvals={"call-1": True}))
+
+    assert isinstance(completed, Completed)
+    assert completed.value.status == "blocked"
+    assert [issue.location for issue in completed.value.issues] == [
+        "Intro",
+        "[design]",
+        "overall tone",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_reviews_are_not_cached_as_full_reviews(
+    tmp_path: Path, sent: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(review_module, "get_settings", lambda: Settings(review_cache_enabled=True))
+    context = project_context(tmp_path)
+    edited = _documents.Manuscript(
+        title="Spec", content_markdown=ORIGINAL.replace("How it works.", "How it works now.")
+    )
+
+    incremental = await review(context, edited, previous=_previous(tmp_path))
+    full = await review(context, edited)
+
+    assert isinstance(incremental, Completed)
+    assert isinstance(full, Completed)
+    assert not full.cache_hit
+    assert len(sent) == 2
+    assert sent[1] == edited.content_markdown
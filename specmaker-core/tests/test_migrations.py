@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from specmaker_core._dependencies import errors
+from specmaker_core.persistence import migrations as _migrations
+from specmaker_core.persistence import models as _models
+from specmaker_core.persistence import storage as _storage
+
+_LEGACY_SCHEMA = (
+    "CREATE TABLE review_records (record_id VARCHAR PRIMARY KEY, project_name VARCHAR NOT "
+    "NULL, version VARCHAR NOT NULL, run_id VARCHAR NOT NULL, agent_name VARCHAR NOT NULL, "
+    "created_at VARCHAR NOT NULL, approvals_requested INTEGER NOT NULL, approvals_granted "
+    "INTEGER NOT NULL, project_context_json VARCHAR NOT NULL, manuscript_json VARCHAR NOT "
+    "NULL, review_report_json VARCHAR NOT NULL)"
+)
+
+
+def _schema_engine(db_path: Path) -> Engine:
+    engine = create_engine(f"sqlite:///{db_path}")
+    _models.Base.metadata.create_all(engine)
+    return engine
+
+
+def test_fresh_database_is_stamped_with_latest_version(tmp_path: Path) -> None:
+    engine = _storage.get_engine(tmp_path / "reviews.db")
+
+    assert _migrations.current_version(engine) == _migrations.MIGRATIONS[-1].version
+    assert _migrations.run_migrations(engine) == []
+
+
+def test_legacy_database_is_backfilled_and_indexed(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute(_LEGACY_SCHEMA)
+    connection.executemany(
+        "INSERT INTO review_records VALUES (?, 'spec', 'v1', ?, 'reviewer', ?, 0, 0, '{}', "
+        "'{}', '{}')",
+        [
+            ("rec-1", "run-1", "2024-01-01T00:00:00+00:00"),
+            ("rec-2", "run-2", "2024-01-01T05:00:00.000250+05:00"),
+            ("rec-3", "run-3", "1970-01-01T00:00:01+00:00"),
+        ],
+    )
+    connection.commit()
+    connection.close()
+
+    engine = _storage.get_engine(db_path)
+
+    connection = sqlite3.connect(db_path)
+    try:
+        values = connection.execute(
+            "SELECT record_id, created_at_us FROM review_records ORDER BY record_id"
+        ).fetchall()
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = "
+                "'review_records'"
+            )
+        }
+        versions = connection.execute("SELECT version, name FROM schema_version").fetchall()
+    finally:
+        connection.close()
+
+    assert values == [
+        ("rec-1", 1_704_067_200_000_000),
+        ("rec-2", 1_704_067_200_000_250),
+        ("rec-3", 1_000_000),
+    ]
+    assert {
+        "idx_review_records_project_time",
+        "idx_review_records_time",
+        "idx_review_records_manuscript_hash",
+    } <= indexes
+    assert versions[0] == (1, "review_records_created_at_us")
+    assert _migrations.current_version(engine) == _migrations.MIGRATIONS[-1].version
+
+
+def test_run_migrations_applies_only_pending_versions_in_order(tmp_path: Path) -> None:
+    engine = _schema_engine(tmp_path / "reviews.db")
+    calls: list[tuple[str, int]] = []
+    migrations = [
+        _migrations.Migration(1, "first", lambda _engine, size: calls.append(("first", size))),
+        _migrations.Migration(2, "second", lambda _engine, size: calls.append(("second", size))),
+    ]
+
+    assert _migrations.run_migrations(engine, migrations[:1], batch_size=7) == [1]
+    assert _migrations.run_migrations(engine, migrations, batch_size=7) == [2]
+    assert _migrations.run_migrations(engine, migrations) == []
+    assert calls == [("first", 7), ("second", 7)]
+    engine.dispose()
+
+
+def test_run_migrations_rejects_unordered_and_newer_schemas(tmp_path: Path) -> None:
+    engine = _schema_engine(tmp_path / "reviews.db")
+
+    def noop(_engine: Engine, _size: int) -> None:
+        return None
+
+    with pytest.raises(ValueError, match="strictly increasing"):
+        _migrations.run_migrations(
+            engine, [_migrations.Migration(2, "b", noop), _migrations.Migration(1, "a", noop)]
+        )
+
+    _migrations.run_migrations(engine, [_migrations.Migration(3, "future", noop)])
+    with pytest.raises(errors.PersistenceError, match="newer than the latest"):
+        _migrations.run_migrations(engine, [_migrations.Migration(1, "a", noop)])
+    engine.dispose()
@@ -0,0 +1,560 @@
+from __future__ import annotations
+
+import datetime
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import BASE_TIME, project_context, review_record
+from sqlalchemy import text
+
+from specmaker_core._dependencies import errors
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import shared as _shared
+from specmaker_core.config import settings
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.toolsets import persistence_tools as _persistence_tools
+
+
+def _metadata_for(
+    context: _shared.ProjectContext,
+    index: int,
+    *,
+    approvals_granted: int = 0,
+) -> _metadata.ReviewMetadata:
+    return review_record(
+        context,
+        run_id=f"run-{index}",
+        created_at=BASE_TIME + datetime.timedelta(minutes=index),
+        title=f"Doc {index}",
+        approvals_requested=1,
+        approvals_granted=approvals_granted,
+    )
+
+
+def test_save_review_records_writes_batches(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    records = (_metadata_for(context, index) for index in range(7))
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        written = _persistence_tools.save_review_records(session, records, batch_size=3)
+        loaded = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    assert written == 7
+    assert [record.run_id for record in loaded] == [f"run-{index}" for index in range(6, -1, -1)]
+
+
+def test_save_review_records_upserts_on_composite_key(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    original = _metadata_for(context, 0, approvals_granted=0)
+    replayed = _metadata_for(context, 0, approvals_granted=1)
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, [original, _metadata_for(context, 1)])
+        _persistence_tools.save_review_records(session, [replayed])
+        loaded = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    assert len(loaded) == 2
+    by_run = {record.run_id: record for record in loaded}
+    assert by_run["run-0"].approvals_granted == 1
+
+
+def test_save_review_records_rejects_invalid_batch_size(tmp_path: Path) -> None:
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            _persistence_tools.save_review_records(session, [], batch_size=0)
+    finally:
+        session.close()
+
+
+def test_iter_review_records_pages_with_keyset_cursor(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    other = project_context(tmp_path, project_name="other")
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(
+            session,
+            [*(_metadata_for(context, index) for index in range(5)), _metadata_for(other, 9)],
+        )
+        streamed = list(
+            _persistence_tools.iter_review_records(session, project_name="spec", page_size=2)
+        )
+        first_page = streamed[:2]
+        cursor = _persistence_tools.ReviewCursor.from_metadata(first_page[-1])
+        resumed = list(
+            _persistence_tools.iter_review_records(
+                session, project_name="spec", page_size=2, after=cursor
+            )
+        )
+    finally:
+        session.close()
+
+    assert [record.run_id for record in streamed] == ["run-4", "run-3", "run-2", "run-1", "run-0"]
+    assert [record.run_id for record in resumed] == ["run-2", "run-1", "run-0"]
+
+
+def test_iter_review_records_breaks_created_at_ties_by_record_id(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    same_time = [
+        _metadata_for(context, 0).model_copy(update={"record_id": f"rec-{suffix}", "run_id": run})
+        for suffix, run in (("a", "run-a"), ("b", "run-b"), ("c", "run-c"))
+    ]
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, same_time)
+        streamed = list(_persistence_tools.iter_review_records(session, page_size=1))
+    finally:
+        session.close()
+
+    assert [record.record_id for record in streamed] == ["rec-c", "rec-b", "rec-a"]
+
+
+def test_iter_review_records_rejects_invalid_page_size(tmp_path: Path) -> None:
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        with pytest.raises(ValueError, match="page_size must be positive"):
+            _persistence_tools.iter_review_records(session, page_size=0)
+    finally:
+        session.close()
+
+
+def test_list_review_summaries_projects_scalar_columns(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    issue = _documents.ReviewIssue(category="accuracy", severity="blocking", message="Wrong limit")
+    blocked = _metadata_for(context, 1).model_copy(
+        update={
+            "review_report": _documents.ReviewReport(
+                status="blocked", summary="Needs work", issues=[issue]
+            )
+        }
+    )
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, [_metadata_for(context, 0), blocked])
+        summaries = _persistence_tools.list_review_summaries(session, project_name="spec")
+        limited = _persistence_tools.list_review_summaries(session, limit=1)
+        full = _persistence_tools.load_review_record(session, summaries[0].record_id)
+        missing = _persistence_tools.load_review_record(session, "missing")
+    finally:
+        session.close()
+
+    assert [summary.run_id for summary in summaries] == ["run-1", "run-0"]
+    assert summaries[0].status == "blocked"
+    assert summaries[0].issue_count == 1
+    assert summaries[0].blocking_issue_count == 1
+    assert summaries[1].status == "pass"
+    assert len(limited) == 1
+    assert full == blocked
+    assert missing is None
+
+
+def test_legacy_database_gains_summary_columns(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute(
+        "CREATE TABLE review_records (record_id VARCHAR PRIMARY KEY, project_name VARCHAR NOT "
+        "NULL, version VARCHAR NOT NULL, run_id VARCHAR NOT NULL, agent_name VARCHAR NOT NULL, "
+        "created_at VARCHAR NOT NULL, approvals_requested INTEGER NOT NULL, approvals_granted "
+        "INTEGER NOT NULL, project_context_json VARCHAR NOT NULL, manuscript_json VARCHAR NOT "
+        "NULL, review_report_json VARCHAR NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO review_records VALUES ('rec', 'spec', 'v1', 'run', 'reviewer', "
+        "'2024-01-01T00:00:00+00:00', 0, 0, '{}', '{}', '{}')"
+    )
+    connection.commit()
+    connection.close()
+
+    session = _storage.create_session(db_path)
+    try:
+        summaries = _persistence_tools.list_review_summaries(session)
+    finally:
+        session.close()
+
+    assert len(summaries) == 1
+    assert summaries[0].status is None
+    assert summaries[0].issue_count is None
+
+
+def test_save_review_records_deduplicates_shared_payloads(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    manuscript = _documents.Manuscript(title="Shared", content_markdown="# Same body")
+    records = [
+        _metadata_for(context, index).model_copy(update={"manuscript": manuscript})
+        for index in range(3)
+    ]
+    db_path = tmp_path / "reviews.db"
+
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_records(session, records[:2])
+        _persistence_tools.save_review_record(session, records[2])
+        loaded = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    connection = sqlite3.connect(db_path)
+    try:
+        blob_kinds = connection.execute(
+            "SELECT kind FROM review_blobs WHERE kind != 'review_report' ORDER BY kind"
+        ).fetchall()
+        inline = connection.execute(
+            "SELECT DISTINCT project_context_json, manuscript_json, review_report_json "
+            "FROM review_records"
+        ).fetchall()
+    finally:
+        connection.close()
+
+    assert blob_kinds == [("manuscript",), ("project_context",)]
+    assert inline == [("", "", "")]
+    assert sorted(loaded, key=lambda record: record.run_id) == records
+
+
+def test_load_review_records_reads_legacy_inline_payloads(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    legacy = _metadata_for(context, 0)
+    db_path = tmp_path / "reviews.db"
+    _storage.get_engine(db_path)
+
+    connection = sqlite3.connect(db_path)
+    connection.execute(
+        "INSERT INTO review_records (record_id, project_name, version, run_id, agent_name, "
+        "created_at, approvals_requested, approvals_granted, project_context_json, "
+        "manuscript_json, review_report_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            legacy.record_id,
+            context.project_name,
+            legacy.version,
+            legacy.run_id,
+            legacy.agent_name,
+            legacy.created_at.isoformat(),
+            legacy.approvals_requested,
+            legacy.approvals_granted,
+            legacy.project_context.model_dump_json(),
+            legacy.manuscript.model_dump_json(),
+            legacy.review_report.model_dump_json(),
+        ),
+    )
+    connection.commit()
+    connection.close()
+
+    session = _storage.create_session(db_path)
+    try:
+        assert _persistence_tools.load_review_records(session) == [legacy]
+    finally:
+        session.close()
+
+
+def test_missing_blob_raises_persistence_error(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    db_path = tmp_path / "reviews.db"
+
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_record(session, _metadata_for(context, 0))
+        session.execute(text("DELETE FROM review_blobs WHERE kind = 'manuscript'"))
+        session.commit()
+        with pytest.raises(errors.PersistenceError, match="is missing"):
+            _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+
+def test_compressed_payloads_round_trip(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        _persistence_tools,
+        "get_settings",
+        lambda: settings.Settings(storage_compression="zlib", storage_compression_min_bytes=0),
+    )
+    context = project_context(tmp_path)
+    record = _metadata_for(context, 0).model_copy(
+        update={
+            "manuscript": _documents.Manuscript(
+                title="Long", content_markdown="# Spec\n" + "Rate limits apply. " * 200
+            )
+        }
+    )
+    db_path = tmp_path / "reviews.db"
+
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_record(session, record)
+        loaded = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    connection = sqlite3.connect(db_path)
+    try:
+        codec, size = connection.execute(
+            "SELECT codec, size_bytes FROM review_blobs WHERE kind = 'manuscript'"
+        ).fetchone()
+    finally:
+        connection.close()
+
+    assert loaded == [record]
+    assert codec == "zlib"
+    assert size < len(record.manuscript.model_dump_json())
+
+
+def test_recompress_payloads_migrates_inline_rows_and_recodes_blobs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        _persistence_tools,
+        "get_settings",
+        lambda: settings.Settings(storage_compression="none", storage_compression_min_bytes=0),
+    )
+    context = project_context(tmp_path)
+    legacy = _metadata_for(context, 0)
+    current = _metadata_for(context, 1)
+    db_path = tmp_path / "reviews.db"
+
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_record(session, current)
+        session.execute(
+            text(
+                "INSERT INTO review_records (record_id, project_name, version, run_id, "
+                "agent_name, created_at, approvals_requested, approvals_granted, "
+                "project_context_json, manuscript_json, review_report_json) VALUES "
+                "(:record_id, 'spec', :version, :run_id, 'reviewer', :created_at, 1, 0, "
+                ":context, :manuscript, :report)"
+            ),
+            {
+                "record_id": legacy.record_id,
+                "version": legacy.version,
+                "run_id": legacy.run_id,
+                "created_at": legacy.created_at.isoformat(),
+                "context": legacy.project_context.model_dump_json(),
+                "manuscript": legacy.manuscript.model_dump_json(),
+                "report": legacy.review_report.model_dump_json(),
+            },
+        )
+        session.commit()
+
+        result = _persistence_tools.recompress_payloads(session, codec="zlib", batch_size=1)
+        again = _persistence_tools.recompress_payloads(session, codec="zlib", batch_size=1)
+        loaded = _persistence_tools.load_review_records(session)
+        inline = session.execute(
+            text("SELECT COUNT(*) FROM review_records WHERE review_report_json != ''")
+        ).scalar_one()
+    finally:
+        session.close()
+
+    assert result.records_migrated == 1
+    assert result.blobs_rewritten > 0
+    assert again == _persistence_tools.RecompressResult(records_migrated=0, blobs_rewritten=0)
+    assert inline == 0
+    assert sorted(loaded, key=lambda item: item.run_id) == [legacy, current]
+
+
+def test_query_review_issues_filters_by_project_severity_and_time(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    other = project_context(tmp_path, project_name="other")
+
+    def with_issues(
+        metadata: _metadata.ReviewMetadata, *issues: _documents.ReviewIssue
+    ) -> _metadata.ReviewMetadata:
+        report = _documents.ReviewReport(
+            status="changes_required", summary="Needs work", issues=list(issues)
+        )
+        return metadata.model_copy(update={"review_report": report})
+
+    blocking = _documents.ReviewIssue(
+        category="accuracy", severity="blocking", message="Rate limit is wrong", location="API"
+    )
+    minor = _documents.ReviewIssue(category="grammar", severity="minor", message="Typo")
+    records = [
+        with_issues(_metadata_for(context, 0), blocking),
+        with_issues(_metadata_for(context, 10), minor, blocking),
+        with_issues(_metadata_for(other, 20), blocking),
+    ]
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, records)
+        recent_blocking = _persistence_tools.query_review_issues(
+            session,
+            project_name="spec",
+            severity="blocking",
+            since=BASE_TIME + datetime.timedelta(minutes=5),
+        )
+        all_blocking = _persistence_tools.query_review_issues(session, severity="blocking")
+        grammar = _persistence_tools.query_review_issues(session, category="grammar", limit=5)
+        early = _persistence_tools.query_review_issues(
+            session, until=BASE_TIME + datetime.timedelta(minutes=5)
+        )
+    finally:
+        session.close()
+
+    assert [item.record_id for item in recent_blocking] == [records[1].record_id]
+    assert recent_blocking[0].issue == blocking
+    assert [item.project_name for item in all_blocking] == ["other", "spec", "spec"]
+    assert len({item.fingerprint for item in all_blocking}) == 1
+    assert [item.issue for item in grammar] == [minor]
+    assert [item.record_id for item in early] == [records[0].record_id]
+
+
+def test_resaving_record_replaces_its_issues(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    first = _metadata_for(context, 0).model_copy(
+        update={
+            "review_report": _documents.ReviewReport(
+                status="blocked",
+                summary="Broken",
+                issues=[
+                    _documents.ReviewIssue(category="other", severity="major", message="One"),
+                    _documents.ReviewIssue(category="other", severity="major", message="Two"),
+                ],
+            )
+        }
+    )
+    replay = first.model_copy(
+        update={
+            "record_id": "replayed",
+            "review_report": _documents.ReviewReport(status="pass", summary="Fixed"),
+        }
+    )
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_record(session, first)
+        assert len(_persistence_tools.query_review_issues(session)) == 2
+        _persistence_tools.save_review_record(session, replay)
+        remaining = _persistence_tools.query_review_issues(session)
+    finally:
+        session.close()
+
+    assert remaining == []
+
+
+def test_save_review_records_tolerates_repeated_record_with_issues(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    report = _documents.ReviewReport(
+        status="blocked",
+        summary="Broken",
+        issues=[_documents.ReviewIssue(category="other", severity="major", message="One")],
+    )
+    record = _metadata_for(context, 0).model_copy(update={"review_report": report})
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        written = _persistence_tools.save_review_records(session, [record, record])
+        issues = _persistence_tools.query_review_issues(session)
+        loaded = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    assert written == 2
+    assert [item.record_id for item in issues] == [record.record_id]
+    assert [item.record_id for item in loaded] == [record.record_id]
+
+
+def _searchable_record(
+    context: _shared.ProjectContext, index: int, content: str, issue_message: str
+) -> _metadata.ReviewMetadata:
+    report = _documents.ReviewReport(
+        status="changes_required",
+        summary=f"Review of document {index}",
+        issues=[
+            _documents.ReviewIssue(category="accuracy", severity="major", message=issue_message)
+        ],
+    )
+    manuscript = _documents.Manuscript(title=f"Doc {index}", content_markdown=content)
+    return _metadata_for(context, index).model_copy(
+        update={"manuscript": manuscript, "review_report": report}
+    )
+
+
+def test_search_reviews_ranks_hits_with_snippets(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    other = project_context(tmp_path, project_name="other")
+    records = [
+        _searchable_record(context, 0, "# API\nClients retry on errors.", "Missing rate limit"),
+        _searchable_record(context, 1, "# Storage\nWe shard by tenant.", "Unclear sharding"),
+        _searchable_record(other, 2, "# Limits\nThe rate limit is 10 rps.", "Too strict"),
+    ]
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, records)
+        hits = _persistence_tools.search_reviews(session, '"rate limit"')
+        scoped = _persistence_tools.search_reviews(session, "rate", project_name="spec")
+        with pytest.raises(errors.ValidationError, match="Invalid review search query"):
+            _persistence_tools.search_reviews(session, '"unterminated')
+    finally:
+        session.close()
+
+    assert {hit.record_id for hit in hits} == {records[0].record_id, records[2].record_id}
+    assert all("[" in hit.snippet for hit in hits)
+    assert [hit.record_id for hit in scoped] == [records[0].record_id]
+
+
+def test_repeated_record_is_indexed_once(tmp_path: Path) -> None:
+    record = _metadata_for(project_context(tmp_path), 0)
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, [record, record])
+        hits = _persistence_tools.search_reviews(session, "good")
+    finally:
+        session.close()
+
+    assert [hit.record_id for hit in hits] == [record.record_id]
+
+
+def test_search_index_is_incremental_and_rebuildable(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+    original = _searchable_record(context, 0, "# Cache\nEntries expire hourly.", "Stale reads")
+    edited = _searchable_record(context, 0, "# Cache\nEntries expire daily.", "Eviction unclear")
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_record(session, original)
+        _persistence_tools.save_review_record(session, edited)
+        assert _persistence_tools.search_reviews(session, "hourly") == []
+        assert len(_persistence_tools.search_reviews(session, "daily")) == 1
+
+        session.execute(text("DELETE FROM review_search"))
+        session.commit()
+        assert _persistence_tools.search_reviews(session, "daily") == []
+
+        rebuilt = _persistence_tools.rebuild_search_index(session, batch_size=1)
+        hits = _persistence_tools.search_reviews(session, "eviction")
+    finally:
+        session.close()
+
+    assert rebuilt == 1
+    assert [hit.record_id for hit in hits] == [edited.record_id]
+
+
+def test_saves_and_search_without_fts_table(tmp_path: Path) -> None:
+    context = project_context(tmp_path)
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        session.execute(text("DROP TABLE review_search"))
+        session.commit()
+        _persistence_tools.save_review_record(session, _metadata_for(context, 0))
+        with pytest.raises(errors.PersistenceError, match="FTS5"):
+            _persistence_tools.search_reviews(session, "anything")
+        with pytest.raises(errors.PersistenceError, match="FTS5"):
+            _persistence_tools.rebuild_search_index(session)
+        assert len(_persistence_tools.load_review_records(session)) == 1
+    finally:
+        session.close()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import datetime
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import BASE_TIME, project_context, review_record
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import shared as _shared
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.persistence import retention as _retention
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.toolsets import persistence_tools as _persistence_tools
+
+
+def _record(
+    context: _shared.ProjectContext,
+    index: int,
+    status: _documents.ReviewStatus,
+    confidence: float,
+) -> _metadata.ReviewMetadata:
+    return review_record(
+        context,
+        run_id=f"run-{index}",
+        created_at=BASE_TIME + datetime.timedelta(minutes=index),
+        title=f"Doc {index}",
+        report=_documents.ReviewReport(
+            status=status, summary="Summary", confidence_percent=confidence
+        ),
+    )
+
+
+def test_saves_maintain_project_stats_and_latest_pointer(tmp_path: Path) -> None:
+    spec = project_context(tmp_path, "spec")
+    other = project_context(tmp_path, "other")
+    records = [
+        _record(spec, 0, "pass", 80.0),
+        _record(spec, 2, "changes_required", 60.0),
+        _record(spec, 1, "blocked", 40.0),
+        _record(other, 0, "pass", 90.0),
+    ]
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, records[:2])
+        _persistence_tools.save_review_record(session, records[2])
+        _persistence_tools.save_review_record(session, records[3])
+        stats = _persistence_tools.get_project_stats(session, "spec")
+        latest = _persistence_tools.get_latest_review(session, "spec")
+        listed = _persistence_tools.list_project_stats(session)
+        missing = _persistence_tools.get_project_stats(session, "missing")
+    finally:
+        session.close()
+
+    assert stats == _metadata.ProjectReviewStats(
+        project_name="spec",
+        review_count=3,
+        pass_count=1,
+        changes_required_count=1,
+        blocked_count=1,
+        average_confidence_percent=60.0,
+        latest_record_id=records[1].record_id,
+        latest_created_at=records[1].created_at,
+    )
+    assert latest == records[1]
+    assert [item.project_name for item in listed] == ["other", "spec"]
+    assert missing is None
+
+
+def test_resaving_a_record_replaces_its_contribution(tmp_path: Path) -> None:
+    spec = project_context(tmp_path, "spec")
+    first = _record(spec, 0, "blocked", 10.0)
+    revised = first.model_copy(
+        update={
+            "review_report": _documents.ReviewReport(
+                status="pass", summary="Fixed", confidence_percent=90.0
+            )
+        }
+    )
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_record(session, first)
+        _persistence_tools.save_review_records(session, [first, revised])
+        stats = _persistence_tools.get_project_stats(session, "spec")
+    finally:
+        session.close()
+
+    assert stats is not None
+    assert (stats.review_count, stats.pass_count, stats.blocked_count) == (1, 1, 0)
+    assert stats.average_confidence_percent == pytest.approx(90.0)
+
+
+def test_pruning_updates_stats_and_rebuild_matches(tmp_path: Path) -> None:
+    spec = project_context(tmp_path, "spec")
+    other = project_context(tmp_path, "other")
+    records = [_record(spec, index, "pass", 50.0 + index) for index in range(4)]
+    records.append(_record(other, 0, "blocked", 5.0))
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, records)
+        _persistence_tools.prune_reviews(
+            session,
+            _retention.RetentionPolicy(keep_last=2),
+            archive_dir=tmp_path / "archive",
+        )
+        pruned = _persistence_tools.list_project_stats(session)
+        assert _persistence_tools.rebuild_project_stats(session) == 2
+        rebuilt = _persistence_tools.list_project_stats(session)
+        _persistence_tools.prune_reviews(
+            session,
+            _retention.RetentionPolicy(keep_last=0),
+            archive_dir=tmp_path / "archive",
+        )
+        emptied = _persistence_tools.list_project_stats(session)
+    finally:
+        session.close()
+
+    spec_stats = next(item for item in pruned if item.project_name == "spec")
+    assert spec_stats.review_count == 2
+    assert spec_stats.average_confidence_percent == pytest.approx(52.5)
+    assert spec_stats.latest_record_id == records[3].record_id
+    assert rebuilt == pruned
+    assert emptied == []
+
+
+def test_migration_backfills_summaries_and_stats_for_legacy_rows(tmp_path: Path) -> None:
+    legacy = _record(project_context(tmp_path, "spec"), 0, "changes_required", 70.0)
+    db_path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute(
+        "CREATE TABLE review_records (record_id VARCHAR PRIMARY KEY, project_name VARCHAR NOT "
+        "NULL, version VARCHAR NOT NULL, run_id VARCHAR NOT NULL, agent_name VARCHAR NOT NULL, "
+        "created_at VARCHAR NOT NULL, approvals_requested INTEGER NOT NULL, approvals_granted "
+        "INTEGER NOT NULL, project_context_json VARCHAR NOT NULL, manuscript_json VARCHAR NOT "
+        "NULL, review_report_json VARCHAR NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO review_records VALUES (?, 'spec', ?, ?, 'reviewer', ?, 0, 0, ?, ?, ?)",
+        (
+            legacy.record_id,
+            legacy.version,
+            legacy.run_id,
+            legacy.created_at.isoformat(),
+            legacy.project_context.model_dump_json(),
+            legacy.manuscript.model_dump_json(),
+            legacy.review_report.model_dump_json(),
+        ),
+    )
+    connection.commit()
+    connection.close()
+
+    session = _storage.create_session(db_path)
+    try:
+        stats = _persistence_tools.get_project_stats(session, "spec")
+        summaries = _persistence_tools.list_review_summaries(session)
+    finally:
+        session.close()
+
+    assert stats is not None
+    assert stats.changes_required_count == 1
+    assert stats.average_confidence_percent == pytest.approx(70.0)
+    assert stats.latest_record_id == legacy.record_id
+    assert summaries[0].status == "changes_required"
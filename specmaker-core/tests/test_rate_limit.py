@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from specmaker_core.config.settings import Settings
+from specmaker_core.durable import rate_limit as _rate_limit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_the_burst_are_spaced_at_the_refill_rate() -> None:
+    # 600 requests/minute refills one request every 0.1s; the burst holds two.
+    limiter = _rate_limit.RateLimiter(requests_per_minute=600, burst_seconds=0.2, clock=FakeClock())
+
+    reservations = await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    waits = [reservation.wait_seconds for reservation in reservations]
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    stats = limiter.stats()
+    assert stats.requests == 4
+    assert stats.waited_requests == 2
+    assert stats.max_wait_seconds == pytest.approx(0.2)
+    assert stats.mean_wait_seconds == pytest.approx(0.075)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_reservation() -> None:
+    clock = FakeClock()
+    limiter = _rate_limit.RateLimiter(requests_per_minute=60, burst_seconds=1, clock=clock)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # Without the refund this caller would still queue behind the cancelled one.
+    clock.now = 1.0
+    reservation = await limiter.acquire()
+    assert reservation.wait_seconds == 0
+    assert limiter.stats().requests == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_refund_runs_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = FakeClock()
+    limiter = _rate_limit.RateLimiter(
+        requests_per_minute=60, burst_seconds=1, db_path=tmp_path / "limits.db", clock=clock
+    )
+    threads: list[threading.Thread] = []
+    take = _rate_limit._SharedBuckets.take
+
+    def recording_take(self: Any, amounts: Mapping[str, float]) -> float:
+        threads.append(threading.current_thread())
+        return take(self, amounts)
+
+    monkeypatch.setattr(_rate_limit._SharedBuckets, "take", recording_take)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    clock.now = 1.0
+    reservation = await limiter.acquire()
+
+    assert reservation.wait_seconds == 0
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_interrupted_stream_still_settles_its_reservation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = _rate_limit.RateLimiter(tokens_per_minute=6000, clock=FakeClock())
+    settled: list[tuple[int, int]] = []
+
+    async def record_settle(reservation: _rate_limit.Reservation, used_tokens: int) -> None:
+        await asyncio.sleep(0)
+        settled.append((reservation.tokens, used_tokens))
+
+    async def stream_text(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        await asyncio.sleep(0)
+        yield "partial " * 50
+
+    monkeypatch.setattr(limiter, "settle", record_settle)
+    model = _rate_limit.RateLimitedModel(FunctionModel(stream_function=stream_text), limiter)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart(content="Hi")])]
+
+    with pytest.raises(RuntimeError, match="consumer failed"):
+        async with model.request_stream(messages, None, ModelRequestParameters()) as stream:
+            async for _ in stream:
+                raise RuntimeError("consumer failed")
+
+    [(reserved, used)] = settled
+    assert used >= reserved > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_model_reconciles_estimated_tokens_with_usage() -> None:
+    clock = FakeClock()
+    # 6000 tokens/minute refills 100 tokens per second; the burst holds 10.
+    limiter = _rate_limit.RateLimiter(tokens_per_minute=6000, burst_seconds=0.1, clock=clock)
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        return ModelResponse(
+            parts=[TextPart(content="ok")], usage=RequestUsage(input_tokens=25, output_tokens=5)
+        )
+
+    model = _rate_limit.RateLimitedModel(FunctionModel(respond), limiter)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart(content="Hi")])]
+
+    response = await model.request(messages, None, ModelRequestParameters())
+
+    assert response.usage.total_tokens == 30
+    # The bucket owes 20 tokens beyond its capacity; after 0.25s it holds 5 again.
+    clock.now = 0.25
+    reservation = await limiter.acquire(tokens=10)
+    assert reservation.wait_seconds == pytest.approx(0.05)
+
+
+@pytest.mark.asyncio
+async def test_shared_limiters_draw_from_one_sqlite_budget(tmp_path: Path) -> None:
+    clock = FakeClock()
+    db_path = tmp_path / "limits.db"
+    first, second = (
+        _rate_limit.RateLimiter(
+            requests_per_minute=600, burst_seconds=0.2, db_path=db_path, clock=clock
+        )
+        for _ in range(2)
+    )
+
+    await first.acquire()
+    await first.acquire()
+    reservation = await second.acquire()
+
+    assert reservation.wait_seconds == pytest.approx(0.1)
+    assert first.stats().waited_requests == 0
+    assert second.stats().waited_requests == 1
+
+
+def test_rate_limiter_is_disabled_without_budgets() -> None:
+    _rate_limit.reset_rate_limiter()
+    try:
+        limiter = _rate_limit.get_rate_limiter(Settings())
+        assert not limiter.enabled
+        assert _rate_limit.get_rate_limiter() is limiter
+    finally:
+        _rate_limit.reset_rate_limiter()
+    with pytest.raises(ValueError, match="burst_seconds"):
+        _rate_limit.RateLimiter(requests_per_minute=1, burst_seconds=0)
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import datetime
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import BASE_TIME, project_context, review_record
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import shared as _shared
+from specmaker_core._dependencies.utils import serialization as _serialization
+from specmaker_core.persistence import archive as _archive
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.persistence import retention as _retention
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.toolsets import persistence_tools as _persistence_tools
+
+
+def _record(
+    context: _shared.ProjectContext, index: int, *, body: str = "# Heading"
+) -> _metadata.ReviewMetadata:
+    issue = _documents.ReviewIssue(category="clarity", severity="minor", message=f"Issue {index}")
+    return review_record(
+        context,
+        run_id=f"{context.project_name}-run-{index}",
+        created_at=BASE_TIME + datetime.timedelta(days=index),
+        title=f"Doc {index}",
+        content=body,
+        report=_documents.ReviewReport(
+            status="changes_required", summary="Needs work", issues=[issue]
+        ),
+    )
+
+
+def _count(db_path: Path, table: str) -> int:
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_prune_keeps_newest_records_and_archives_the_rest(tmp_path: Path) -> None:
+    spec = project_context(tmp_path, "spec")
+    other = project_context(tmp_path, "other")
+    records = [_record(spec, index) for index in range(5)] + [_record(other, 0)]
+    db_path = tmp_path / "reviews.db"
+
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_records(session, records)
+        result = _persistence_tools.prune_reviews(
+            session,
+            _retention.RetentionPolicy(keep_last=2),
+            archive_dir=tmp_path / "archive",
+            batch_size=2,
+        )
+        remaining = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    archived = [record for segment in result.segments for record in _archive.read_segment(segment)]
+    assert result.records_archived == 3
+    assert len(result.segments) == 2
+    assert archived == records[:3]
+    assert {record.run_id for record in remaining} == {
+        "spec-run-3",
+        "spec-run-4",
+        "other-run-0",
+    }
+    assert _count(db_path, "review_issues") == 3
+    # Each pruned record owned a distinct manuscript and report; the context is shared.
+    assert result.blobs_deleted == 6
+    assert _count(db_path, "review_blobs") == 8
+    assert not list((tmp_path / "archive").glob(".partial-*"))
+
+
+def test_prune_archives_without_holding_the_write_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = project_context(tmp_path, "spec")
+    records = [_record(spec, index) for index in range(3)]
+    db_path = tmp_path / "reviews.db"
+    write_segment = _archive.write_segment
+    concurrent_writes: list[int] = []
+
+    def write_segment_during_save(path: Path, segment_records: Any) -> int:
+        written = write_segment(path, segment_records)
+        # A concurrent writer must be able to commit while the segment is written.
+        writer = sqlite3.connect(db_path, timeout=0)
+        try:
+            writer.execute("BEGIN IMMEDIATE")
+            writer.execute("UPDATE review_records SET agent_name = 'live' WHERE 0")
+            writer.commit()
+        finally:
+            writer.close()
+        concurrent_writes.append(written)
+        return written
+
+    monkeypatch.setattr(_archive, "write_segment", write_segment_during_save)
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_records(session, records)
+        result = _persistence_tools.prune_reviews(
+            session,
+            _retention.RetentionPolicy(keep_last=1),
+            archive_dir=tmp_path / "archive",
+            batch_size=1,
+        )
+    finally:
+        session.close()
+
+    assert concurrent_writes == [1, 1]
+    assert result.records_archived == 2
+
+
+def test_prune_keeps_and_does_not_count_records_resaved_while_archiving(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = project_context(tmp_path, "spec")
+    records = [_record(spec, index) for index in range(3)]
+    db_path = tmp_path / "reviews.db"
+    write_segment = _archive.write_segment
+
+    def write_segment_during_resave(path: Path, segment_records: Any) -> int:
+        written = write_segment(path, segment_records)
+        # Another process re-saves the oldest record as the newest one meanwhile.
+        writer = sqlite3.connect(db_path)
+        try:
+            writer.execute(
+                "UPDATE review_records SET created_at_us = ? WHERE record_id = ?",
+                (
+                    _serialization.epoch_microseconds(BASE_TIME + datetime.timedelta(days=7)),
+                    records[0].record_id,
+                ),
+            )
+            writer.commit()
+        finally:
+            writer.close()
+        return written
+
+    monkeypatch.setattr(_archive, "write_segment", write_segment_during_resave)
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_records(session, records)
+        result = _persistence_tools.prune_reviews(
+            session, _retention.RetentionPolicy(keep_last=1), archive_dir=tmp_path / "archive"
+        )
+        kept = {item.record_id for item in _persistence_tools.load_review_records(session)}
+    finally:
+        session.close()
+
+    assert result.records_archived == 1
+    assert kept == {records[0].record_id, records[2].record_id}
+
+
+def test_prune_older_than_respects_keep_last_floor(tmp_path: Path) -> None:
+    spec = project_context(tmp_path, "spec")
+    records = [_record(spec, index) for index in range(4)]
+    now = BASE_TIME + datetime.timedelta(days=10)
+
+    session = _storage.create_session(tmp_path / "reviews.db")
+    try:
+        _persistence_tools.save_review_records(session, records)
+        only_age = _retention.pruning_boundaries(
+            session, _retention.RetentionPolicy(older_than=datetime.timedelta(days=8)), now=now
+        )
+        recent_only = _retention.pruning_boundaries(
+            session, _retention.RetentionPolicy(older_than=datetime.timedelta(days=20)), now=now
+        )
+        result = _persistence_tools.prune_reviews(
+            session,
+            _retention.RetentionPolicy(keep_last=3, older_than=datetime.timedelta(days=8)),
+            archive_dir=tmp_path / "archive",
+            now=now,
+        )
+        remaining = _persistence_tools.load_review_records(session)
+    finally:
+        session.close()
+
+    assert set(only_age) == {"spec"}
+    assert set(recent_only) == set()
+    assert result.records_archived == 1
+    assert [record.run_id for record in remaining] == ["spec-run-3", "spec-run-2", "spec-run-1"]
+
+
+def test_prune_reclaims_pages_with_incremental_vacuum(tmp_path: Path) -> None:
+    spec = project_context(tmp_path, "spec")
+    records = [_record(spec, index, body=f"{index} " + "x" * 20_000) for index in range(20)]
+    db_path = tmp_path / "reviews.db"
+
+    session = _storage.create_session(db_path)
+    try:
+        _persistence_tools.save_review_records(session, records)
+        result = _persistence_tools.prune_reviews(
+            session,
+            _retention.RetentionPolicy(keep_last=0),
+            archive_dir=tmp_path / "archive",
+            vacuum_pages_per_step=8,
+        )
+    finally:
+        session.close()
+
+    connection = sqlite3.connect(db_path)
+    try:
+        auto_vacuum = connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+        free_pages = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    finally:
+        connection.close()
+    assert result.records_archived == 20
+    assert auto_vacuum == 2
+    assert result.pages_reclaimed > 0
+    assert free_pages == 0
+
+
+def test_enable_incremental_vacuum_converts_existing_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE filler (value BLOB)")
+    connection.commit()
+    connection.close()
+    engine = _storage.get_engine(db_path)
+
+    assert _retention.enable_incremental_vacuum(engine) is True
+    assert _retention.enable_incremental_vacuum(engine) is False
+
+
+@pytest.mark.parametrize("name", ["segment.ndjson", "segment.ndjson.gz"])
+def test_archive_segments_round_trip(tmp_path: Path, name: str) -> None:
+    records = [_record(project_context(tmp_path, "spec"), index) for index in range(3)]
+    path = tmp_path / name
+
+    assert _archive.write_segment(path, iter(records)) == 3
+    assert list(_archive.read_segment(path)) == records
+
+
+def test_retention_policy_requires_a_criterion() -> None:
+    with pytest.raises(ValueError, match="requires keep_last"):
+        _retention.RetentionPolicy()
+    with pytest.raises(ValueError, match="must not be negative"):
+        _retention.RetentionPolicy(keep_last=-1)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import importlib
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,7 @@ from pydantic_ai.messages import ToolCallPart
 from specmaker_core._dependencies.schemas import documents as _documents
 from specmaker_core._dependencies.schemas import shared as _shared
 from specmaker_core.agents import reviewer as _reviewer
+from specmaker_core.config.settings import Settings
 from specmaker_core.persistence import metadata as _metadata
 from specmaker_core.persistence import storage as _storage
 from specmaker_core.persistence.storage import open_db
@@ -314,6 +316,67 @@ async def test_review_completed_handles_persistence_failure(
         await review(context, manuscript)
 
 
+@pytest.mark.asyncio
+async def test_review_persists_off_the_event_loop_thread(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    context = _project_context(tmp_path)
+    manuscript = _manuscript()
+    stub_result = StubRunResult(_report(), "run-threaded", [], datetime.datetime.now(datetime.UTC))
+    persist_threads: list[int] = []
+
+    async def fake_start_review(arg: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        return stub_result
+
+    def fake_save_review_record(connection: Any, metadata: Any) -> None:
+        persist_threads.append(threading.get_ident())
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(review_module, "save_review_record", fake_save_review_record)
+
+    outcome = await review(context, manuscript)
+
+    assert isinstance(outcome, Completed)
+    assert len(persist_threads) == 1
+    assert persist_threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_review_write_behind_mode_commits_before_returning(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    context = _project_context(tmp_path)
+    stub_result = StubRunResult(
+        _report(), "run-write-behind", [], datetime.datetime.now(datetime.UTC)
+    )
+
+    async def fake_start_review(arg: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        return stub_result
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(
+        review_module, "get_settings", lambda: Settings(persistence_mode="write_behind")
+    )
+
+    outcome = await review(context, _manuscript())
+
+    assert isinstance(outcome, Completed)
+    connection = open_db()
+    try:
+        run_ids = [row[0] for row in connection.execute("SELECT run_id FROM review_records")]
+    finally:
+        connection.close()
+    assert run_ids == ["run-write-behind"]
+
+
 @pytest.mark.asyncio
 async def test_result_to_outcome_generates_fallback_run_id(
     tmp_path: Path,
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import StubRunResult, project_context
+from pydantic_ai import DeferredToolRequests, DeferredToolResults
+from pydantic_ai.messages import ToolCallPart
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.persistence.storage import open_db
+from specmaker_core.review import BatchResult, Completed, Deferred, resume_many, review_many
+
+review_module = importlib.import_module("specmaker_core.review")
+
+
+def _manuscripts(count: int) -> list[_documents.Manuscript]:
+    return [
+        _documents.Manuscript(title=f"Doc {index}", content_markdown=f"# Doc {index}")
+        for index in range(count)
+    ]
+
+
+def _report() -> _documents.ReviewReport:
+    return _documents.ReviewReport(status="pass", summary="Looks good", confidence_percent=90.0)
+
+
+def _stored_run_ids() -> list[str]:
+    connection = open_db()
+    try:
+        rows = connection.execute("SELECT run_id FROM review_records ORDER BY run_id")
+        return [row[0] for row in rows]
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def save_calls(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count the records passed to each batched save while still writing them."""
+    calls: list[int] = []
+    original = review_module.save_review_records
+
+    def counting_save(connection: Any, records: Any, *, batch_size: int) -> int:
+        records = list(records)
+        calls.append(len(records))
+        return original(connection, records, batch_size=batch_size)
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "save_review_records", counting_save)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_review_many_bounds_concurrency_and_batches_persistence(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, save_calls: list[int]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    in_flight = 0
+    peak = 0
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later documents finish first so completion order differs from input order.
+        index = int(manuscript.title.split()[-1])
+        await asyncio.sleep(0.01 * (6 - index))
+        in_flight -= 1
+        if index == 3:
+            raise RuntimeError("model unavailable")
+        return StubRunResult(_report(), f"run-{index}")
+
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+
+    results = [
+        item
+        async for item in review_many(project_context(tmp_path), _manuscripts(6), max_concurrency=2)
+    ]
+
+    assert peak == 2
+    assert sorted(item.index for item in results) == list(range(6))
+    assert [item.index for item in results] != list(range(6))
+    failed = [item for item in results if item.error is not None]
+    assert [item.index for item in failed] == [3]
+    assert failed[0].outcome is None
+    assert all(isinstance(item.outcome, Completed) for item in results if item.error is None)
+    assert save_calls == [5]
+    assert _stored_run_ids() == ["run-0", "run-1", "run-2", "run-4", "run-5"]
+
+
+@pytest.mark.asyncio
+async def test_review_many_persists_completed_reviews_when_closed_early(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, save_calls: list[int]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    started: list[int] = []
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        index = int(manuscript.title.split()[-1])
+        started.append(index)
+        await asyncio.sleep(0 if index == 0 else 10)
+        return StubRunResult(_report(), f"run-{index}")
+
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+
+    batch = review_many(project_context(tmp_path), _manuscripts(4), max_concurrency=4)
+    first = await anext(batch)
+    await batch.aclose()
+
+    assert first.index == 0
+    assert sorted(started) == [0, 1, 2, 3]
+    assert save_calls == [1]
+    assert _stored_run_ids() == ["run-0"]
+
+
+@pytest.mark.asyncio
+async def test_resume_many_resumes_each_token(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, save_calls: list[int]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    requests = DeferredToolRequests(
+        approvals=[ToolCallPart(tool_name="request_approvals", args={}, tool_call_id="call-1")]
+    )
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        return StubRunResult(requests, f"run-{manuscript.title.split()[-1]}")
+
+    async def fake_resume_review(
+        message_history: list[Any], results: DeferredToolResults
+    ) -> StubRunResult:
+        await asyncio.sleep(0)
+        approved = results.approvals["call-1"] is True
+        return StubRunResult(_report() if approved else requests, "run-resumed")
+
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(review_module, "_resume_review", fake_resume_review)
+
+    deferred: list[BatchResult[_documents.ReviewReport]] = [
+        item async for item in review_many(project_context(tmp_path), _manuscripts(2))
+    ]
+    assert save_calls == []
+    tokens = {
+        item.index: item.outcome.token for item in deferred if isinstance(item.outcome, Deferred)
+    }
+
+    decisions = [DeferredToolResults(approvals={"call-1": index == 0}) for index in range(2)]
+    resumed = {
+        item.index: item.outcome
+        async for item in resume_many(zip((tokens[0], tokens[1]), decisions, strict=True))
+    }
+
+    assert isinstance(resumed[0], Completed)
+    assert isinstance(resumed[1], Deferred)
+    assert resumed[1].token.approvals_requested == 2
+    assert save_calls == [1]
+    assert _stored_run_ids() == ["run-resumed"]
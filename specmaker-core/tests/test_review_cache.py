@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import importlib
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import BASE_TIME, StubRunResult, project_context
+from pydantic_ai import DeferredToolRequests
+from pydantic_ai.messages import ToolCallPart
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import Settings
+from specmaker_core.persistence import review_cache as _review_cache
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.review import Completed, Deferred, review
+from specmaker_core.toolsets import persistence_tools as _persistence_tools
+
+review_module = importlib.import_module("specmaker_core.review")
+
+POLICY = _review_cache.CachePolicy(max_entries=2, max_age=datetime.timedelta(hours=1))
+
+
+def _manuscript(content: str = "# Heading") -> _documents.Manuscript:
+    return _documents.Manuscript(title="Doc", content_markdown=content)
+
+
+def _report(summary: str = "Looks good") -> _documents.ReviewReport:
+    return _documents.ReviewReport(status="pass", summary=summary, confidence_percent=90.0)
+
+
+def _key(manuscript: _documents.Manuscript, **overrides: Any) -> str:
+    parts: dict[str, Any] = {"instructions": "Review", "model": "test:model", "settings": {}}
+    parts.update(overrides)
+    return _review_cache.cache_key(manuscript, **parts)
+
+
+def test_cache_key_covers_inputs_that_change_the_review() -> None:
+    base = _key(_manuscript())
+
+    # Fields the reviewer never sees do not affect the key.
+    assert _key(_manuscript().model_copy(update={"created_at": BASE_TIME})) == base
+    assert _key(_manuscript("# Changed")) != base
+    assert _key(_manuscript(), instructions="Review strictly") != base
+    assert _key(_manuscript(), model="test:other") != base
+    assert _key(_manuscript(), settings={"reasoning_effort_fallback": "high"}) != base
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    session = _storage.create_session(tmp_path / "cache.db")
+    try:
+        for index, key in enumerate(("a", "b")):
+            moment = BASE_TIME + datetime.timedelta(minutes=index)
+            _review_cache.store(session, key, _report(key), policy=POLICY, now=moment)
+        later = BASE_TIME + datetime.timedelta(minutes=5)
+        hit = _review_cache.lookup(session, "a", policy=POLICY, now=later)
+        assert hit is not None
+        assert hit.summary == "a"
+
+        # "b" is now least recently used and makes room for "c".
+        _review_cache.store(session, "c", _report("c"), policy=POLICY, now=later)
+        assert _review_cache.lookup(session, "b", policy=POLICY, now=later) is None
+        assert _review_cache.lookup(session, "c", policy=POLICY, now=later) is not None
+
+        expired = BASE_TIME + datetime.timedelta(hours=2)
+        assert _review_cache.lookup(session, "a", policy=POLICY, now=expired) is None
+        assert _review_cache.evict(session, policy=POLICY, now=expired) == 2
+        session.commit()
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def start_calls(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[str]:
+    """Enable the cache and record each model run; "defer" manuscripts pause for approval."""
+    monkeypatch.chdir(tmp_path)
+    calls: list[str] = []
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        calls.append(manuscript.content_markdown)
+        if manuscript.content_markdown == "defer":
+            approval = ToolCallPart(tool_name="request_approvals", args={}, tool_call_id="c-1")
+            return StubRunResult(DeferredToolRequests(approvals=[approval]), f"run-{len(calls)}")
+        return StubRunResult(_report(f"run {len(calls)}"), f"run-{len(calls)}")
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(review_module, "get_settings", lambda: Settings(review_cache_enabled=True))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_review_serves_unchanged_manuscripts_from_cache(
+    tmp_path: Path, start_calls: list[str]
+) -> None:
+    context = project_context(tmp_path)
+
+    first = await review(context, _manuscript())
+    second = await review(context, _manuscript())
+
+    assert isinstance(first, Completed)
+    assert isinstance(second, Completed)
+    assert not first.cache_hit
+    assert second.cache_hit
+    assert second.value == first.value
+    assert second.run_id != first.run_id
+    assert start_calls == ["# Heading"]
+
+    session = _storage.create_session()
+    try:
+        stored = _persistence_tools.load_review_records(session)
+        stats = _persistence_tools.get_project_stats(session, "spec")
+    finally:
+        session.close()
+    # Only the review that ran is recorded; the cache hit leaves history and stats alone.
+    assert [record.run_id for record in stored] == [first.run_id]
+    assert stats is not None
+    assert stats.review_count == 1
+    assert stats.pass_count == 1
+
+
+@pytest.mark.asyncio
+async def test_changing_the_chunk_size_misses_the_cache(
+    tmp_path: Path, start_calls: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = project_context(tmp_path)
+
+    await review(context, _manuscript())
+    monkeypatch.setattr(
+        review_module,
+        "get_settings",
+        lambda: Settings(review_cache_enabled=True, review_chunk_max_tokens=8000),
+    )
+    chunked = await review(context, _manuscript())
+
+    assert isinstance(chunked, Completed)
+    assert not chunked.cache_hit
+    assert start_calls == ["# Heading", "# Heading"]
+
+
+@pytest.mark.asyncio
+async def test_review_bypasses_cache_and_skips_deferred_runs(
+    tmp_path: Path, start_calls: list[str]
+) -> None:
+    context = project_context(tmp_path)
+
+    await review(context, _manuscript())
+    bypassed = await review(context, _manuscript(), use_cache=False)
+    refreshed = await review(context, _manuscript())
+    deferred = [await review(context, _manuscript("defer")) for _ in range(2)]
+
+    assert isinstance(bypassed, Completed)
+    assert not bypassed.cache_hit
+    assert isinstance(refreshed, Completed)
+    assert refreshed.cache_hit
+    assert refreshed.value.summary == "run 2"
+    assert all(isinstance(outcome, Deferred) for outcome in deferred)
+    assert start_calls == ["# Heading", "# Heading", "defer", "defer"]
+
+
+def test_cache_misses_do_not_wait_for_the_write_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    settings = Settings(review_cache_enabled=True)
+    key = _key(_manuscript())
+    review_module._store_cached_report(key, _report("cached"), settings)
+
+    writer = sqlite3.connect(_storage.DEFAULT_DB_PATH, timeout=0)
+    try:
+        writer.execute("BEGIN IMMEDIATE")
+        missed = review_module._lookup_cached_report(_key(_manuscript("# Other")), settings)
+    finally:
+        writer.rollback()
+        writer.close()
+    hit = review_module._lookup_cached_report(key, settings)
+
+    assert missed is None
+    assert hit is not None
+    assert hit.summary == "cached"
+    connection = _storage.open_db()
+    try:
+        (hits,) = connection.execute("SELECT hit_count FROM review_cache").fetchone()
+    finally:
+        connection.close()
+    assert hits == 1
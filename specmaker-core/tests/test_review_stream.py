@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+from conftest import StubRunResult, project_context
+from pydantic_ai.messages import (
+    PartDeltaEvent,
+    PartEndEvent,
+    PartStartEvent,
+    ToolCallPart,
+    ToolCallPartDelta,
+)
+
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core._dependencies.schemas import events as _events
+from specmaker_core.durable import streaming as _streaming
+from specmaker_core.review import Completed, review_stream
+
+review_module = importlib.import_module("specmaker_core.review")
+
+REPORT = {
+    "status": "changes_required",
+    "summary": "Two findings",
+    "issues": [
+        {"category": "clarity", "severity": "major", "message": "Define the scope"},
+        {"category": "grammar", "severity": "minor", "message": "Fix the typo"},
+    ],
+    "confidence_percent": 80.0,
+}
+OUTPUT_TOOL = "final_result_ReviewReport"
+
+
+def _deltas(payload: str, size: int = 7) -> list[PartDeltaEvent]:
+    return [
+        PartDeltaEvent(index=0, delta=ToolCallPartDelta(args_delta=payload[start : start + size]))
+        for start in range(0, len(payload), size)
+    ]
+
+
+async def _collect(subscription: _streaming.Subscription) -> list[_events.ReviewEvent]:
+    return [event async for event in subscription]
+
+
+@pytest.mark.asyncio
+async def test_issues_are_published_once_each_issue_has_streamed() -> None:
+    fanout = _streaming.EventFanout()
+    subscription = fanout.subscribe()
+    payload = json.dumps(REPORT)
+    second_issue_start = payload.index('{"category": "grammar"')
+
+    with _streaming.publishing_to(fanout):
+        _streaming.publish_agent_event(
+            PartStartEvent(index=0, part=ToolCallPart(tool_name=OUTPUT_TOOL, args=""))
+        )
+        for delta in _deltas(payload[:second_issue_start]):
+            _streaming.publish_agent_event(delta)
+        _streaming.publish_agent_event(
+            PartDeltaEvent(index=0, delta=ToolCallPartDelta(args_delta="{"))
+        )
+        fanout.publish(_events.ReviewProgress(stage="tool_call", detail="checkpoint"))
+        for delta in _deltas(payload[second_issue_start + 1 :]):
+            _streaming.publish_agent_event(delta)
+        _streaming.publish_agent_event(
+            PartEndEvent(index=0, part=ToolCallPart(tool_name=OUTPUT_TOOL, args=payload))
+        )
+    # Events raised outside the block are not published.
+    _streaming.publish_agent_event(
+        PartStartEvent(index=1, part=ToolCallPart(tool_name=OUTPUT_TOOL, args=payload))
+    )
+    fanout.close()
+
+    events = await _collect(subscription)
+    assert [event.kind for event in events] == ["progress", "issue", "progress", "issue"]
+    found = [event for event in events if isinstance(event, _events.IssueFound)]
+    assert [(event.index, event.issue.message) for event in found] == [
+        (0, "Define the scope"),
+        (1, "Fix the typo"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events_without_blocking_others() -> None:
+    fanout = _streaming.EventFanout()
+    slow = fanout.subscribe(maxsize=2)
+    fast = fanout.subscribe(maxsize=10)
+
+    for index in range(5):
+        fanout.publish(_events.ReviewProgress(stage="tool_call", detail=str(index)))
+    fanout.close()
+
+    slow_events = await _collect(slow)
+    assert slow_events[0] == _events.EventsDropped(count=3)
+    assert [getattr(event, "detail", None) for event in slow_events[1:]] == ["3", "4"]
+    assert len(await _collect(fast)) == 5
+    with pytest.raises(ValueError, match="maxsize"):
+        fanout.subscribe(maxsize=0)
+
+
+@pytest.mark.asyncio
+async def test_review_stream_yields_first_issue_before_the_run_finishes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    first_issue_seen = asyncio.Event()
+    payload = json.dumps(REPORT)
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        _streaming.publish_agent_event(
+            PartStartEvent(index=0, part=ToolCallPart(tool_name=OUTPUT_TOOL, args=""))
+        )
+        for delta in _deltas(payload):
+            _streaming.publish_agent_event(delta)
+            await asyncio.sleep(0)
+        # The run only finishes once the consumer has seen a finding.
+        await asyncio.wait_for(first_issue_seen.wait(), timeout=1)
+        _streaming.publish_agent_event(
+            PartEndEvent(index=0, part=ToolCallPart(tool_name=OUTPUT_TOOL, args=payload))
+        )
+        return StubRunResult(_documents.ReviewReport.model_validate(REPORT), "run-stream")
+
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+
+    items: list[object] = []
+    manuscript = _documents.Manuscript(title="Streamed", content_markdown="# Body")
+    async for item in review_stream(project_context(tmp_path), manuscript):
+        items.append(item)
+        if isinstance(item, _events.IssueFound):
+            first_issue_seen.set()
+
+    assert items[0] == _events.ReviewStarted(title="Streamed")
+    assert sum(isinstance(item, _events.IssueFound) for item in items) == 2
+    outcome = items[-1]
+    assert isinstance(outcome, Completed)
+    assert outcome.run_id == "run-stream"
+    assert len(outcome.value.issues) == 2
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+
+import pytest
+from conftest import StubRunResult, project_context
+from pydantic_ai import DeferredToolRequests, DeferredToolResults
+from pydantic_ai.messages import ToolCallPart
+
+from specmaker_core._dependencies import errors as _errors
+from specmaker_core._dependencies.schemas import documents as _documents
+from specmaker_core.config.settings import Settings
+from specmaker_core.durable import dbos_boot as _dbos_boot
+from specmaker_core.durable import review_flow as _review_flow
+from specmaker_core.review import Completed, Deferred, TimedOut, load_deferred, resume, review
+
+review_module = importlib.import_module("specmaker_core.review")
+
+
+class _StuckReviewer:
+    """Durable agent stand-in whose model call never returns."""
+
+    kwargs: ClassVar[dict[str, Any]] = {}
+    cancelled: ClassVar[list[bool]] = []
+
+    async def run(self, prompt: str, **kwargs: Any) -> Any:
+        type(self).kwargs = kwargs
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            type(self).cancelled.append(True)
+            raise
+
+
+@pytest.mark.asyncio
+async def test_start_review_cancels_the_model_call_at_the_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _StuckReviewer.cancelled.clear()
+    monkeypatch.setattr(_dbos_boot, "get_dbos_reviewer", _StuckReviewer)
+    monkeypatch.setattr(
+        _review_flow, "get_settings", lambda: Settings(model_timeout=30, step_timeout=0.05)
+    )
+    manuscript = _documents.Manuscript(title="Stuck", content_markdown="# Body")
+
+    with pytest.raises(_errors.ReviewTimeoutError) as raised:
+        await _review_flow.start_review(manuscript)
+
+    assert raised.value.timeout_seconds == 0.05
+    assert raised.value.run_id
+    assert _StuckReviewer.cancelled == [True]
+    assert 0 < _StuckReviewer.kwargs["model_settings"]["timeout"] <= 0.05
+
+
+class _SlowReviewer:
+    """Durable agent stand-in whose model call takes a fixed time."""
+
+    timeouts: ClassVar[list[float]] = []
+
+    async def run(self, prompt: str, **kwargs: Any) -> Any:
+        type(self).timeouts.append(kwargs["model_settings"]["timeout"])
+        await asyncio.sleep(0.06)
+        return prompt
+
+
+@pytest.mark.asyncio
+async def test_runs_of_one_review_share_its_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    _SlowReviewer.timeouts.clear()
+    monkeypatch.setattr(_dbos_boot, "get_dbos_reviewer", _SlowReviewer)
+    manuscript = _documents.Manuscript(title="Slow", content_markdown="# Body")
+
+    with _review_flow.review_deadline("run-review", 0.1):
+        await _review_flow.start_review(manuscript)
+        # Each run alone fits the budget, but the second only gets what is left.
+        with pytest.raises(_errors.ReviewTimeoutError) as raised:
+            await _review_flow.start_review(manuscript)
+
+    assert (raised.value.run_id, raised.value.timeout_seconds) == ("run-review", 0.1)
+    assert _SlowReviewer.timeouts[1] < 0.05
+
+
+def test_model_step_retries_follow_settings() -> None:
+    enabled = _dbos_boot.model_step_config(Settings(durable_retries_enabled=True))
+    disabled = _dbos_boot.model_step_config(Settings())
+
+    assert enabled.get("retries_allowed") is True
+    assert disabled.get("retries_allowed") is False
+    assert enabled.get("max_attempts") == _dbos_boot.MODEL_STEP_MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_timed_out_chunk_cancels_the_other_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancelled: list[str] = []
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        if "part 1" in manuscript.title:
+            await asyncio.sleep(0.01)
+            raise _errors.ReviewTimeoutError("run-chunk-1", 0.01)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(manuscript.title)
+            raise
+        return StubRunResult(None, "unreachable")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    monkeypatch.setattr(
+        review_module,
+        "get_settings",
+        lambda: Settings(review_chunk_max_tokens=10, review_chunk_concurrency=2),
+    )
+    content = "\n\n".join(f"# Part {name}\n\n{name * 30}" for name in "AB")
+    manuscript = _documents.Manuscript(title="Large", content_markdown=content)
+
+    outcome = await review(project_context(tmp_path), manuscript)
+
+    assert isinstance(outcome, TimedOut)
+    assert outcome.timeout_seconds == 0.01
+    assert cancelled == ["Large (part 2 of 2)"]
+
+
+@pytest.mark.asyncio
+async def test_timed_out_resume_keeps_the_run_resumable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    approval = ToolCallPart(tool_name="request_approvals", args={}, tool_call_id="c-1")
+
+    async def deferring_start_review(manuscript: _documents.Manuscript) -> StubRunResult:
+        await asyncio.sleep(0)
+        return StubRunResult(DeferredToolRequests(approvals=[approval]), "run-deferred")
+
+    async def stuck_resume_review(
+        message_history: list[Any], results: DeferredToolResults
+    ) -> StubRunResult:
+        await asyncio.sleep(0)
+        raise _errors.ReviewTimeoutError("run-resume", 5.0)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", deferring_start_review)
+    monkeypatch.setattr(review_module, "_resume_review", stuck_resume_review)
+    manuscript = _documents.Manuscript(title="Spec", content_markdown="# Body")
+    deferred = await review(project_context(tmp_path), manuscript)
+    assert isinstance(deferred, Deferred)
+
+    outcome = await resume(deferred.token, DeferredToolResults(approvals={"c-1": True}))
+
+    # The timeout reports the deferred run's id, so it can be retried by id.
+    assert outcome == TimedOut(run_id="run-deferred", timeout_seconds=5.0, token=deferred.token)
+    assert await load_deferred("run-deferred") == deferred
+
+
+@dataclass
+class AnonymousRunResult:
+    """Run result that, like pydantic-ai's, carries no workflow id."""
+
+    output: Any
+
+    def all_messages(self) -> list[Any]:
+        return []
+
+
+@pytest.mark.asyncio
+async def test_outcomes_report_the_run_id_of_their_deadline(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: list[str | None] = []
+
+    async def fake_start_review(manuscript: _documents.Manuscript) -> AnonymousRunResult:
+        await asyncio.sleep(0)
+        seen.append(_review_flow.current_run_id())
+        return AnonymousRunResult(_documents.ReviewReport(status="pass", summary="Fine"))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(review_module, "launch_dbos", lambda: None)
+    monkeypatch.setattr(review_module, "_start_review", fake_start_review)
+    manuscript = _documents.Manuscript(title="Spec", content_markdown="# Body")
+
+    outcome = await review(project_context(tmp_path), manuscript)
+
+    assert isinstance(outcome, Completed)
+    assert seen == [outcome.run_id]
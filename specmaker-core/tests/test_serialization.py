@@ -60,3 +60,31 @@ def test_to_json_handles_supported_types() -> None:
 def test_to_json_raises_type_error_for_unknown_type() -> None:
     with pytest.raises(TypeError, match="Cannot serialize value of type <class 'complex'>"):
         serialization.to_json({"value": complex(1, 2)})
+
+
+def test_content_hash_is_independent_of_key_order() -> None:
+    first = {"b": [1, 2], "a": {"y": 1, "x": "é"}}
+    second = {"a": {"x": "é", "y": 1}, "b": [1, 2]}
+
+    assert serialization.canonical_json(first) == '{"a":{"x":"é","y":1},"b":[1,2]}'
+    assert serialization.content_hash(first) == serialization.content_hash(second)
+    assert len(serialization.content_hash(first)) == 64
+
+
+def test_content_hash_distinguishes_models() -> None:
+    timestamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    first = ExampleModel(value=1, label="a", timestamp=timestamp)
+    second = ExampleModel(value=2, label="a", timestamp=timestamp)
+
+    assert serialization.content_hash(first) == serialization.content_hash(first.model_copy())
+    assert serialization.content_hash(first) != serialization.content_hash(second)
+
+
+def test_epoch_microseconds_is_exact_and_offset_aware() -> None:
+    utc = datetime.datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.UTC)
+    offset = utc.astimezone(datetime.timezone(datetime.timedelta(hours=-5)))
+
+    assert serialization.epoch_microseconds(utc) == 1_704_110_400_123_456
+    assert serialization.epoch_microseconds(offset) == 1_704_110_400_123_456
+    assert serialization.epoch_microseconds(utc.replace(tzinfo=None)) == 1_704_110_400_123_456
+    assert serialization.from_epoch_microseconds(1_704_110_400_123_456) == utc
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from specmaker_core.persistence import storage as _storage
+
+
+def test_get_engine_is_cached_per_resolved_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    relative = Path("nested/../reviews.db")
+
+    first = _storage.get_engine(relative)
+    second = _storage.get_engine(tmp_path / "reviews.db")
+    other = _storage.get_engine(tmp_path / "other.db")
+
+    assert first is second
+    assert other is not first
+    assert event.contains(first, "connect", _storage._set_sqlite_pragma)
+
+
+def test_create_session_reuses_session_factory(tmp_path: Path) -> None:
+    db_path = tmp_path / "reviews.db"
+
+    factory = _storage.get_session_factory(db_path)
+    assert _storage.get_session_factory(db_path) is factory
+
+    session = _storage.create_session(db_path)
+    try:
+        assert session.get_bind() is _storage.get_engine(db_path)
+    finally:
+        session.close()
+
+
+def test_dispose_all_clears_registry(tmp_path: Path) -> None:
+    db_path = tmp_path / "reviews.db"
+    engine = _storage.get_engine(db_path)
+
+    _storage.dispose_all()
+
+    rebuilt = _storage.get_engine(db_path)
+    assert rebuilt is not engine
+    with rebuilt.connect() as connection:
+        tables = connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='review_records'"
+        ).fetchall()
+    assert tables == [("review_records",)]
+
+
+def test_open_db_creates_databases_with_incremental_auto_vacuum(tmp_path: Path) -> None:
+    connection = _storage.open_db(tmp_path / "legacy.db")
+    try:
+        connection.execute("CREATE TABLE notes (body TEXT)")
+        connection.commit()
+        auto_vacuum = connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        connection.close()
+
+    assert auto_vacuum == 2
+    assert journal_mode == "wal"
+
+
+def test_read_sessions_are_query_only_and_see_committed_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "reviews.db"
+    writer = _storage.create_session(db_path)
+    reader = _storage.create_read_session(db_path)
+    try:
+        writer.execute(text("CREATE TABLE notes (body TEXT)"))
+        writer.execute(text("INSERT INTO notes VALUES ('hello')"))
+        writer.commit()
+
+        assert reader.execute(text("SELECT body FROM notes")).scalars().all() == ["hello"]
+        assert reader.execute(text("PRAGMA query_only")).scalar_one() == 1
+        with pytest.raises(OperationalError, match="readonly"):
+            reader.execute(text("INSERT INTO notes VALUES ('nope')"))
+    finally:
+        reader.close()
+        writer.close()
+
+    assert _storage.get_engine(db_path).pool.size() == 1
+    assert _storage.get_read_engine(db_path).pool.size() == _storage.READ_POOL_SIZE
+
+
+def test_readers_proceed_while_another_process_holds_the_write_lock(tmp_path: Path) -> None:
+    db_path = tmp_path / "reviews.db"
+    _storage.get_engine(db_path)
+    other_process = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    other_process.execute("BEGIN IMMEDIATE")
+    release = threading.Timer(0.2, other_process.execute, args=("COMMIT",))
+    release.start()
+    try:
+        reader = _storage.create_read_session(db_path)
+        try:
+            count = reader.execute(text("SELECT COUNT(*) FROM review_records")).scalar_one()
+        finally:
+            reader.close()
+        # The writer waits on busy_timeout until the other transaction commits.
+        writer = _storage.create_session(db_path)
+        try:
+            writer.execute(text("DELETE FROM review_blobs"))
+            writer.commit()
+        finally:
+            writer.close()
+    finally:
+        release.join()
+        other_process.close()
+    assert count == 0
+
+
+def test_retry_on_busy_retries_only_lock_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_storage.time, "sleep", lambda _seconds: None)
+    locked = OperationalError("BEGIN", {}, sqlite3.OperationalError("database is locked"))
+    calls: list[int] = []
+
+    def flaky() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise locked
+        return "done"
+
+    assert _storage.retry_on_busy(flaky) == "done"
+    assert len(calls) == 3
+
+    def always_locked() -> None:
+        raise locked
+
+    with pytest.raises(OperationalError, match="locked"):
+        _storage.retry_on_busy(always_locked, attempts=2)
+
+    broken = OperationalError("SELECT", {}, sqlite3.OperationalError("no such table: x"))
+    attempts: list[int] = []
+
+    def missing_table() -> None:
+        attempts.append(1)
+        raise broken
+
+    with pytest.raises(OperationalError, match="no such table"):
+        _storage.retry_on_busy(missing_table)
+    assert len(attempts) == 1
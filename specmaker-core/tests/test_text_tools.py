@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from specmaker_core._dependencies.toolsets import text_tools
+
+DOCUMENT = """Intro paragraph.
+
+# Design
+
+Overview text.
+
+## Storage
+
+```python
+# not a heading
+```
+
+## Notes
+
+First notes.
+
+# Rollout
+
+## Notes
+
+Second notes.
+"""
+
+
+def test_split_sections_uses_heading_paths_and_skips_code_fences() -> None:
+    sections = text_tools.split_sections(DOCUMENT)
+
+    assert [section.anchor for section in sections] == [
+        "preamble",
+        "design",
+        "design/storage",
+        "design/notes",
+        "rollout",
+        "rollout/notes",
+    ]
+    assert sections[2].text.endswith("```")
+    assert [section.level for section in sections] == [0, 1, 2, 2, 1, 2]
+    assert text_tools.split_sections("# A\n\n# A\n")[1].anchor == "a-2"
+
+
+def test_diff_sections_matches_by_anchor_and_ignores_trailing_whitespace() -> None:
+    previous = text_tools.split_sections(DOCUMENT)
+    edited = DOCUMENT.replace("First notes.", "First notes, revised.").replace(
+        "Overview text.", "Overview text.   "
+    )
+    current = text_tools.split_sections(
+        edited.replace("# Rollout\n\n## Notes\n\nSecond notes.\n", "")
+    )
+
+    diff = text_tools.diff_sections(previous, current)
+
+    assert [section.anchor for section in diff.changed] == ["design/notes"]
+    assert [section.anchor for section in diff.removed] == ["rollout", "rollout/notes"]
+    assert len(diff.unchanged) == 3
+
+
+def test_locate_section_prefers_anchor_then_longest_heading() -> None:
+    sections = text_tools.split_sections(DOCUMENT)
+
+    assert text_tools.locate_section("[rollout/notes] paragraph 1", sections) == sections[5]
+    assert text_tools.locate_section("Design > Storage", sections) == sections[2]
+    assert text_tools.locate_section("line 3", sections) is None
+    assert text_tools.locate_section(None, sections) is None
+
+
+def test_render_changed_sections_includes_outline_and_changed_text_only() -> None:
+    sections = text_tools.split_sections(DOCUMENT)
+
+    rendered = text_tools.render_changed_sections(sections, [sections[3]])
+
+    assert "  - [design/storage] Storage" in rendered
+    assert "[design/notes]\n## Notes\n\nFirst notes." in rendered
+    assert "Overview text." not in rendered
+
+
+def test_chunk_markdown_keeps_sections_whole_and_respects_the_budget() -> None:
+    long_section = "# Long\n\n" + "\n\n".join(f"Paragraph {index} " * 5 for index in range(6))
+    markdown = f"# Short\n\nBrief.\n\n# Also short\n\nBrief too.\n\n{long_section}"
+
+    chunks = text_tools.chunk_markdown(markdown, max_tokens=30)
+
+    assert chunks[0].startswith("# Short\n\nBrief.\n\n# Also short\n\nBrief too.\n\n# Long")
+    assert len(chunks) > 1
+    assert all(text_tools.estimate_tokens(chunk) <= 30 for chunk in chunks)
+    assert "".join(chunks).count("Paragraph") == 30
+    assert text_tools.chunk_markdown("x" * 50, max_tokens=5) == ["x" * 20, "x" * 20, "x" * 10]
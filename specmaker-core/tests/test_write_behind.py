@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import BASE_TIME, project_context, review_record
+
+from specmaker_core.persistence import metadata as _metadata
+from specmaker_core.persistence import storage as _storage
+from specmaker_core.persistence import write_behind as _write_behind
+from specmaker_core.toolsets import persistence_tools as _persistence_tools
+
+
+def _record(tmp_path: Path, index: int) -> _metadata.ReviewMetadata:
+    return review_record(
+        project_context(tmp_path),
+        run_id=f"run-{index}",
+        created_at=BASE_TIME + datetime.timedelta(seconds=index),
+    )
+
+
+@pytest.fixture()
+def batch_sizes(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    sizes: list[int] = []
+    original = _write_behind.save_review_records
+
+    def recording_save(
+        connection: Any, records: Iterable[_metadata.ReviewMetadata], **kwargs: Any
+    ) -> int:
+        records = list(records)
+        sizes.append(len(records))
+        return original(connection, records, **kwargs)
+
+    monkeypatch.setattr(_write_behind, "save_review_records", recording_save)
+    return sizes
+
+
+def test_writer_coalesces_records_into_one_transaction(
+    tmp_path: Path, batch_sizes: list[int]
+) -> None:
+    db_path = tmp_path / "reviews.db"
+    writer = _write_behind.WriteBehindWriter(db_path=db_path, batch_size=10, flush_interval=60)
+    futures = [writer.submit(_record(tmp_path, index)) for index in range(5)]
+
+    writer.flush(timeout=5)
+
+    assert all(future.done() and future.exception() is None for future in futures)
+    assert batch_sizes == [5]
+    session = _storage.create_session(db_path)
+    try:
+        assert len(_persistence_tools.load_review_records(session)) == 5
+    finally:
+        session.close()
+    writer.close(timeout=5)
+
+
+def test_writer_caps_batches_at_batch_size(tmp_path: Path, batch_sizes: list[int]) -> None:
+    writer = _write_behind.WriteBehindWriter(
+        db_path=tmp_path / "reviews.db", batch_size=2, flush_interval=60
+    )
+    for index in range(5):
+        writer.submit(_record(tmp_path, index))
+
+    writer.close(timeout=5)
+
+    assert batch_sizes == [2, 2, 1]
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.submit(_record(tmp_path, 9))
+    # Without the check this barrier would queue behind the stopped thread forever.
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.flush(timeout=1)
+
+
+def test_writer_reports_failures_through_futures(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def failing_save(connection: Any, records: Any, **kwargs: Any) -> int:
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(_write_behind, "save_review_records", failing_save)
+    writer = _write_behind.WriteBehindWriter(db_path=tmp_path / "reviews.db", flush_interval=0)
+
+    future = writer.submit(_record(tmp_path, 0))
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        future.result(timeout=5)
+    with pytest.raises(RuntimeError, match="disk full"):
+        writer.flush(timeout=5)
+    # The failure was reported to the flush; later flushes start clean.
+    writer.flush(timeout=5)
+    writer.submit(_record(tmp_path, 1))
+    with pytest.raises(RuntimeError, match="disk full"):
+        writer.close(timeout=5)